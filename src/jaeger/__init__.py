@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import importlib
 import logging
 import os
 from typing import TYPE_CHECKING
@@ -14,7 +15,38 @@ from sdsstools.configuration import __ENVVARS__
 from .exceptions import JaegerUserWarning
 
 if TYPE_CHECKING:
-    from .actor import JaegerActor
+    from .actor import JaegerActor, JaegerCommandType, jaeger_parser
+    from .actor.commands import (
+        calibrations_parser,
+        configuration,
+        current,
+        debug,
+        disable,
+        enable,
+        explode_command,
+        fvc_parser,
+        goto,
+        hall,
+        home,
+        initialise,
+        pollers,
+        power,
+        set_collision_margin,
+        snapshot,
+        speed,
+        status,
+        stop,
+        talk,
+        trajectory,
+        unlock,
+        unwind_command,
+        version,
+    )
+    from .can import INTERFACES, CANnetInterface, JaegerCAN
+    from .fps import FPS, BaseFPS
+    from .fvc import FVC
+    from .ieb import FVC_IEB, IEB, _get_category_data
+    from .positioner import Positioner
 
 
 NAME = "jaeger"
@@ -63,11 +95,77 @@ def start_file_loggers(start_log=True, start_can=True):
 actor_instance: JaegerActor | None = None
 
 
-from .can import *
 from .exceptions import *
-from .fps import *
-from .fvc import *
-from .ieb import *
 from .maskbits import *
-from .positioner import *
-from .actor import *
+
+
+# The submodules below import the CAN, astropy, coordio, and CLU stacks, so they
+# are only imported when one of their objects is first accessed. This keeps
+# "import jaeger" (and the CLI) fast while "from jaeger import FPS" still works.
+_LAZY_OBJECTS = {
+    "JaegerCAN": "can",
+    "CANnetInterface": "can",
+    "INTERFACES": "can",
+    "BaseFPS": "fps",
+    "FPS": "fps",
+    "FVC": "fvc",
+    "IEB": "ieb",
+    "FVC_IEB": "ieb",
+    "_get_category_data": "ieb",
+    "Positioner": "positioner",
+    "JaegerActor": "actor",
+    "JaegerCommandType": "actor",
+    "jaeger_parser": "actor",
+}
+
+# The actor commands. The alerts, can, chiller, ieb, and testing commands are not
+# included because their names resolve to the jaeger submodules.
+_ACTOR_COMMANDS = [
+    "calibrations_parser",
+    "configuration",
+    "current",
+    "debug",
+    "disable",
+    "enable",
+    "explode_command",
+    "fvc_parser",
+    "goto",
+    "hall",
+    "home",
+    "initialise",
+    "pollers",
+    "power",
+    "set_collision_margin",
+    "snapshot",
+    "speed",
+    "status",
+    "stop",
+    "talk",
+    "trajectory",
+    "unlock",
+    "unwind_command",
+    "version",
+]
+_LAZY_OBJECTS.update({command: "actor" for command in _ACTOR_COMMANDS})
+
+
+def __getattr__(name: str):
+    if name in _LAZY_OBJECTS:
+        module = importlib.import_module(f".{_LAZY_OBJECTS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+
+    # Submodules that have not been imported yet, e.g., jaeger.target.
+    if not name.startswith("_"):
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as err:
+            if err.name != f"{__name__}.{name}":
+                raise
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_OBJECTS))
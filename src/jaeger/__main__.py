@@ -26,18 +26,16 @@ from click_default_group import DefaultGroup
 from sdsstools.daemonizer import DaemonGroup
 
 from jaeger import can_log, config, log
-from jaeger.commands.bootloader import load_firmware
-from jaeger.commands.calibration import calibrate_positioners
-from jaeger.commands.goto import goto as goto_
 from jaeger.exceptions import (
     FPSLockedError,
     JaegerError,
     JaegerUserWarning,
     TrajectoryError,
 )
-from jaeger.fps import FPS, LOCK_FILE
-from jaeger.positioner import Positioner
-from jaeger.testing import VirtualFPS
+
+
+# The FPS, commands, and testing modules are imported in the commands that use
+# them so that "jaeger --help" and simple commands do not pay for loading them.
 
 
 __FPS__ = None
@@ -96,6 +94,9 @@ class FPSWrapper(object):
     async def __aenter__(self):
         global __FPS__
 
+        from jaeger.fps import FPS
+        from jaeger.testing import VirtualFPS
+
         # If profile is test we start a VirtualFPS first so that it can respond
         # to the FPS class.
         if self.profile == "virtual":
@@ -386,6 +387,8 @@ async def upgrade_firmware(
 ):
     """Upgrades the firmaware."""
 
+    from jaeger.commands.bootloader import load_firmware
+
     if positioners is not None:
         positioners = [int(positioner.strip()) for positioner in positioners.split(",")]
 
@@ -467,6 +470,8 @@ async def upgrade_firmware(
 async def calibrate(fps_maker, positioner_id, motors, datums, cogging):
     """Runs a full calibration on a positioner."""
 
+    from jaeger.commands.calibration import calibrate_positioners
+
     fps_maker.initialise = False
     fps_maker.danger = True
 
@@ -539,6 +544,8 @@ async def goto(
 ):
     """Sends positioners to a given (alpha, beta) position."""
 
+    from jaeger.commands.goto import goto as goto_
+
     with fps_maker as fps:
         if all:
             if not force:
@@ -628,6 +635,8 @@ async def home(fps_maker: FPSWrapper, positioner_id: int, axis: str | None = Non
 async def status(fps_maker: FPSWrapper, positioner_id: int):
     """Returns the status of a positioner with low-level initialisation."""
 
+    from jaeger.positioner import Positioner
+
     fps_maker.initialise = False
 
     async with fps_maker as fps:
@@ -756,6 +765,8 @@ async def snapshot(
 async def unlock(fps_maker: FPSWrapper):
     """Unlocks the FPS."""
 
+    from jaeger.fps import LOCK_FILE
+
     warnings.filterwarnings(
         "ignore",
         message=".+FPS was collided and has been locked.+",
@@ -24,6 +24,7 @@ from jaeger import FPS, __version__, log
 from jaeger.alerts import AlertsBot
 from jaeger.chiller import ChillerBot
 from jaeger.exceptions import JaegerError, JaegerUserWarning
+from jaeger.utils import shutdown_executors
 
 
 __all__ = ["JaegerActor"]
@@ -126,6 +127,8 @@ class JaegerActor(clu.LegacyActor):
         if self.chiller:
             await self.chiller.stop()
 
+        shutdown_executors()
+
         return await super().stop()
 
     async def start_status_server(self, port, delay=1):
@@ -21,7 +21,7 @@ from coordio.defaults import calibration
 
 from jaeger.fvc import FVC
 from jaeger.target.configuration import ManualConfiguration
-from jaeger.target.tools import get_wok_data
+from jaeger.target.tools import set_positioner_table
 from jaeger.utils.helpers import run_in_executor
 
 from . import jaeger_parser
@@ -147,8 +147,7 @@ async def reset_offsets(
 
     new_positioner_table = pandas.read_csv(positioner_file, comment="#", index_col=0)
     new_positioner_table.set_index(["site", "holeID"], inplace=True)
-    calibration.positionerTable = new_positioner_table
-    get_wok_data.cache_clear()
+    set_positioner_table(new_positioner_table)
 
     await fps.initialise()
     fps.configuration = ManualConfiguration.create_from_positions(obs, positions)
@@ -41,6 +41,11 @@ class AlertsBot(BaseBot):
         self.keywords: dict[str, bool] = {}
         self._gfa_alerts: dict[str, bool] = {}
 
+        # Values read by read_values() for the current iteration of the loop,
+        # keyed by (device, adapt).
+        self._ieb_values: dict[tuple[str, bool], Any] = {}
+        self._chiller_values: dict[tuple[str, bool], Any] = {}
+
         self.reset()
 
     def reset(self):
@@ -135,6 +140,8 @@ class AlertsBot(BaseBot):
             coros.append(self._check_chiller)
 
         while True:
+            await self.read_values()
+
             for coro in coros:
                 try:
                     await coro()
@@ -143,8 +150,99 @@ class AlertsBot(BaseBot):
                         f"Failed running alerts coroutine {coro.__name__}: {err}"
                     )
 
+            self._ieb_values.clear()
+            self._chiller_values.clear()
+
             await asyncio.sleep(self.interval)
 
+    def _get_ieb_devices(self) -> list[str]:
+        """Returns the IEB devices that the enabled checks read."""
+
+        enabled = self.config["enabled"]
+
+        devices: list[str] = []
+        if "robot" in enabled:
+            devices.append(self.config["robot"]["sensor"])
+        if "ieb" in enabled:
+            devices.append(self.config["ieb"]["sensor"])
+            devices += [f"GFA{gfa_id}" for gfa_id in range(1, 7)]
+        if "flow" in enabled:
+            devices.append(self.config["flow"]["sensor"])
+        if "temperature" in enabled or "chiller" in enabled:
+            devices.append(self.config["temperature"]["sensor_temp"])
+            devices.append(self.config["temperature"]["sensor_rh"])
+
+        return list(dict.fromkeys(devices))
+
+    async def read_values(self):
+        """Reads the devices used by the enabled checks.
+
+        The IEB and the chiller are read concurrently. For each one, the devices
+        are read concurrently over a single connection with `.IEB.read_many`. The
+        checks use these values instead of reading each device independently.
+        Failures are reported and the checks then read the devices directly.
+
+        """
+
+        async def read_ieb():
+            assert isinstance(self.ieb, IEB)
+
+            devices = self._get_ieb_devices()
+            values = await self.ieb.read_many(devices)
+            self._ieb_values = {(dev, True): val for dev, val in zip(devices, values)}
+
+        async def read_chiller():
+            chiller = Chiller.create()
+            if chiller is None:
+                return
+
+            alert_devices = [
+                name
+                for name in chiller.modules["chiller"].devices
+                if name.startswith("alert_")
+            ]
+
+            async with chiller:
+                display, alerts = await asyncio.gather(
+                    chiller.read_many(["DISPLAY_VALUE"], connect=False),
+                    chiller.read_many(alert_devices, adapt=False, connect=False),
+                )
+
+            self._chiller_values = {("DISPLAY_VALUE", True): display[0]}
+            for name, value in zip(alert_devices, alerts):
+                self._chiller_values[(name, False)] = value
+
+        self._ieb_values = {}
+        self._chiller_values = {}
+
+        readers = []
+        if isinstance(self.ieb, IEB):
+            readers.append(read_ieb())
+        if "chiller" in self.config["enabled"]:
+            readers.append(read_chiller())
+
+        results = await asyncio.gather(*readers, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                self.notify(f"Failed reading alert values: {result}")
+
+    async def _read_device(
+        self,
+        name: str,
+        adapt: bool = True,
+        chiller: Chiller | None = None,
+    ):
+        """Returns the value of a device from `.read_values` or reads it now."""
+
+        drift = chiller or self.ieb
+        assert isinstance(drift, IEB)
+
+        values = self._chiller_values if chiller is not None else self._ieb_values
+        if (name, adapt) in values:
+            return values[(name, adapt)]
+
+        return await drift.read_device(name, adapt=adapt)
+
     async def get_dew_point_temperarure(self):
         """Returns the ambient and dew point temperatures."""
 
@@ -152,8 +250,8 @@ class AlertsBot(BaseBot):
 
         temp_config = config["alerts"]["temperature"]
 
-        temp = (await self.ieb.read_device(temp_config["sensor_temp"], adapt=True))[0]
-        rh = (await self.ieb.read_device(temp_config["sensor_rh"], adapt=True))[0]
+        temp = (await self._read_device(temp_config["sensor_temp"]))[0]
+        rh = (await self._read_device(temp_config["sensor_rh"]))[0]
 
         # Dewpoint temperature.
         t_d = temp - (100 - rh) / 5.0
@@ -238,7 +336,7 @@ class AlertsBot(BaseBot):
         robot_config = config["alerts"]["robot"]
 
         sensor = robot_config["sensor"]
-        temperature = (await self.ieb.read_device(sensor, adapt=True))[0]
+        temperature = (await self._read_device(sensor))[0]
 
         if temperature > robot_config["critical"]:
             changed = self.set_keyword("alert_robot_temp_critical", True)
@@ -266,7 +364,7 @@ class AlertsBot(BaseBot):
         ieb_config = config["alerts"]["ieb"]
 
         sensor = ieb_config["sensor"]
-        temperature = (await self.ieb.read_device(sensor, adapt=True))[0]
+        temperature = (await self._read_device(sensor))[0]
 
         if temperature > ieb_config["critical"]:
             changed = self.set_keyword("alert_ieb_temp_critical", True)
@@ -291,7 +389,7 @@ class AlertsBot(BaseBot):
         # the alarm but next time that _check_gfa() is called it will refresh
         # the keywords.
         for gfa_id in range(1, 7):
-            relay_status = await self.ieb.read_device(f"GFA{gfa_id}")
+            relay_status = (await self._read_device(f"GFA{gfa_id}"))[0]
             if relay_status == "open":
                 self._gfa_alerts.pop(f"gfa{gfa_id}", None)
 
@@ -342,7 +440,7 @@ class AlertsBot(BaseBot):
         flow_config = config["alerts"]["flow"]
 
         sensor = flow_config["sensor"]
-        flow = (await self.ieb.read_device(sensor, adapt=True))[0]
+        flow = (await self._read_device(sensor))[0]
 
         if flow < flow_config["critical"]:
             self.set_keyword("alert_fps_flow", True)
@@ -383,7 +481,7 @@ class AlertsBot(BaseBot):
 
         try:
             # setpoint = (await chiller.read_device("TEMPERATURE_USER_SETPOINT"))[0]
-            fluid_temp = (await chiller.read_device("DISPLAY_VALUE"))[0]
+            fluid_temp = (await self._read_device("DISPLAY_VALUE", chiller=chiller))[0]
         except Exception as err:
             self.notify(f"Failed reading chiller values: {err}", level=logging.ERROR)
 
@@ -412,7 +510,11 @@ class AlertsBot(BaseBot):
         chiller_mod = chiller.modules["chiller"]
         for chiller_dev_name in chiller_mod.devices:
             if chiller_dev_name.startswith("alert_"):
-                value: Any = await chiller.read_device(chiller_dev_name, adapt=False)
+                value: Any = await self._read_device(
+                    chiller_dev_name,
+                    adapt=False,
+                    chiller=chiller,
+                )
                 if value > 0:
                     chiller_alerts.append(chiller_dev_name)
 
@@ -23,6 +23,7 @@ from typing import (
     Generic,
     List,
     Optional,
+    Tuple,
     Type,
     TypedDict,
     TypeVar,
@@ -32,6 +33,7 @@ from typing import (
 import jaeger
 from jaeger import can_log, config, log, start_file_loggers
 from jaeger.commands import Command, CommandID, EmptyPool
+from jaeger.commands.base import UID_POOL_CALLBACKS
 from jaeger.exceptions import JaegerCANError
 from jaeger.interfaces import BusABC, CANNetBus, Message, Notifier, VirtualBus
 from jaeger.maskbits import CommandStatus
@@ -122,14 +124,22 @@ class JaegerCAN(Generic[Bus_co]):
 
         self._started: bool = False
 
-        # Currently running commands.
-        self.running_commands: Dict[int, Command] = {}
+        # Currently running commands, indexed by (positioner_id, command_id, uid).
+        # Entries are added when the messages are sent and removed when the
+        # command is done, so that a reply can be routed without a full scan.
+        self.running_commands: Dict[Tuple[int, int, int], Command] = {}
 
         self.command_queue: asyncio.Queue[Command] | None = None
         self._command_queue_task: asyncio.Task | None = None
 
+        # Commands waiting for a UID, in order, indexed by (command_id, positioner_id).
+        self._uid_waiters: Dict[Tuple[int, int], collections.deque[Command]] = {}
+        self._uid_wakeups: set[Tuple[int, int]] = set()
+
         self.notifier: Notifier | None = None
 
+        self._lock_task: asyncio.Task | None = None
+
     async def start(self: T) -> T:
         self.stop()
 
@@ -166,6 +176,8 @@ class JaegerCAN(Generic[Bus_co]):
         self.command_queue = asyncio.Queue()
         self._command_queue_task = asyncio.create_task(self._process_command_queue())
 
+        UID_POOL_CALLBACKS.append(self._uid_returned)
+
         self.notifier = Notifier(
             listeners=[self._process_reply_queue],
             buses=self.interfaces,
@@ -194,6 +206,12 @@ class JaegerCAN(Generic[Bus_co]):
         if self._command_queue_task:
             self._command_queue_task.cancel()
 
+        if self._uid_returned in UID_POOL_CALLBACKS:
+            UID_POOL_CALLBACKS.remove(self._uid_returned)
+
+        self._uid_waiters.clear()
+        self._uid_wakeups.clear()
+
         self._started = False
 
     @classmethod
@@ -275,11 +293,27 @@ class JaegerCAN(Generic[Bus_co]):
         return instance
 
     def refresh_running_commands(self):
-        """Clears completed commands."""
+        """Clears completed commands.
+
+        Completed commands are removed from `.running_commands` automatically
+        when they finish so it should not be necessary to call this method
+        during normal operation.
+
+        """
 
         rc = self.running_commands
         self.running_commands = {key: cmd for key, cmd in rc.items() if not cmd.done()}
 
+    def _remove_running_command(self, cmd: Command):
+        """Removes the entries of a completed command from the running commands."""
+
+        for message in cmd.messages:
+            cmd_key = (message.positioner_id, int(cmd.command_id), message.uid)
+            # The UID may have already been returned to the pool and reused by
+            # a new command, in which case the entry does not belong to us.
+            if self.running_commands.get(cmd_key) is cmd:
+                del self.running_commands[cmd_key]
+
     async def _process_command_queue(self):
         """Processes messages in the command queue."""
 
@@ -299,21 +333,74 @@ class JaegerCAN(Generic[Bus_co]):
                     cmd.cancel()
                 continue
 
-            try:
-                self.send_messages(cmd)
-            except EmptyPool:
-                if cmd.positioner_ids == [0]:
-                    # We'll ignore this case silently since generally this happens only
-                    # with GET_FIRMWARE or GET_STATUS that can usually be delayed.
-                    loop = asyncio.get_event_loop()
-                    loop.call_later(1, self.command_queue.put_nowait, cmd)
+            # If earlier commands are waiting for a UID for the same command and
+            # positioner, wait behind them so that commands are sent in order.
+            cid = int(cmd.command_id)
+            for pid in cmd.positioner_ids:
+                if (cid, pid) in self._uid_waiters:
+                    self._uid_waiters[(cid, pid)].append(cmd)
+                    break
+            else:
+                self._send_or_wait(cmd)
+
+    def _send_or_wait(self, cmd: Command, first: bool = False) -> bool:
+        """Sends a command or queues it until a UID is available.
+
+        If ``first=True`` the command is placed at the front of the waiting
+        commands. Returns `False` if the command is waiting for a UID.
+
+        """
+
+        try:
+            self.send_messages(cmd)
+        except EmptyPool as ee:
+            key = (int(cmd.command_id), ee.positioner_id or 0)
+            waiters = self._uid_waiters.setdefault(key, collections.deque())
+            if first:
+                waiters.appendleft(cmd)
+            else:
+                waiters.append(cmd)
+            return False
+        except jaeger.JaegerError as ee:
+            can_log.error(f"found error while getting messages: {ee}")
+
+        return True
+
+    def _uid_returned(self, command_id: int, positioner_id: int):
+        """Schedules the commands waiting for a UID once one has been returned."""
+
+        key = (int(command_id), positioner_id)
+        if key not in self._uid_waiters or key in self._uid_wakeups:
+            return
+
+        self._uid_wakeups.add(key)
+        asyncio.get_event_loop().call_soon(self._send_waiting, key)
+
+    def _send_waiting(self, key: Tuple[int, int]):
+        """Sends the commands waiting for a UID, in order, until the pool is empty."""
+
+        self._uid_wakeups.discard(key)
+
+        waiters = self._uid_waiters.get(key, None)
+        while waiters:
+            cmd = waiters.popleft()
+            if not self._send_or_wait(cmd, first=True):
+                # The command may be waiting for a different positioner now.
+                if len(waiters) == 0 or cmd is not waiters[0]:
                     continue
-            except jaeger.JaegerError as ee:
-                can_log.error(f"found error while getting messages: {ee}")
-                continue
+                return
 
-    async def _process_reply_queue(self, msg: Message):
-        """Processes one reply message."""
+        if key in self._uid_waiters and len(self._uid_waiters[key]) == 0:
+            del self._uid_waiters[key]
+
+    def _process_reply_queue(self, msg: Message):
+        """Processes one reply message.
+
+        This method is called synchronously by the `.Notifier` for each received
+        message and passes the reply to the matching command without creating a
+        new task.
+
+        """
 
         positioner_id, command_id, reply_uid, __ = parse_identifier(msg.arbitration_id)
 
@@ -323,13 +410,18 @@ class JaegerCAN(Generic[Bus_co]):
             if not self.fps or self.fps.locked:
                 return
 
+            # Replies are dispatched in batches so we may receive several collision
+            # replies before the lock task has had a chance to lock the FPS.
+            if self._lock_task is not None and not self._lock_task.done():
+                return
+
             log.error(
                 f"A collision was detected in positioner {positioner_id}. "
                 "Sending SEND_TRAJECTORY_ABORT and locking the FPS."
             )
 
             if self.fps:
-                await self.fps.lock(by=[positioner_id])
+                self._lock_task = asyncio.create_task(self.fps.lock(by=[positioner_id]))
                 return
 
         if command_id == 0:
@@ -342,39 +434,28 @@ class JaegerCAN(Generic[Bus_co]):
 
         command_id_flag = CommandID(command_id)
 
-        self.refresh_running_commands()
-
-        cmd_key = (positioner_id << 25) + (command_id << 15) + reply_uid
-
-        if cmd_key in self.running_commands:
-            running_cmd = self.running_commands[cmd_key]
-        elif (command_id << 15) + reply_uid in self.running_commands:
+        running_cmd = self.running_commands.get((positioner_id, command_id, reply_uid))
+        if running_cmd is None:
             # Checks if the reply corresponds to a broadcast.
-            cmd_key = (command_id << 15) + reply_uid
-            running_cmd = self.running_commands[cmd_key]
-        else:
+            running_cmd = self.running_commands.get((0, command_id, reply_uid))
+
+        if running_cmd is None or running_cmd.done():
             can_log.debug(
                 f"[{command_id_flag.name}, {positioner_id}]: "
                 f"cannot find a matching running command."
             )
             return
 
-        if not running_cmd.is_broadcast:
-            if reply_uid not in running_cmd.message_uids:
-                can_log.debug(
-                    f"[{command_id_flag.name}, {positioner_id}]: "
-                    f"matching command does not contain reply UID={reply_uid}."
-                )
-                return
-
+        # The index is keyed by the UIDs of the messages sent, so there is no need
+        # to check that the command contains the reply UID.
         can_log.debug(
             f"[{command_id_flag.name}, "
             f"{positioner_id}, {running_cmd.command_uid}]: "
-            f"queuing reply UID={reply_uid} "
+            f"dispatching reply UID={reply_uid} "
             f"to command {running_cmd.command_uid}."
         )
 
-        asyncio.create_task(running_cmd.process_reply(msg))
+        running_cmd.process_reply(msg)
 
     def send_messages(self, cmd: Command):
         """Sends messages to the interface.
@@ -402,6 +483,8 @@ class JaegerCAN(Generic[Bus_co]):
 
         messages = cmd.get_messages()
 
+        cmd.add_done_callback(self._remove_running_command)
+
         for message in messages:
             if cmd.status.failed:
                 can_log.debug(
@@ -410,11 +493,8 @@ class JaegerCAN(Generic[Bus_co]):
                 )
                 break
 
-            cmd_key = message.positioner_id << 25
-            cmd_key += message.command.command_id << 15
-            cmd_key += message.uid
-
-            self.running_commands[cmd_key] = message.command
+            cmd_key = (message.positioner_id, int(cmd.command_id), message.uid)
+            self.running_commands[cmd_key] = cmd
 
             # Get the interface and buses to which to send this command.
             interfaces = self.interfaces
@@ -538,13 +618,13 @@ class CANnetInterface(JaegerCAN[CANNetBus]):
         if self.device_status_poller is not None:
             asyncio.create_task(self.device_status_poller.stop())
 
-    async def _process_reply_queue(self, msg: Message):
+    def _process_reply_queue(self, msg: Message):
         """Processes a message checking first if it comes from the device."""
 
         if msg.arbitration_id == 0:
             return self.handle_device_message(msg)
 
-        await super()._process_reply_queue(msg)
+        super()._process_reply_queue(msg)
 
     @property
     def device_status(self):
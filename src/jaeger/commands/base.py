@@ -36,6 +36,10 @@ __all__ = ["SuperMessage", "Command", "EmptyPool"]
 # reserved for broadcasts.
 UID_POOL = collections.defaultdict(dict)
 
+# Functions called with (command_id, positioner_id) when a UID is returned to the
+# pool. Used by JaegerCAN to send the commands that are waiting for a UID.
+UID_POOL_CALLBACKS: List[Callable[[int, int], Any]] = []
+
 # Starting value for command UID.
 COMMAND_UID = 0
 
@@ -151,7 +155,22 @@ class Reply(object):
 
 
 class EmptyPool(CommandError):
-    pass
+    """No UIDs left in the pool for a command and positioner."""
+
+    def __init__(self, message=None, command_id=None, positioner_id=None, **kwargs):
+        self.command_id = command_id
+        self.positioner_id = positioner_id
+
+        super().__init__(message, **kwargs)
+
+
+def return_uid(command_id: int, positioner_id: int, uid: int):
+    """Returns a UID to the pool and notifies the `.UID_POOL_CALLBACKS`."""
+
+    UID_POOL[command_id][positioner_id].add(uid)
+
+    for callback in UID_POOL_CALLBACKS:
+        callback(command_id, positioner_id)
 
 
 data_co = Union[None, bytearray, List[bytearray]]
@@ -417,14 +436,19 @@ class Command(StatusMixIn[CommandStatus], Future_co):
 
         return True
 
-    async def process_reply(self, reply_message):
-        """Watches the reply queue."""
+    def process_reply(self, reply_message: Message):
+        """Processes a reply to this command.
+
+        Called synchronously by `.JaegerCAN` when a reply matching one of the
+        messages of this command is received.
+
+        """
 
         reply = Reply(reply_message, command=self)
 
         # Return the UID to the pool.
         if not self.is_broadcast:
-            UID_POOL[self.command_id][reply.positioner_id].add(reply.uid)
+            return_uid(self.command_id, reply.positioner_id, reply.uid)
 
         pid = reply.positioner_id
 
@@ -554,10 +578,10 @@ class Command(StatusMixIn[CommandStatus], Future_co):
 
             # For good measure we return all the UIDs
             if self.is_broadcast:
-                UID_POOL[self.command_id][0].add(0)
+                return_uid(self.command_id, 0, 0)
             else:
                 for message in self.messages:
-                    UID_POOL[self.command_id][message.positioner_id].add(message.uid)
+                    return_uid(self.command_id, message.positioner_id, message.uid)
 
             self.set_result(self)
             self.end_time = time.time()
@@ -618,8 +642,12 @@ class Command(StatusMixIn[CommandStatus], Future_co):
                 except KeyError:
                     # Before failing, put back the UIDs of the other messages
                     for message in messages:
-                        UID_POOL[cid][pid].add(message.uid)
-                    raise EmptyPool("no UIDs left in the pool.")
+                        return_uid(cid, message.positioner_id, message.uid)
+                    raise EmptyPool(
+                        "no UIDs left in the pool.",
+                        command_id=cid,
+                        positioner_id=pid,
+                    )
 
                 messages.append(SuperMessage(self, positioner_id=pid, uid=uid, data=d))
 
@@ -162,6 +162,9 @@ async def load_firmware(
         log.error("firmware upgrade failed.")
         return False
 
+    # The positioners will restart with a different firmware after the upgrade.
+    fps.invalidate_firmware()
+
     # Restore pointer to start of file
     firmware_data.seek(0)
 
@@ -193,12 +193,7 @@ async def calibrate_positioners(
 async def _wait_status(fps: FPS, positioner_ids: list[int], statuses: list[PS]):
     """Waits for status."""
 
-    wait_for_status_tasks = []
-    for positioner_id in positioner_ids:
-        positioner = fps.positioners[positioner_id]
-        wait_for_status_tasks.append(positioner.wait_for_status(statuses))
-
-    await asyncio.gather(*wait_for_status_tasks)
+    await fps.wait_for_status(positioner_ids, statuses)
 
 
 class StartDatumCalibration(Command):
@@ -16,7 +16,17 @@ import time
 import warnings
 from glob import glob
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    cast,
+)
 
 import numpy
 
@@ -28,7 +38,7 @@ from jaeger import config, log
 from jaeger.commands import Command, CommandID
 from jaeger.exceptions import JaegerUserWarning, TrajectoryError
 from jaeger.ieb import IEB
-from jaeger.maskbits import FPSStatus, ResponseCode
+from jaeger.maskbits import CommandStatus, FPSStatus, ResponseCode
 from jaeger.utils import int_to_bytes
 
 
@@ -237,6 +247,7 @@ def dump_trajectory(
     trajectory.dump_data["end_time"] = time.time()
     trajectory.dump_data["final_positions"] = trajectory.fps.get_positions_dict()
     trajectory.dump_data["failed_positioners"] = trajectory.failed_positioners
+    trajectory.dump_data["retried_positioners"] = trajectory.retried_positioners
 
     path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -312,6 +323,10 @@ class Trajectory(object):
         # List of positioners that failed receiving the trajectory and reason.
         self.failed_positioners: dict[int, str] = {}
 
+        # Positioners that failed receiving the trajectory at the first attempt and
+        # were retried, and the reason for the first failure.
+        self.retried_positioners: dict[int, str] = {}
+
         self.validate()
 
         #: Number of points sent to each positioner as a tuple ``(alpha, beta)``.
@@ -336,6 +351,15 @@ class Trajectory(object):
         self.use_sync_line: bool = True
         self._ready_to_start = False
 
+        # Minimum and maximum delays between status polls while the trajectory runs.
+        self._poll_delay_min: float = 0.05
+        self._poll_delay_max: float = 1.0
+
+        # Clock and sleep used while waiting for the trajectory to finish. Can be
+        # replaced to test the polling with a controlled clock.
+        self._clock: Callable[[], float] = time.time
+        self._sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep
+
         self.dump_data = {
             "start_time": time.time(),
             "success": False,
@@ -401,7 +425,12 @@ class Trajectory(object):
                             )
 
     async def send(self, allow_retry: bool = True):
-        """Sends the trajectory but does not start it."""
+        """Sends the trajectory but does not start it.
+
+        If ``allow_retry=True`` and some positioners fail to receive the
+        trajectory, the upload is retried once for those positioners only.
+
+        """
 
         if self.fps.locked:
             raise TrajectoryError(f"FPS is locked by {self.fps.locked_by}.", self)
@@ -458,8 +487,55 @@ class Trajectory(object):
             if max_time_pos > self.move_time:
                 self.move_time = max_time_pos
 
+        start_trajectory_send_time = time.time()
+
+        failed = await self._upload(list(self.trajectories))
+
+        if len(failed) > 0 and allow_retry:
+            log.warning(
+                f"Failed sending trajectory to positioners {list(failed)}. "
+                "Retrying once for those positioners."
+            )
+
+            self.retried_positioners.update(failed)
+
+            # Abort the trajectory only in the positioners that failed. A broadcast
+            # would also clear the trajectories already loaded in the rest.
+            await self.fps.send_command(
+                "SEND_TRAJECTORY_ABORT",
+                positioner_ids=list(failed),
+                timeout=1,
+            )
+
+            failed = await self._upload(list(failed))
+
+        if len(failed) > 0:
+            self.failed = True
+            self.failed_positioners.update(failed)
+            raise TrajectoryError(
+                f"Failed sending trajectory to positioners {list(failed)}.",
+                self,
+            )
+
+        self.data_send_time = time.time() - start_trajectory_send_time
+
+        self._ready_to_start = True
+        self.failed = False
+
+        return True
+
+    async def _upload(self, positioner_ids: list[int]) -> dict[int, str]:
+        """Uploads the trajectory to some positioners.
+
+        Returns a dictionary of the positioners that failed and the reason.
+        Positioners that fail at one stage are not sent the remaining commands.
+
+        """
+
+        failed: dict[int, str] = {}
+
         new_traj_data = {}
-        for pos_id in self.trajectories:
+        for pos_id in positioner_ids:
             data = SendNewTrajectory.get_data(
                 self.n_points[pos_id][0],
                 self.n_points[pos_id][1],
@@ -469,109 +545,135 @@ class Trajectory(object):
         # Starts trajectory
         new_traj_cmd = await self.fps.send_command(
             "SEND_NEW_TRAJECTORY",
-            positioner_ids=list(self.trajectories),
+            positioner_ids=positioner_ids,
             data=new_traj_data,
         )
 
-        if new_traj_cmd.status.failed or new_traj_cmd.status.timed_out:
-            self.failed = True
-            raise TrajectoryError("Failed sending SEND_NEW_TRAJECTORY.", self)
+        failed.update(self._get_failed_positioners(new_traj_cmd))
 
-        start_trajectory_send_time = time.time()
+        # Reflects the last upload, so it is cleared if a retry succeeds.
+        self.send_new_trajectory_failed = len(failed) > 0
 
-        # How many points from the trajectory are we putting in each command.
-        n_chunk = config["positioner"]["trajectory_data_n_points"]
+        # How many points from the trajectory are we putting in each command. If
+        # not set, each command includes as many points as UIDs are available, and
+        # is acknowledged once all the points in the window have been received.
+        uid_window = 2 ** config["positioner"]["uid_bits"] - 1
+        n_chunk = config["positioner"]["trajectory_data_n_points"] or uid_window
+        n_chunk = min(n_chunk, uid_window)
 
-        # Gets the maximum number of points for each arm for all positioners.
-        max_points = numpy.max(list(self.n_points.values()), axis=0)
-        max_points = {"alpha": max_points[0], "beta": max_points[1]}
+        # Encode all the points for each positioner and arm at once. The chunks
+        # below are slices of these payloads.
+        payloads = {
+            pos_id: {
+                arm: SendTrajectoryData.calculate_positions(
+                    self.trajectories[pos_id][arm]
+                )
+                for arm in ["alpha", "beta"]
+            }
+            for pos_id in positioner_ids
+            if pos_id not in failed
+        }
 
-        # Send chunks of size n_chunk to all the positioners in parallel.
-        # Do alpha first, then beta.
-        for arm in ["alpha", "beta"]:
-            for jj in range(0, max_points[arm], n_chunk):
-                data = {}
-                send_trajectory_pids = []
+        # Each positioner receives its chunks independently of the others. The
+        # number of commands running for each positioner is limited by the number of
+        # UIDs available for SEND_TRAJECTORY_DATA.
+        max_running = max(1, uid_window // n_chunk)
 
-                for pos_id in self.trajectories:
-                    arm_chunk = self.trajectories[pos_id][arm][jj : jj + n_chunk]
-                    if len(arm_chunk) == 0:
-                        continue
+        results = await asyncio.gather(
+            *[
+                self._stream_data(pos_id, payloads[pos_id], n_chunk, max_running)
+                for pos_id in payloads
+            ]
+        )
+
+        for result in results:
+            failed.update(result)
+
+        # Finalise the trajectories
+        end_pids = [pos_id for pos_id in positioner_ids if pos_id not in failed]
+        if len(end_pids) > 0:
+            self.end_traj_cmds = await self.fps.send_command(
+                "TRAJECTORY_DATA_END",
+                positioner_ids=end_pids,
+            )
+
+            failed.update(self._get_failed_positioners(self.end_traj_cmds))
+
+        return failed
+
+    async def _stream_data(
+        self,
+        positioner_id: int,
+        payloads: dict[str, list[bytearray]],
+        n_chunk: int,
+        max_running: int,
+    ) -> dict[int, str]:
+        """Sends the trajectory data to a positioner, alpha first, then beta.
 
-                    send_trajectory_pids.append(pos_id)
+        Chunks of ``n_chunk`` points are sent in order, with up to ``max_running``
+        commands running at the same time. No more chunks are sent after a command
+        fails. Returns the failed positioner and the reason, if any.
 
-                    positions = numpy.array(arm_chunk).astype(numpy.float64)
-                    data_pos = SendTrajectoryData.calculate_positions(positions)
+        """
 
-                    data[pos_id] = data_pos
+        semaphore = asyncio.Semaphore(max_running)
+        commands: list[Command] = []
 
-                self.data_send_cmd = await self.fps.send_command(
+        def release(command: Command):
+            semaphore.release()
+
+        for arm in ["alpha", "beta"]:
+            for jj in range(0, len(payloads[arm]), n_chunk):
+                await semaphore.acquire()
+
+                if any(cmd.status.failed or cmd.status.timed_out for cmd in commands):
+                    semaphore.release()
+                    break
+
+                command = self.fps.send_command(
                     "SEND_TRAJECTORY_DATA",
-                    positioner_ids=send_trajectory_pids,
-                    data=data,
+                    positioner_ids=positioner_id,
+                    data=payloads[arm][jj : jj + n_chunk],
                 )
+                command.add_done_callback(release)
+                commands.append(command)
 
-                status = self.data_send_cmd.status
-                replies = self.data_send_cmd.replies
-                if status.failed or status.timed_out:
-                    for reply in replies:
-                        if reply.response_code != ResponseCode.COMMAND_ACCEPTED:
-                            pid = reply.positioner_id
-                            code = reply.response_code.name or "UNKNOWN_ERROR"
-                            self.failed_positioners[pid] = code
-                            log.warning(f"Positioner {pid} failed with code {code!r}.")
-
-                    if status.timed_out:
-                        sent_pid = set(send_trajectory_pids)
-                        replied_pid = set(reply.positioner_id for reply in replies)
-                        not_responded = sent_pid - replied_pid
-                        for pid in not_responded:
-                            self.failed_positioners[pid] = "TIMED_OUT"
-                            log.warning(f"Positioner {pid} timed out.")
-
-                    if allow_retry:
-                        log.warning("Failed sending trajectory data. Retrying once.")
-
-                        # Stop trajectories and wait a few seconds before retrying.
-                        await self.fps.stop_trajectory()
-                        await self.fps.stop_trajectory(clear_flags=True)
-                        await asyncio.sleep(5)
-
-                        return await self.send(allow_retry=False)
-                    else:
-                        self.failed = True
-
-                        error_type = "timed out" if status.timed_out else "failed"
-                        raise TrajectoryError(
-                            f"At least one SEND_TRAJECTORY_DATA command {error_type}.",
-                            self,
-                        )
+                self.data_send_cmd = command
 
-        # Finalise the trajectories
-        self.end_traj_cmds = await self.fps.send_command(
-            "TRAJECTORY_DATA_END",
-            positioner_ids=list(self.trajectories.keys()),
-        )
+        await asyncio.gather(*commands)
 
-        for cmd in self.end_traj_cmds:
-            if cmd.status.failed:
-                self.failed = True
-                raise TrajectoryError("TRAJECTORY_DATA_END failed.", self)
+        failed: dict[int, str] = {}
+        for command in commands:
+            failed.update(self._get_failed_positioners(command))
+            if len(failed) > 0:
+                self.data_send_cmd = command
+                break
 
-            if ResponseCode.INVALID_TRAJECTORY in cmd.replies[0].response_code:
-                self.failed = True
-                raise TrajectoryError(
-                    f"positioner_id={cmd.positioner_id} got an "
-                    f"INVALID_TRAJECTORY reply.",
-                    self,
-                )
+        return failed
 
-        self.data_send_time = time.time() - start_trajectory_send_time
+    def _get_failed_positioners(self, command: Command) -> dict[int, str]:
+        """Returns the positioners that did not accept a command and the reason."""
 
-        self._ready_to_start = True
-        self.failed = False
+        failed: dict[int, str] = {}
 
-        return True
+        if not command.status.failed and not command.status.timed_out:
+            return failed
+
+        for reply in command.replies:
+            if reply.response_code != ResponseCode.COMMAND_ACCEPTED:
+                pid = reply.positioner_id
+                code = reply.response_code.name or "UNKNOWN_ERROR"
+                failed[pid] = code
+                log.warning(f"Positioner {pid} failed {command.name} with {code!r}.")
+
+        if command.status.timed_out or command.status == CommandStatus.CANCELLED:
+            reason = "TIMED_OUT" if command.status.timed_out else "CANCELLED"
+            replied_pids = set(reply.positioner_id for reply in command.replies)
+            for pid in set(command.positioner_ids) - replied_pids:
+                failed[pid] = reason
+                log.warning(f"Positioner {pid} did not reply to {command.name}.")
+
+        return failed
 
     async def start(self, use_sync_line: bool = True):
         """Starts the trajectory."""
@@ -622,11 +724,22 @@ class Trajectory(object):
         restart_pollers = True if self.fps.pollers.running else False
         await self.fps.pollers.stop()
 
-        self.start_time = time.time()
+        self.start_time = self._clock()
+
+        # During the move we poll at the usual cadence, making sure the last poll
+        # happens when the trajectory is expected to end. After that, we poll
+        # more often with an exponential backoff until all positioners are idle.
+        poll_delay = self._poll_delay_min
 
         try:
             while True:
-                await asyncio.sleep(1)
+                elapsed = self._clock() - self.start_time
+                remaining = self.move_time - elapsed
+                if remaining > 0:
+                    await self._sleep(min(remaining, self._poll_delay_max))
+                else:
+                    await self._sleep(poll_delay)
+                    poll_delay = min(poll_delay * 2, self._poll_delay_max)
 
                 if self.fps.locked:
                     raise TrajectoryError(
@@ -640,7 +753,7 @@ class Trajectory(object):
                     self.failed = False
                     break
 
-                elapsed = time.time() - self.start_time
+                elapsed = self._clock() - self.start_time
                 if elapsed > (self.move_time + 3):
                     raise TrajectoryError(
                         "Some positioners did not complete the move.",
@@ -763,21 +876,22 @@ class SendTrajectoryData(Command):
         super().__init__(positioner_ids, **kwargs)
 
     @staticmethod
-    def calculate_positions(positions):
-        """Converts angle-time posions to bytes data."""
+    def calculate_positions(positions) -> List[bytearray]:
+        """Converts angle-time positions to bytes data.
+
+        The whole array is converted to little-endian 32-bit integers in one
+        pass and then split in one 8-byte payload (angle, time) per point.
+
+        """
 
         positions = numpy.array(positions).astype(numpy.float64)
 
         positions[:, 0] = positions[:, 0] / 360.0 * MOTOR_STEPS
         positions[:, 1] /= TIME_STEP
 
-        positions = positions.astype(numpy.int32)
+        payload = positions.astype("<i4").tobytes()
 
-        data = []
-        for angle, tt in positions:
-            data.append(int_to_bytes(angle, dtype="i4") + int_to_bytes(tt, dtype="i4"))
-
-        return data
+        return [bytearray(payload[ii : ii + 8]) for ii in range(0, len(payload), 8)]
 
 
 class TrajectoryDataEnd(Command):
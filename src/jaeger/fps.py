@@ -11,6 +11,7 @@ from __future__ import annotations
 import asyncio
 import os
 import pathlib
+import time
 import warnings
 from dataclasses import dataclass
 from glob import glob
@@ -29,6 +30,7 @@ from typing import (
 
 import numpy
 from astropy.time import Time
+from packaging.version import Version
 from typing_extensions import Self
 from zc.lockfile import LockFile
 
@@ -50,9 +52,14 @@ from jaeger.exceptions import (
 )
 from jaeger.ieb import IEB
 from jaeger.interfaces import BusABC
-from jaeger.maskbits import FPSStatus, PositionerStatus
+from jaeger.maskbits import (
+    BootloaderStatus,
+    CommandStatus,
+    FPSStatus,
+    PositionerStatus,
+)
 from jaeger.positioner import Positioner
-from jaeger.utils import Poller, PollerList
+from jaeger.utils import Poller, PollerList, shutdown_executors
 
 
 if TYPE_CHECKING:
@@ -243,6 +250,19 @@ class FPS(BaseFPS):
 
         self.disabled: set[int] = set([])
 
+        # Whether the firmware versions need to be refreshed on the next status
+        # update. Firmware only changes when the positioners reboot.
+        self._firmware_stale: bool = True
+
+        # Positioners that did not reply to the last firmware request. They are not
+        # requested again until the firmware is refreshed for some other reason.
+        self._firmware_missing: set[int] = set()
+
+        # Positioners waiting for a status, as (positioner_id, status, delay, future),
+        # and the task that polls the status for all of them.
+        self._status_waiters: List[Tuple[int, list, float, asyncio.Future]] = []
+        self._status_waiters_task: asyncio.Task | None = None
+
         if IPYTHON:
             log.warning("IEB cannot run inside IPython.")
             self.ieb = False
@@ -510,6 +530,8 @@ class FPS(BaseFPS):
                 positioner.disabled = True
                 self.disabled.add(positioner.positioner_id)
 
+        self._firmware_stale = False
+
         # Add offline robots. Offline positioners are physically in the array but
         # they don't reply to commands and we need to specify their position. Once
         # That's done they behave as normal disabled robots.
@@ -553,12 +575,7 @@ class FPS(BaseFPS):
             disable_precise_moves = config["positioner"]["disable_precise_moves"]
             # if disable_precise_moves:
             #     warnings.warn("Disabling precise moves.", JaegerUserWarning)
-            pos_initialise = [
-                positioner.initialise(disable_precise_moves=disable_precise_moves)
-                for positioner in self.values()
-                if positioner.offline is False
-            ]
-            await asyncio.gather(*pos_initialise)
+            await self._initialise_positioners(disable_precise_moves)
         except (JaegerError, PositionerError) as err:
             raise JaegerError(f"Some positioners failed to initialise: {err}")
 
@@ -700,6 +717,104 @@ class FPS(BaseFPS):
 
         return self
 
+    async def _initialise_positioners(self, disable_precise_moves: bool = False):
+        """Initialises the connected positioners.
+
+        This is equivalent to calling `.Positioner.initialise` for each positioner,
+        but the status is retrieved with a single broadcast and positions, speeds,
+        and precise move modes are requested with one command for all positioners.
+        Assumes that the firmware versions have already been updated.
+
+        """
+
+        connected = [pos for pos in self.values() if pos.offline is False]
+
+        # Reset the positions and statuses, as Positioner.initialise does, so that
+        # a positioner that does not reply does not keep its previous values. The
+        # firmware versions have just been updated so we keep them.
+        for pos in connected:
+            firmware = pos.firmware
+            pos.reset()
+            pos.firmware = firmware
+
+        if not await self.update_status(timeout=config["fps"]["initialise_timeouts"]):
+            raise JaegerError("failed retrieving the positioner status.")
+
+        # Positioners in bootloader mode only need the firmware and status.
+        normal = [pos for pos in connected if not pos.is_bootloader()]
+
+        failed = [pos.positioner_id for pos in normal if not pos.initialised]
+        if len(failed) > 0:
+            raise JaegerError(f"positioners {failed} failed initialising.")
+
+        if len(normal) == 0:
+            return
+
+        position_command = await self.send_command(
+            CommandID.GET_ACTUAL_POSITION,
+            positioner_ids=[pos.positioner_id for pos in normal],
+        )
+        if position_command.status.failed or position_command.status.timed_out:
+            raise JaegerError("failed updating positions.")
+
+        positions = position_command.get_positions()  # type: ignore
+        for pos in normal:
+            await pos.update_position(positions[pos.positioner_id])
+
+        # Sets the default speed and disable precise moves
+        enabled = [pos for pos in normal if not pos.disabled]
+        precise_mode = not disable_precise_moves
+
+        for pos in normal:
+            if pos.disabled:
+                pos.precise_moves = precise_mode
+
+        if len(enabled) == 0:
+            return
+
+        speed = config["positioner"]["motor_speed"]
+        speed_command = await self.send_command(
+            CommandID.SET_SPEED,
+            positioner_ids=[pos.positioner_id for pos in enabled],
+            alpha=float(speed),
+            beta=float(speed),
+        )
+        if speed_command.status.failed or speed_command.status.timed_out:
+            raise JaegerError("failed setting speed.")
+
+        for pos in enabled:
+            pos.speed = (speed, speed)
+
+        precise = []
+        for pos in enabled:
+            if pos.firmware and Version(pos.firmware) < Version("04.01.17"):
+                pos._log("Disabling precise moves requires >=04.01.17")
+            else:
+                precise.append(pos)
+
+        if len(precise) == 0:
+            return
+
+        on_off = "ON" if precise_mode else "OFF"
+        precise_ids = [
+            f"SWITCH_{on_off}_PRECISE_MOVE_{arm}" for arm in ["ALPHA", "BETA"]
+        ]
+
+        precise_commands = await asyncio.gather(
+            *[
+                self.send_command(
+                    command_id,
+                    positioner_ids=[pos.positioner_id for pos in precise],
+                )
+                for command_id in precise_ids
+            ]
+        )
+        if any([cmd.status != CommandStatus.DONE for cmd in precise_commands]):
+            raise JaegerError("failed switching precise moves.")
+
+        for pos in precise:
+            pos.precise_moves = precise_mode
+
     def _check_fibre_assignments(self):
         """Checks that all the expected robots are present."""
 
@@ -1024,9 +1139,16 @@ class FPS(BaseFPS):
         positioner_ids: Optional[int | List[int]] = None,
         timeout: float = 2,
         is_retry: bool = False,
+        refresh_firmware: bool = False,
     ) -> bool:
         """Update statuses for all positioners.
 
+        The firmware versions are cached and only requested again if
+        ``refresh_firmware=True``, after `.invalidate_firmware` has been called,
+        if a positioner does not have a known firmware version (unless it did not
+        reply to the previous request), or if the status indicates that a
+        positioner has entered or left bootloader mode.
+
         Parameters
         ----------
         positioner_ids
@@ -1037,6 +1159,8 @@ class FPS(BaseFPS):
         is_retry
             A flag to determine whether the function is being called
             as a retry if the previous command timed out.
+        refresh_firmware
+            Forces the firmware versions to be updated before getting the status.
 
         """
 
@@ -1054,7 +1178,16 @@ class FPS(BaseFPS):
         else:
             n_positioners = None
 
-        await self.update_firmware_version(timeout=timeout)
+        no_firmware = [
+            pos
+            for pos in self.values()
+            if not pos.offline
+            and pos.firmware is None
+            and pos.positioner_id not in self._firmware_missing
+        ]
+
+        if refresh_firmware or self._firmware_stale or len(no_firmware) > 0:
+            await self.update_firmware_version(timeout=timeout)
 
         command = self.send_command(
             CommandID.GET_STATUS,
@@ -1075,11 +1208,20 @@ class FPS(BaseFPS):
         if len(command.replies) == 0:
             return True
 
-        update_status_coros = []
-        for pid, status_int in command.get_positioner_status().items():  # type: ignore
-            if pid not in self:
-                continue
+        statuses = command.get_positioner_status()  # type: ignore
+        statuses = {pid: status for pid, status in statuses.items() if pid in self}
 
+        rebooted = [
+            pid
+            for pid, status_int in statuses.items()
+            if self._firmware_changed(self[pid], status_int)
+        ]
+        if len(rebooted) > 0:
+            log.info(f"Positioners {rebooted} may have rebooted. Updating firmware.")
+            await self.update_firmware_version(timeout=timeout)
+
+        update_status_coros = []
+        for pid, status_int in statuses.items():
             update_status_coros.append(self[pid].update_status(status_int))
 
         await asyncio.gather(*update_status_coros)
@@ -1103,6 +1245,137 @@ class FPS(BaseFPS):
 
         return True
 
+    def _firmware_changed(self, positioner: Positioner, status_int: int) -> bool:
+        """Determines whether a new status implies a change of firmware.
+
+        Only transitions between bootloader and normal mode are detected. A
+        positioner in bootloader mode cannot report bits outside the bootloader
+        maskbits unless it has restarted in normal mode, and a positioner in normal
+        mode that only reports bootloader bits has restarted in bootloader mode.
+        Positioners that did not reply to the last firmware request are ignored.
+
+        """
+
+        if positioner.offline or positioner.positioner_id in self._firmware_missing:
+            return False
+
+        if positioner.firmware is None:
+            return True
+
+        bootloader_bits = sum(int(bit) for bit in BootloaderStatus)
+        non_bootloader_bits = status_int & ~bootloader_bits
+
+        if positioner.is_bootloader():
+            return non_bootloader_bits != 0
+
+        return status_int != 0 and non_bootloader_bits == 0
+
+    def invalidate_firmware(self):
+        """Forces the firmware versions to be refreshed on the next status update."""
+
+        self._firmware_stale = True
+
+    async def wait_for_status(
+        self,
+        positioner_ids: int | List[int],
+        status: PositionerStatus | List[PositionerStatus],
+        delay: float = 1,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """Waits until a list of positioners reach a certain status.
+
+        All the positioners waiting for a status, including those in other calls
+        to this method, share a single status broadcast poll.
+
+        Parameters
+        ----------
+        positioner_ids
+            The positioner or list of positioners to wait for.
+        status
+            The status to wait for. Can be a list in which case it will wait
+            until all the statuses in the list have been reached.
+        delay
+            Time, in seconds, to wait between status updates.
+        timeout
+            How many seconds to wait for the status to reach the desired value
+            before aborting.
+
+        Returns
+        -------
+        result
+            Returns `True` if all the positioners have reached the status or `False`
+            if the timeout limit was reached.
+
+        """
+
+        if isinstance(positioner_ids, int):
+            positioner_ids = [positioner_ids]
+
+        if not isinstance(status, (list, tuple)):
+            status = [status]
+
+        loop = asyncio.get_running_loop()
+
+        waiters = []
+        for pid in positioner_ids:
+            positioner = self.positioners[pid]
+            if positioner.is_bootloader():
+                raise JaegerError(
+                    "wait_for_status cannot be scheduled in bootloader mode."
+                )
+
+            flags = [positioner.flags(int(ss)) for ss in status]
+            waiters.append((pid, flags, delay, loop.create_future()))
+
+        self._status_waiters += waiters
+
+        task = self._status_waiters_task
+        if task is None or task.done():
+            self._status_waiters_task = asyncio.create_task(self._poll_status_waiters())
+
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*[waiter[3] for waiter in waiters]),
+                timeout,
+            )
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            for waiter in waiters:
+                if waiter in self._status_waiters:
+                    self._status_waiters.remove(waiter)
+
+        return True
+
+    async def _poll_status_waiters(self):
+        """Polls the status until all the status waiters are resolved."""
+
+        while len(self._status_waiters) > 0:
+            try:
+                await self.update_status()
+            except Exception as err:
+                for _, _, _, future in self._status_waiters:
+                    if not future.done():
+                        future.set_exception(err)
+                self._status_waiters.clear()
+                return
+
+            for waiter in list(self._status_waiters):
+                pid, flags, _, future = waiter
+
+                if not future.done():
+                    status = self.positioners[pid].status
+                    if not all([ss in status for ss in flags]):
+                        continue
+                    future.set_result(True)
+
+                self._status_waiters.remove(waiter)
+
+            if len(self._status_waiters) == 0:
+                break
+
+            await asyncio.sleep(min([waiter[2] for waiter in self._status_waiters]))
+
     async def update_position(
         self,
         positioner_ids: Optional[int | List[int]] = None,
@@ -1223,6 +1496,10 @@ class FPS(BaseFPS):
             positioner = self.positioners[pid]
             positioner.firmware = get_fw_command.get_firmware()[pid]
 
+        replied = {reply.positioner_id for reply in get_fw_command.replies}
+        self._firmware_missing = {pid for pid in valid if pid not in replied}
+        self._firmware_stale = False
+
         return True
 
     async def is_folded(self):
@@ -1250,33 +1527,49 @@ class FPS(BaseFPS):
 
         """
 
+        # Maximum time to wait for the positioners to acknowledge and stop.
+        timeout = 0.5
+        deadline = time.time() + timeout
+
         if clear_flags is False:
-            await self.send_command(
+            stop_command = self.send_command(
                 "SEND_TRAJECTORY_ABORT",
                 positioner_ids=None,
-                timeout=0,
+                timeout=timeout,
                 now=True,
             )
         else:
-            await self.send_command(
+            valid = [pid for pid in self if self[pid].offline is False]
+            stop_command = self.send_command(
                 "STOP_TRAJECTORY",
                 positioner_ids=0,
-                timeout=0,
+                timeout=timeout,
+                n_positioners=len(valid) if len(valid) > 0 else None,
                 now=True,
             )
 
         # Check running command that are "move" and cancel them.
         assert isinstance(self.can, JaegerCAN)
-        for command in self.can.running_commands.values():
+        for command in list(self.can.running_commands.values()):
             if command.move_command and not command.done():
                 command.cancel(silent=True)
 
         self.can.refresh_running_commands()
 
-        # Wait 0.5 seconds since we are using timeout=0 and we aren't actually giving
-        # time for the robots to reply. Not waiting can cause issues if you emit
-        # another command immediately after the stop.
-        await asyncio.sleep(0.5)
+        # Wait until all the positioners have acknowledged the stop. If they were
+        # moving, also wait until their status reports they have stopped. Not
+        # waiting can cause issues if you emit another command immediately after.
+        await stop_command
+
+        while self.moving:
+            await asyncio.sleep(0.05)
+
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                log.warning("Some positioners are still moving after stopping.")
+                break
+
+            await self.update_status(timeout=remaining)
 
     async def goto(
         self,
@@ -1554,6 +1847,9 @@ class FPS(BaseFPS):
         if self.pollers:
             await self.pollers.stop()
 
+        log.debug("Shutting down executor pools.")
+        shutdown_executors()
+
         log.debug("Cancelling all pending tasks and shutting down.")
 
         loop = asyncio.get_running_loop()
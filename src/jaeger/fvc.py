@@ -25,16 +25,21 @@ from astropy.table import Table
 from clu.command import Command
 from clu.legacy.tron import TronConnection
 from coordio import transforms
-from coordio.defaults import calibration
+from coordio.conv import wokToPositioner
+from coordio.defaults import POSITIONER_HEIGHT, calibration
 
 from jaeger import config, log
 from jaeger.exceptions import FVCError, JaegerUserWarning, TrajectoryError
 from jaeger.fps import FPS
 from jaeger.ieb import IEB
-from jaeger.kaiju import get_path_pair_in_executor, get_robot_grid
+from jaeger.kaiju import (
+    get_collided_robots,
+    get_path_pair_in_executor,
+    get_robot_grid,
+)
 from jaeger.plotting import plot_fvc_distances
 from jaeger.target import Configuration, Design, read_confSummary, wok_to_positioner
-from jaeger.target.tools import get_wok_data
+from jaeger.target.tools import get_wok_geometry
 from jaeger.utils import run_in_executor
 
 
@@ -598,8 +603,6 @@ class FVC:
 
         self.log("Calculating offsets from FVC image and model fit.")
 
-        site = config["observatory"]
-
         self.k = k or config["fvc"]["k"]
         max_offset: float = max_correction or config["fvc"]["max_correction"]
 
@@ -618,62 +621,76 @@ class FVC:
         if invalid.any():
             raise FVCError("Some metrology fibres have not been measured.")
 
-        wok_data = get_wok_data(self.site)
+        wok_geometry = get_wok_geometry(self.site)
 
-        # Calculate alpha/beta from measured wok coordinates.
-        _measured = []
-        first = True
-        for row in met.iter_rows(named=True):
-            (alpha_measured, beta_measured), _ = wok_to_positioner(
-                row["hole_id"],
-                site,
-                "Metrology",
-                row["xwok_measured"],
-                row["ywok_measured"],
-                wok_data=wok_data,
-            )
+        # Calculate alpha/beta from measured wok coordinates for all the metrology
+        # fibres at once.
+        xwok_measured = met["xwok_measured"].to_numpy()
+        ywok_measured = met["ywok_measured"].to_numpy()
 
-            if "alpha" in row:
-                alpha_expected = row["alpha"]
-                beta_expected = row["beta"]
-            else:
-                if first:
-                    self.log(
-                        "Fibre data does not include the expected alpha/beta "
-                        "positions. Using reported alpha/beta.",
-                        logging.WARNING,
-                    )
-                reported_pid = reported_positions[:, 0]
-                prow = reported_positions[reported_pid == row["positioner_id"]]
-                alpha_expected = prow[0][1]
-                beta_expected = prow[0][2]
+        hole_ids = met["hole_id"].to_list()
+        hole_rows = wok_geometry.get_hole_rows(hole_ids)
+        if (hole_rows < 0).any():
+            unknown = [hole_ids[idx] for idx in numpy.flatnonzero(hole_rows < 0)]
+            raise ValueError(f"Holes {unknown} not in the {self.site} wok data.")
 
-            # If beta >= 180, we would need a left handed configuration. For now we
-            # invalidate these values.
-            if beta_expected >= 180.0:
-                alpha_measured = numpy.nan
-                beta_measured = numpy.nan
+        wok_cal = wok_geometry.get_positioner_arrays(
+            hole_rows,
+            numpy.full(met.height, "Metrology"),
+        )
 
-            xwok_distance = row["xwok_measured"] - row["xwok"]
-            ywok_distance = row["ywok_measured"] - row["ywok"]
+        alpha_measured, beta_measured = wokToPositioner(
+            xwok_measured,
+            ywok_measured,
+            numpy.full(met.height, POSITIONER_HEIGHT),
+            wok_cal["xBeta"],
+            wok_cal["yBeta"],
+            wok_cal["alphaArmLen"],
+            wok_cal["alphaOffset"],
+            wok_cal["betaOffset"],
+            wok_cal["b"],
+            wok_cal["iHat"],
+            wok_cal["jHat"],
+            wok_cal["kHat"],
+            wok_cal["dx"],
+            wok_cal["dy"],
+        )
+        alpha_measured = numpy.array(alpha_measured, dtype=numpy.float64)
+        beta_measured = numpy.array(beta_measured, dtype=numpy.float64)
 
-            _measured.append(
-                (
-                    row["hole_id"],
-                    row["positioner_id"],
-                    xwok_distance,
-                    ywok_distance,
-                    alpha_expected,
-                    beta_expected,
-                    alpha_measured,
-                    beta_measured,
+        if "alpha" in met.columns:
+            alpha_expected = met["alpha"].to_numpy().astype(numpy.float64)
+            beta_expected = met["beta"].to_numpy().astype(numpy.float64)
+        else:
+            if met.height > 0:
+                self.log(
+                    "Fibre data does not include the expected alpha/beta "
+                    "positions. Using reported alpha/beta.",
+                    logging.WARNING,
                 )
-            )
-
-            first = False
+            reported_pid = reported_positions[:, 0].astype(int).tolist()
+            reported_row = {pid: idx for idx, pid in enumerate(reported_pid)}
+            reported_idx = [reported_row[pid] for pid in met["positioner_id"]]
+            alpha_expected = reported_positions[reported_idx, 1].astype(numpy.float64)
+            beta_expected = reported_positions[reported_idx, 2].astype(numpy.float64)
+
+        # If beta >= 180, we would need a left handed configuration. For now we
+        # invalidate these values.
+        left_handed = beta_expected >= 180.0
+        alpha_measured[left_handed] = numpy.nan
+        beta_measured[left_handed] = numpy.nan
 
         measured = polars.DataFrame(
-            _measured,
+            {
+                "hole_id": met["hole_id"],
+                "positioner_id": met["positioner_id"].cast(polars.Int32),
+                "xwok_distance": xwok_measured - met["xwok"].to_numpy(),
+                "ywok_distance": ywok_measured - met["ywok"].to_numpy(),
+                "alpha_expected": alpha_expected,
+                "beta_expected": beta_expected,
+                "alpha_measured": alpha_measured,
+                "beta_measured": beta_measured,
+            },
             schema={
                 "hole_id": polars.String,
                 "positioner_id": polars.Int32,
@@ -684,7 +701,6 @@ class FVC:
                 "alpha_measured": polars.Float64,
                 "beta_measured": polars.Float64,
             },
-            orient="row",
         ).sort("positioner_id")
 
         # Merge the reported positions.
@@ -960,6 +976,7 @@ class FVC:
 
         # Setup robot grid.
         grid = get_robot_grid(self.fps)
+        moved: list[int] = []
         for robot in grid.robotDict.values():
             if robot.isOffline:
                 continue
@@ -982,12 +999,15 @@ class FVC:
             meas_distance = numpy.hypot(dist["xwok_distance"], dist["ywok_distance"])[0]
             if meas_distance > target_distance:
                 robot.setDestinationAlphaBeta(new[0, "alpha_new"], new[0, "beta_new"])
+                moved.append(robot.id)
             else:
                 # Mark robot offline to indicate that we won't move it.
                 robot.isOffline = True
 
-        # Check for collisions. If robots are collided just leave them there.
-        collided = grid.getCollidedRobotList()
+        # Check for collisions. If robots are collided just leave them there. Robots
+        # that are not moved are already left at their current positions so we only
+        # need to check the moved robots and the robots they collide with.
+        collided = get_collided_robots(grid, robot_ids=moved)
         n_coll = len(collided)
         if n_coll > 0:
             for pid in collided:
@@ -1004,6 +1024,7 @@ class FVC:
             ignore_did_fail=True,
             stop_if_deadlock=True,
             ignore_initial_collisions=True,
+            direct_max_angle=config["kaiju"].get("direct_path_max_angle"),
         )
         if did_fail:
             log.warning(
@@ -1048,7 +1069,7 @@ class FVC:
 
         new_alpha_beta: NewPositionsType = {}
 
-        wok_data = get_wok_data(self.fps.observatory)
+        wok_geometry = get_wok_geometry(self.fps.observatory)
         for row in measured.iter_rows(named=True):
             (alpha, beta), _ = wok_to_positioner(
                 row["hole_id"],
@@ -1056,7 +1077,7 @@ class FVC:
                 "Metrology",
                 row["xwok_measured"],
                 row["ywok_measured"],
-                wok_data=wok_data,
+                wok_data=wok_geometry,
             )
             if not numpy.isnan(alpha) and alpha is not None:
                 new_alpha_beta[row["positioner_id"]] = {"alpha": alpha, "beta": beta}
@@ -6,13 +6,14 @@
 # @Filename: ieb.py
 # @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
 
+import asyncio
 import math
 import os
 import warnings
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Sequence
 
-from drift import Drift, DriftError
+from drift import Device, Drift, DriftError
 
 from jaeger import config
 from jaeger.exceptions import JaegerUserWarning
@@ -30,23 +31,22 @@ async def _get_category_data(command, category) -> list:
     items = schema["properties"][category]["items"]
     measured = []
 
-    async with ieb:
-        for item in items:
-            name = item["title"]
-            type_ = item["type"]
-            device = ieb.get_device(name)
-            value = (await device.read(connect=False))[0]
-            if type_ == "boolean" and device.__type__ == "relay":
-                value = True if value == "closed" else False
-            elif type_ == "integer":
-                value = int(value)
-            elif type_ == "number":
-                if "multipleOf" in item:
-                    precision = int(-math.log10(item["multipleOf"]))
-                else:
-                    precision = 3
-                value = round(value, precision)
-            measured.append(value)
+    devices = [ieb.get_device(item["title"]) for item in items]
+    values = await ieb.read_many(devices)
+
+    for item, device, (value, _) in zip(items, devices, values):
+        type_ = item["type"]
+        if type_ == "boolean" and device.__type__ == "relay":
+            value = True if value == "closed" else False
+        elif type_ == "integer":
+            value = int(value)
+        elif type_ == "number":
+            if "multipleOf" in item:
+                precision = int(-math.log10(item["multipleOf"]))
+            else:
+                precision = 3
+            value = round(value, precision)
+        measured.append(value)
 
     return measured
 
@@ -121,17 +121,96 @@ class IEB(Drift):
         """Returns the status of the IEB components."""
 
         status = {}
-        for category in self.get_categories():
-            data = await self.read_category(category)
-            for device in data:
+
+        data = await self.read_categories(self.get_categories())
+        for category in data:
+            for device, (value, _) in data[category].items():
                 if self.get_device(device).__type__ == "relay":
-                    value = False if data[device][0] == "open" else True
-                else:
-                    value = data[device][0]
+                    value = False if value == "open" else True
                 status[device] = value
 
         return status
 
+    async def read_many(
+        self,
+        devices: Sequence[str | Device],
+        adapt: bool = True,
+        connect: bool = True,
+    ) -> List[Any]:
+        """Reads multiple devices concurrently over a single connection.
+
+        Each device is read with `drift.Device.read`. The requests are sent
+        concurrently instead of connecting and waiting for each device in turn.
+
+        Parameters
+        ----------
+        devices
+            The devices to read, as names or `drift.Device` instances.
+        adapt
+            If possible, convert the values to real units.
+        connect
+            Whether to connect to the IEB and disconnect after reading. If `False`,
+            the caller is responsible for connecting.
+
+        Returns
+        -------
+        values
+            A list with the values of the devices, in the same order as
+            ``devices``. If ``adapt=True``, each value is a tuple of value and
+            units, as returned by `drift.Device.read`.
+
+        """
+
+        devices = [
+            device if isinstance(device, Device) else self.get_device(device)
+            for device in devices
+        ]
+
+        if len(devices) == 0:
+            return []
+
+        async def read_devices():
+            reads = [device.read(adapt=adapt, connect=False) for device in devices]
+            return list(await asyncio.gather(*reads))
+
+        if connect:
+            async with self:
+                return await read_devices()
+        else:
+            return await read_devices()
+
+    async def read_categories(
+        self,
+        categories: Sequence[str],
+        adapt: bool = True,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Reads all the devices in several categories with `.read_many`.
+
+        Returns a dictionary of category to a dictionary of module-qualified
+        device name and read value, as `drift.Drift.read_category`.
+
+        """
+
+        device_category = {}
+        for category in categories:
+            for module in self.modules:
+                for device in self.modules[module].devices.values():
+                    if device.category and device.category.lower() == category.lower():
+                        name = f"{module}.{device.name.lower()}"
+                        device_category[name] = (device, category)
+
+        names = list(device_category)
+        values = await self.read_many(
+            [device_category[name][0] for name in names],
+            adapt=adapt,
+        )
+
+        data = {category: {} for category in categories}
+        for name, value in zip(names, values):
+            data[device_category[name][1]][name] = value
+
+        return data
+
 
 class FVC_IEB(IEB):
     """Connects to the FVC IEB."""
@@ -9,8 +9,9 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
 
-from typing import TYPE_CHECKING, Any, Callable, Coroutine, List, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, List, TypeVar
 
 from .message import Message
 
@@ -21,19 +22,46 @@ if TYPE_CHECKING:
 __all__ = ["Notifier"]
 
 
-Listener_co = Callable[..., Coroutine[Message, Any, Any]]
+Listener_co = Callable[[Message], Any]
 Bus_co = TypeVar("Bus_co", bound="BusABC")
 
 
 class Notifier:
-    """Notifier class to report bus messages to multiple listeners."""
-
-    def __init__(self, listeners: List[Listener_co] = [], buses: List[Bus_co] = []):
+    """Notifier class to report bus messages to multiple listeners.
+
+    Messages received from all the buses are put in a common queue. A single
+    dispatcher task drains the queue in batches and calls the listeners
+    synchronously for each message, which avoids creating a new task for each
+    received frame. If a listener is a coroutine function, a task is created
+    for each call.
+
+    Parameters
+    ----------
+    listeners
+        A list of functions or coroutine functions to call with each received
+        message.
+    buses
+        The buses to monitor.
+    max_batch
+        Maximum number of messages to dispatch before yielding control to the
+        event loop.
+
+    """
+
+    def __init__(
+        self,
+        listeners: List[Listener_co] = [],
+        buses: List[Bus_co] = [],
+        max_batch: int = 512,
+    ):
         self.loop = asyncio.get_running_loop()
 
         self.listeners = listeners
+        self.max_batch = max_batch
+
+        self.queue: asyncio.Queue[Message] = asyncio.Queue()
 
-        self.tasks: list[asyncio.Task] = []
+        self.tasks: list[asyncio.Task] = [asyncio.create_task(self._dispatch())]
 
         self.buses: List[BusABC] = []
         for bus in buses:
@@ -65,10 +93,36 @@ class Notifier:
             self.listeners.remove(callback)
 
     async def _monitor_bus(self, bus: BusABC):
-        """Monitors buses and calls the listeners when a message is received."""
+        """Monitors a bus and queues the received messages for dispatching."""
 
         while True:
             msg = await bus.get()
             if msg is not None:
-                for listener in self.listeners:
-                    asyncio.create_task(listener(msg))
+                self.queue.put_nowait(msg)
+
+    def _notify(self, msg: Message):
+        """Calls the listeners with a message."""
+
+        for listener in self.listeners:
+            try:
+                result = listener(msg)
+                if inspect.isawaitable(result):
+                    asyncio.ensure_future(result)
+            except Exception as ee:
+                self.loop.call_exception_handler(
+                    {"message": "failed running listener", "exception": ee}
+                )
+
+    async def _dispatch(self):
+        """Drains the message queue in batches and notifies the listeners."""
+
+        while True:
+            self._notify(await self.queue.get())
+
+            n_dispatched = 1
+            while not self.queue.empty() and n_dispatched < self.max_batch:
+                self._notify(self.queue.get_nowait())
+                n_dispatched += 1
+
+            if n_dispatched == self.max_batch:
+                await asyncio.sleep(0)
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import time
 import warnings
+from functools import cache
 
 from typing import TYPE_CHECKING, Literal, Optional, Sequence, cast
 
@@ -29,14 +30,24 @@ if TYPE_CHECKING:
 
 __all__ = [
     "get_robot_grid",
+    "get_robot_grid_template",
+    "RobotGridTemplate",
     "dump_robot_grid",
+    "load_robot_grid",
+    "get_robot_grid_state",
+    "GRID_STATE_DTYPE",
     "decollide",
+    "get_collided_robots",
+    "get_collision_components",
     "get_path_pair",
+    "get_direct_path_pair",
     "get_snapshot",
     "unwind",
     "explode",
     "get_path_pair_in_executor",
     "decollide_in_executor",
+    "unlock_deadlock",
+    "get_deadlock_seed",
     "check_trajectory",
 ]
 
@@ -46,20 +57,132 @@ TrajectoryType = dict[int, dict[Literal["alpha", "beta"], ArmTrajectoryType]] |
 PathPairReturnType = tuple[TrajectoryType, TrajectoryType, bool, list[int]]
 
 
+#: The data type of the array returned by `.get_robot_grid_state`. One row per robot.
+GRID_STATE_DTYPE = numpy.dtype(
+    [
+        ("robot_id", "i4"),
+        ("alpha", "f8"),
+        ("beta", "f8"),
+        ("destination_alpha", "f8"),
+        ("destination_beta", "f8"),
+        ("offline", "?"),
+        ("collision_buffer", "f8"),
+    ]
+)
+
+
+GridDataType = dict | numpy.ndarray
+
+
 def warn(message):
     warnings.warn(message, JaegerUserWarning)
 
 
+class RobotGridTemplate:
+    """Records how a ``RobotGridCalib`` is built so that it can be rebuilt cheaply.
+
+    ``RobotGridCalib`` merges and iterates over the calibration tables each time a
+    grid is created. The template builds a grid once and records the resulting
+    ``addRobot``, ``addFiducial``, and ``addGFA`` calls, and the robots with a
+    fiducial watch. New grids replay those calls, so only the C++ grid
+    initialisation is repeated.
+
+    Parameters
+    ----------
+    observatory
+        The observatory for which the template is built. Used only to identify
+        the template; the calibration tables are those loaded by ``coordio``.
+
+    """
+
+    def __init__(self, observatory: str):
+        from kaiju.robotGrid import RobotGridCalib
+
+        self.observatory = observatory
+
+        self.calls: list[tuple[str, tuple, dict]] = []
+        self.fiducial_watch: list[int] = []
+
+        calls = self.calls
+        template = self
+
+        class RecordingRobotGrid(RobotGridCalib):
+            def addRobot(self, *args, **kwargs):
+                calls.append(("addRobot", args, kwargs))
+                return super().addRobot(*args, **kwargs)
+
+            def addFiducial(self, *args, **kwargs):
+                calls.append(("addFiducial", args, kwargs))
+                return super().addFiducial(*args, **kwargs)
+
+            def addGFA(self, *args, **kwargs):
+                calls.append(("addGFA", args, kwargs))
+                return super().addGFA(*args, **kwargs)
+
+        class TemplateRobotGrid(RobotGridCalib):
+            def _load_grid(self):
+                template._replay(self)
+
+        self._grid_class = TemplateRobotGrid
+
+        kaiju_config = config["kaiju"]
+        ang_step = kaiju_config["ang_step"]
+        epsilon = ang_step * kaiju_config["epsilon_factor"]
+
+        robot_grid = RecordingRobotGrid(stepSize=ang_step, epsilon=epsilon, seed=0)
+        for robot in robot_grid.robotDict.values():
+            if robot.fiducialWatch:
+                self.fiducial_watch.append(robot.id)
+
+    def _replay(self, robot_grid: RobotGridCalib):
+        """Adds the robots, fiducials, and GFAs to a new grid."""
+
+        for method, args, kwargs in self.calls:
+            getattr(robot_grid, method)(*args, **kwargs)
+
+        for robot_id in self.fiducial_watch:
+            robot_grid.robotDict[robot_id].fiducialWatch = True
+
+        robot_grid.initGrid()
+
+    def create(self, step_size: float, epsilon: float, seed: int) -> RobotGridCalib:
+        """Returns a new ``RobotGridCalib`` built from the template."""
+
+        return self._grid_class(stepSize=step_size, epsilon=epsilon, seed=seed)
+
+
+@cache
+def get_robot_grid_template(observatory: str) -> RobotGridTemplate:
+    """Returns a cached `.RobotGridTemplate` for an observatory.
+
+    The step size, epsilon, and collision buffer are set on each new grid so a
+    single template is valid for any set of parameters. The cache must be cleared
+    if the calibration tables change.
+
+    """
+
+    return RobotGridTemplate(observatory)
+
+
+def preload_robot_grid_template():
+    """Loads the robot grid template into the cache.
+
+    Used to warm up the worker processes of the process pool executor.
+
+    """
+
+    get_robot_grid_template(str(config["observatory"]))
+
+
 def get_robot_grid(fps: FPS | None, seed: int | None = None, collision_buffer=None):
     """Returns a new robot grid with the destination set to the lattice position.
 
     If an initialised instance of the FPS is available, disabled robots will be
-    set offline in the grid at their current positions.
+    set offline in the grid at their current positions. The grid is created from
+    the cached `.RobotGridTemplate` for the observatory.
 
     """
 
-    from kaiju.robotGrid import RobotGridCalib
-
     if seed is None:
         t = 1000 * time.time()
         seed = int(int(t) % 2**32 / 1000)
@@ -75,7 +198,8 @@ def get_robot_grid(fps: FPS | None, seed: int | None = None, collision_buffer=No
 
     log.debug(f"Creating RobotGridCalib with stepSize={ang_step}, epsilon={epsilon}.")
 
-    robot_grid = RobotGridCalib(stepSize=ang_step, epsilon=epsilon, seed=seed)
+    template = get_robot_grid_template(str(config["observatory"]))
+    robot_grid = template.create(ang_step, epsilon, seed)
     robot_grid.setCollisionBuffer(collision_buffer)
 
     # TODO: This is a bit hacky. Kaiju doesn't have a collisionBuffer anymore
@@ -121,14 +245,75 @@ def dump_robot_grid(robot_grid: RobotGridCalib) -> dict:
     return data
 
 
-def load_robot_grid(data: dict, set_destination: bool = True) -> RobotGridCalib:
-    """Restores a robot grid from a dump."""
+def get_robot_grid_state(robot_grid: RobotGridCalib) -> numpy.ndarray:
+    """Returns the state of a robot grid as a structured array.
 
-    collision_buffer = data["collision_buffer"]
-    robot_grid = get_robot_grid(None, collision_buffer=collision_buffer)
+    This is equivalent to `.dump_robot_grid` but the state is stored in an array
+    with dtype `.GRID_STATE_DTYPE`, which is much cheaper to create, pickle, and
+    share with other processes than a dictionary. The robots are sorted by ID.
+
+    """
+
+    collision_buffer = robot_grid.collisionBuffer
+
+    return numpy.array(
+        [
+            (
+                robot.id,
+                robot.alpha,
+                robot.beta,
+                robot.destinationAlpha,
+                robot.destinationBeta,
+                robot.isOffline,
+                collision_buffer,
+            )
+            for robot in sorted(robot_grid.robotDict.values(), key=lambda r: r.id)
+        ],
+        dtype=GRID_STATE_DTYPE,
+    )
+
+
+def _dump_as(robot_grid: RobotGridCalib, data: GridDataType) -> dict | numpy.ndarray:
+    """Dumps a robot grid with the same format as ``data``."""
+
+    if isinstance(data, dict):
+        return dump_robot_grid(robot_grid)
+
+    return get_robot_grid_state(robot_grid)
+
+
+def load_robot_grid(
+    data: GridDataType,
+    set_destination: bool = True,
+    seed: int | None = None,
+) -> RobotGridCalib:
+    """Restores a robot grid from a dump.
+
+    ``data`` can be a dictionary created by `.dump_robot_grid` or a grid state
+    array created by `.get_robot_grid_state`.
+
+    """
+
+    if isinstance(data, numpy.ndarray):
+        collision_buffer = float(data["collision_buffer"][0])
+        grid_data = {
+            int(row["robot_id"]): (
+                float(row["alpha"]),
+                float(row["beta"]),
+                float(row["destination_alpha"]),
+                float(row["destination_beta"]),
+                bool(row["offline"]),
+            )
+            for row in data
+        }
+    else:
+        collision_buffer = data["collision_buffer"]
+        grid_data = data["grid"]
+
+    robot_grid = get_robot_grid(None, seed=seed, collision_buffer=collision_buffer)
 
     for robot in robot_grid.robotDict.values():
-        data_robot = data["grid"][robot.id]
+        data_robot = grid_data[robot.id]
         robot.setAlphaBeta(data_robot[0], data_robot[1])
         if set_destination:
             robot.setDestinationAlphaBeta(data_robot[2], data_robot[3])
@@ -138,13 +323,81 @@ def load_robot_grid(data: dict, set_destination: bool = True) -> RobotGridCalib:
     return robot_grid
 
 
+def get_collided_robots(
+    robot_grid: RobotGridCalib,
+    robot_ids: Sequence[int] | None = None,
+) -> list[int]:
+    """Returns the collided robots.
+
+    If ``robot_ids`` is `None` this is equivalent to ``getCollidedRobotList()``.
+    Otherwise only the robots in ``robot_ids`` are checked, and the list includes
+    the robots they collide with.
+
+    """
+
+    if robot_ids is None:
+        return list(robot_grid.getCollidedRobotList())
+
+    collided: dict[int, None] = {}  # Used as an ordered set.
+    for robot_id in robot_ids:
+        if robot_id in collided or not robot_grid.isCollided(robot_id):
+            continue
+
+        collided[robot_id] = None
+        for collider in robot_grid.robotColliders(robot_id):
+            collided[collider] = None
+
+    return list(collided)
+
+
+def get_collision_components(
+    robot_grid: RobotGridCalib,
+    robot_ids: Sequence[int],
+) -> list[list[int]]:
+    """Groups collided robots into the connected components of the collision graph.
+
+    Two robots are connected if they collide with each other. Robots colliding
+    only with fiducials or GFAs form a component on their own. The robots in
+    each component are returned in the order in which they appear in
+    ``robot_ids``, followed by any collider not in ``robot_ids``.
+
+    """
+
+    components: list[list[int]] = []
+    visited: set[int] = set()
+
+    order = {rid: ii for ii, rid in reversed(list(enumerate(robot_ids)))}
+
+    for robot_id in robot_ids:
+        if robot_id in visited:
+            continue
+
+        visited.add(robot_id)
+        component = [robot_id]
+
+        idx = 0
+        while idx < len(component):
+            for collider in robot_grid.robotColliders(component[idx]):
+                if collider not in visited:
+                    visited.add(collider)
+                    component.append(collider)
+            idx += 1
+
+        component.sort(key=lambda rid: order.get(rid, len(robot_ids)))
+
+        components.append(component)
+
+    return components
+
+
 def decollide(
     robot_grid: Optional[RobotGridCalib] = None,
-    data: Optional[dict] = None,
+    data: Optional[GridDataType] = None,
     simple: bool = False,
     decollide_grid_fallback: bool = False,
     priority_order: list[int] = [],
-) -> tuple[RobotGridCalib | dict, list[int]]:
+    robot_ids: list[int] | None = None,
+) -> tuple[RobotGridCalib | dict | numpy.ndarray, list[int]]:
     """Decollides a potentially collided grid. Raises on fail.
 
     Parameters
@@ -152,9 +405,9 @@ def decollide(
     robot_grid
         The Kaiju ``RobotGridCalib`` instance to decollide.
     data
-        A dictionary of data that can be used to reload a Kaiju robot grid
-        using `.load_robot_grid`. This is useful if the function is being
-        run in an executor.
+        The data that can be used to reload a Kaiju robot grid using
+        `.load_robot_grid`, either as a dictionary or a grid state array. This is
+        useful if the function is being run in an executor.
     simple
         Runs ``decollideGrid()`` and returns.
     decollide_grid_fallback
@@ -164,13 +417,19 @@ def decollide(
         A sorted list of positioner IDs with the order of which positioners to
         try to keep at their current positions. Positioners earlier in the list
         will be decollided last. Ignore in case of ``simple=True``.
+    robot_ids
+        The robots that may be collided, for example those that have moved since
+        the grid was last free of collisions. Only these robots and the robots
+        they collide with are checked. If `None`, checks all the robots in the
+        grid. Ignored in case of ``simple=True``.
 
     Returns
     -------
     grid,decollided
         If ``robot_grid`` is passed, returns the same grid instance after decollision.
-        If ``data`` is passed, returns a dictionary describing the decollided grid
-        that can be used to recreate a grid using `.load_robot_grid`. Also returns
+        If ``data`` is passed, returns a dump of the decollided grid that can be
+        used to recreate a grid using `.load_robot_grid`. The dump is a dictionary
+        if ``data`` is a dictionary and a grid state array otherwise. Also returns
         the list of robots that have been decollided.
 
     """
@@ -190,24 +449,30 @@ def decollide(
             raise JaegerError("Failed decolliding grid.")
 
         if data is not None:
-            return dump_robot_grid(robot_grid), collided
+            return _dump_as(robot_grid, data), collided
         else:
             return robot_grid, collided
 
-    # First pass. If collided, decollide each robot one by one.
-    collided = robot_grid.getCollidedRobotList()
+    # First pass. Find the groups of robots that collide with each other and
+    # decollide each robot one by one. Moving a robot to a position in which it is
+    # not collided cannot create new collisions so each group is independent and
+    # only the robots in the group need to be checked again.
+    collided = get_collided_robots(robot_grid, robot_ids=robot_ids)
+    components = get_collision_components(robot_grid, collided)
 
-    # Sort collided robots by priority order.
-    collided = sorted(
-        collided,
-        key=lambda x: (
-            len(priority_order) - priority_order.index(x) if x in priority_order else -1
-        ),
-    )
+    # Robots not in the priority list go first, then in reverse priority order.
+    n_priority = len(priority_order)
+    rank = {
+        rid: n_priority - ii for ii, rid in reversed(list(enumerate(priority_order)))
+    }
+
+    def priority(robot_id: int):
+        return rank.get(robot_id, -1)
 
     decollided = []
-    if len(collided) > 0:
-        for robot_id in collided:
+    remaining = []
+    for component in components:
+        for robot_id in sorted(component, key=priority):
             if robot_grid.isCollided(robot_id):
                 if robot_grid.robotDict[robot_id].isOffline:
                     continue
@@ -221,12 +486,14 @@ def decollide(
                     # decollision fixes the problem
                     robot_grid.robotDict[robot_id].setAlphaBeta(alpha_save, beta_save)
 
+        remaining += [rid for rid in component if robot_grid.isCollided(rid)]
+
     # Second pass. If still collided, try a grid decollision.
-    if len(robot_grid.getCollidedRobotList()) > 0:
+    if len(remaining) > 0:
         if decollide_grid_fallback:
             warn("Grid is still colliding. Attempting full grid decollision.")
             robot_grid.decollideGrid()
-            if robot_grid.getCollidedRobotList() is not False:
+            if len(robot_grid.getCollidedRobotList()) > 0:
                 raise JaegerError("Failed decolliding grid.")
             # We don't know which robots were decollided so assume all collided
             # robots have moved.
@@ -235,14 +502,14 @@ def decollide(
             raise JaegerError("Failed decolliding grid.")
 
     if data is not None:
-        return dump_robot_grid(robot_grid), decollided
+        return _dump_as(robot_grid, data), decollided
     else:
         return robot_grid, decollided
 
 
 def get_path_pair(
     robot_grid: Optional[RobotGridCalib] = None,
-    data: Optional[dict] = None,
+    data: Optional[GridDataType] = None,
     path_generation_mode: str | None = None,
     ignore_did_fail: bool = False,
     explode_deg: float = 5,
@@ -255,6 +522,7 @@ def get_path_pair(
     phobia: float | None = None,
     stop_if_deadlock: bool = False,
     ignore_initial_collisions: bool = False,
+    direct_max_angle: float | None = None,
 ) -> PathPairReturnType:
     """Runs path generation and returns the to and from destination paths.
 
@@ -263,9 +531,9 @@ def get_path_pair(
     robot_grid
         The Kaiju ``RobotGridCalib`` instance to decollide.
     data
-        A dictionary of data that can be used to reload a Kaiju robot grid
-        using `.load_robot_grid`. This is useful if the function is being
-        run in an executor.
+        The data that can be used to reload a Kaiju robot grid using
+        `.load_robot_grid`, either as a dictionary or a grid state array. This is
+        useful if the function is being run in an executor.
     path_generation_mode
         Defines the path generation algorithm to use.
         Either ``greedy``, ``mdp``, ``explode`` or ``explode_one``. If
@@ -288,6 +556,10 @@ def get_path_pair(
     ignore_initial_collisions
         If `True`, does not fail if the initial state is collided. To be used
         only for offsets.
+    direct_max_angle
+        If set, and no robot moves more than this many degrees, tries
+        `.get_direct_path_pair` first and only runs the ``greedy`` or ``mdp``
+        path generation if the direct paths may collide.
 
     Returns
     -------
@@ -309,6 +581,17 @@ def get_path_pair(
 
     assert robot_grid is not None
 
+    if direct_max_angle is not None and path_generation_mode in ["greedy", "mdp"]:
+        direct_paths = get_direct_path_pair(
+            robot_grid,
+            direct_max_angle,
+            speed=speed,
+            path_delay=path_delay,
+        )
+        if direct_paths is not None:
+            log.debug("Using direct paths.")
+            return (*direct_paths, False, [])
+
     deadlocks = []
     if path_generation_mode == "explode":
         log.debug(f"Running pathGenExplode with explode_deg={explode_deg}.")
@@ -372,16 +655,109 @@ def get_path_pair(
     )
 
 
+def get_direct_path_pair(
+    robot_grid: RobotGridCalib,
+    max_angle: float,
+    speed: float | None = None,
+    path_delay: float | None = None,
+) -> tuple[TrajectoryType, TrajectoryType] | None:
+    """Returns straight paths to the destination for small, collision-free moves.
+
+    All the robots move linearly from their current positions to their
+    destinations and finish at the same time. The swept volume is checked by
+    setting the robots in the grid at intermediate positions, separated by the
+    grid step size, and checking the moving robots for collisions. The grid is
+    left at the initial positions.
+
+    Parameters
+    ----------
+    robot_grid
+        The Kaiju ``RobotGridCalib`` with the current and destination positions.
+    max_angle
+        The maximum move, in degrees, of any arm. If a robot moves more than
+        this, the direct paths are not calculated.
+    speed, path_delay
+        The speed, in RPM, and the delay before the first point of the paths. If
+        not set uses the ``kaiju`` configuration values.
+
+    Returns
+    -------
+    paths
+        A tuple with the to destination and from destination paths, in the same
+        format as `.get_path_pair`, or `None` if any robot moves more than
+        ``max_angle`` or the paths may collide.
+
+    """
+
+    speed = speed or config["kaiju"]["speed"]
+    path_delay = path_delay or config["kaiju"]["path_delay"]
+
+    robots = [robot for robot in robot_grid.robotDict.values() if not robot.isOffline]
+    if len(robots) == 0:
+        return None
+
+    start = numpy.array([(robot.alpha, robot.beta) for robot in robots])
+    end = numpy.array(
+        [(robot.destinationAlpha, robot.destinationBeta) for robot in robots]
+    )
+
+    delta = end - start
+    max_delta = float(numpy.abs(delta).max())
+    if max_delta > max_angle:
+        return None
+
+    # Only moving robots can collide with something new.
+    moving = numpy.flatnonzero(numpy.any(delta != 0, axis=1))
+    n_steps = max(int(numpy.ceil(max_delta / robot_grid.stepSize)), 1)
+
+    try:
+        for step in range(n_steps + 1):
+            positions = start[moving] + (step / n_steps) * delta[moving]
+            for idx, (alpha, beta) in zip(moving, positions):
+                robots[idx].setAlphaBeta(float(alpha), float(beta))
+
+            for idx in moving:
+                if robot_grid.isCollided(robots[idx].id):
+                    return None
+
+    finally:
+        for robot, (alpha, beta) in zip(robots, start):
+            robot.setAlphaBeta(float(alpha), float(beta))
+
+    # Time for the largest move at full speed, in seconds.
+    move_time = max(max_delta, robot_grid.stepSize) / (speed * 360 / 60.0)
+
+    to_destination = {}
+    from_destination = {}
+    for robot, (alpha0, beta0), (alpha1, beta1) in zip(robots, start, end):
+        t0 = path_delay
+        t1 = path_delay + move_time
+
+        to_destination[int(robot.id)] = {
+            "alpha": [(float(alpha0), t0), (float(alpha1), t1)],
+            "beta": [(float(beta0), t0), (float(beta1), t1)],
+        }
+        from_destination[int(robot.id)] = {
+            "alpha": [(float(alpha1), t0), (float(alpha0), t1)],
+            "beta": [(float(beta1), t0), (float(beta0), t1)],
+        }
+
+    return to_destination, from_destination
+
+
 async def get_path_pair_in_executor(
     robot_grid: RobotGridCalib,
     **kwargs,
 ) -> PathPairReturnType:
-    """Calls `.get_path_pair` with a process executor."""
+    """Calls `.get_path_pair` with a process executor.
+
+    The grid is passed to the worker process as a grid state array.
+
+    """
 
-    data = dump_robot_grid(robot_grid)
     traj_data = await run_in_executor(
         get_path_pair,
-        data=data,
+        data=get_robot_grid_state(robot_grid),
         executor="process",
         **kwargs,
     )
@@ -392,12 +768,15 @@ async def get_path_pair_in_executor(
 async def decollide_in_executor(
     robot_grid: RobotGridCalib, **kwargs
 ) -> tuple[RobotGridCalib, list[int]]:
-    """Calls `.decollide` with a process executor."""
+    """Calls `.decollide` with a process executor.
+
+    The grid is passed to the worker process as a grid state array.
+
+    """
 
-    data = dump_robot_grid(robot_grid)
     decollided_data, collided = await run_in_executor(
         decollide,
-        data=data,
+        data=get_robot_grid_state(robot_grid),
         executor="process",
         **kwargs,
     )
@@ -405,6 +784,63 @@ async def decollide_in_executor(
     return load_robot_grid(decollided_data), collided
 
 
+def get_deadlock_seed(seed: int, attempt: int, candidate: int) -> int:
+    """Returns a reproducible seed for a deadlock resolution candidate."""
+
+    sequence = numpy.random.SeedSequence([seed, attempt, candidate])
+
+    return int(sequence.generate_state(1)[0])
+
+
+def unlock_deadlock(
+    data: GridDataType,
+    deadlocks: list[int],
+    seed: int,
+    **kwargs,
+) -> tuple[dict | numpy.ndarray, int, PathPairReturnType]:
+    """Moves a deadlocked robot to a random position and regenerates the paths.
+
+    Parameters
+    ----------
+    data
+        The grid data, in any of the formats accepted by `.load_robot_grid`,
+        with the state before path generation.
+    deadlocks
+        The list of deadlocked robots. One of them is selected at random.
+    seed
+        The seed used to select the robot to move and for the random position.
+        The same seed always produces the same result.
+    kwargs
+        Other parameters to pass to `.get_path_pair`.
+
+    Returns
+    -------
+    result
+        A tuple with the dump of the grid after the robot has been moved (a
+        dictionary if ``data`` is a dictionary, a grid state array otherwise), the
+        ID of the robot that was moved, and the result of `.get_path_pair`.
+
+    """
+
+    robot_grid = load_robot_grid(data, seed=seed)
+
+    to_move = int(numpy.random.default_rng(seed).choice(deadlocks))
+    robot = robot_grid.robotDict[to_move]
+
+    robot.setXYUniform()
+
+    # Now check if it's collided and decollide it.
+    if robot_grid.isCollided(to_move) and robot.isOffline is False:
+        robot_grid.decollideRobot(to_move)
+        if robot_grid.isCollided(to_move):
+            raise TrajectoryError(f"Cannot decollide deadlocked robot {to_move}.")
+
+    # Dump the grid before it is mangled by the path generation.
+    new_data = _dump_as(robot_grid, data)
+
+    return new_data, to_move, get_path_pair(robot_grid=robot_grid, **kwargs)
+
+
 async def unwind(
     current_positions: dict[int, tuple[float | None, float | None]],
     collision_buffer: float | None = None,
@@ -485,7 +921,7 @@ async def explode(
 def get_snapshot_async(
     path: str,
     robot_grid: Optional[RobotGridCalib] = None,
-    data: Optional[dict] = None,
+    data: Optional[GridDataType] = None,
     highlight: int | None = None,
     title: str | None = None,
 ):
@@ -498,9 +934,9 @@ def get_snapshot_async(
     robot_grid
         The Kaiju ``RobotGridCalib`` instance to plot.
     data
-        A dictionary of data that can be used to reload a Kaiju robot grid
-        using `.load_robot_grid`. This is useful if the function is being
-        run in an executor.
+        The data that can be used to reload a Kaiju robot grid using
+        `.load_robot_grid`, either as a dictionary or a grid state array. This is
+        useful if the function is being run in an executor.
     highlight
         Robot to highlight.
     title
@@ -21,7 +21,7 @@ from jaeger.can import JaegerCAN
 from jaeger.commands import CommandID
 from jaeger.commands.bootloader import GetFirmwareVersion
 from jaeger.commands.status import GetActualPosition
-from jaeger.exceptions import JaegerError, PositionerError
+from jaeger.exceptions import PositionerError
 from jaeger.utils import StatusMixIn, bytes_to_int
 
 
@@ -245,6 +245,9 @@ class Positioner(StatusMixIn):
     ) -> bool:
         """Polls the status until it reaches a certain value.
 
+        The status is polled by `.FPS.wait_for_status`, which shares a single
+        status broadcast among all the waiting positioners.
+
         Parameters
         ----------
         status
@@ -264,35 +267,15 @@ class Positioner(StatusMixIn):
 
         """
 
-        if self.is_bootloader():
-            raise JaegerError("wait_for_status cannot be scheduled in bootloader mode.")
-
-        if not isinstance(status, (list, tuple)):
-            status = [status]
-
-        async def status_waiter(wait_for_status):
-            while True:
-                await self.update_status()
-                # Check all statuses in the list
-                all_reached = True
-                for ss in wait_for_status:
-                    if ss not in self.status:
-                        all_reached = False
-                        break
-
-                if all_reached:
-                    return
-
-                await asyncio.sleep(delay)
-
-        wait_for_status = [self.flags(int(ss)) for ss in status]
-
-        try:
-            await asyncio.wait_for(status_waiter(wait_for_status), timeout)
-        except asyncio.TimeoutError:
-            return False
+        if not self.fps:
+            raise PositionerError("the positioner is not linked to a FPS instance.")
 
-        return True
+        return await self.fps.wait_for_status(
+            self.positioner_id,
+            status,
+            delay=delay,
+            timeout=timeout,
+        )
 
     async def initialise(self, disable_precise_moves=False):
         """Initialises the position watcher."""
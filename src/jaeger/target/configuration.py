@@ -8,6 +8,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
@@ -47,10 +48,13 @@ from jaeger.ieb import IEB
 from jaeger.kaiju import (
     decollide_in_executor,
     dump_robot_grid,
+    get_deadlock_seed,
     get_path_pair_in_executor,
     get_robot_grid,
+    get_robot_grid_state,
     get_snapshot_async,
     load_robot_grid,
+    unlock_deadlock,
     warn,
 )
 from jaeger.target.assignment import Assignment, BaseAssignment, ManualAssignment
@@ -460,79 +464,136 @@ class BaseConfiguration(Generic[AssignmentType]):
         n_retries: int = 5,
         path_generation_mode: str | None = None,
         force: bool = False,
+        n_candidates: int | None = None,
+        seed: int | None = None,
     ) -> list[int]:
-        """Iteratively fix deadlocks."""
+        """Iteratively fix deadlocks.
+
+        In each attempt, up to ``n_candidates`` perturbations of the grid, each one
+        moving a deadlocked robot to a random position, are evaluated in the
+        process pool, in waves of at most one candidate per worker. Work sent to
+        the pool cannot be cancelled, so all the candidates in a wave run to
+        completion, but the next wave is only submitted if none of them is
+        deadlock-free. The first deadlock-free candidate, in candidate order, is
+        kept. If all the candidates are still deadlocked, the one with the fewest
+        deadlocks is used as the starting point for the next attempt. Each
+        candidate uses a seed derived from ``seed``, the attempt, and the
+        candidate index, so the result is reproducible.
 
-        # Save the grid data in case we need to decollide.
-        grid_data = dump_robot_grid(self.robot_grid)
+        """
+
+        kaiju_config = config["kaiju"]
+        n_candidates = n_candidates or kaiju_config.get("deadlock_candidates", 4)
+        seed = seed if seed is not None else kaiju_config.get("deadlock_seed", 0)
+
+        # ProcessPoolExecutor uses os.cpu_count() workers by default.
+        n_workers = config.get("executors", {}).get("process_workers", None)
+        wave_size = min(n_candidates, n_workers or os.cpu_count() or 1)
+
+        # Save the grid state in case we need to decollide.
+        grid_state = get_robot_grid_state(self.robot_grid)
 
         attempt: int = 0
         decollided: list[int] = []
 
+        result = await get_path_pair_in_executor(
+            self.robot_grid,
+            path_generation_mode=path_generation_mode,
+        )
+
         while True:
-            result = await get_path_pair_in_executor(
-                self.robot_grid,
-                path_generation_mode=path_generation_mode,
-            )
             self.to_destination, self.from_destination, did_fail, deadlocks = result
 
             n_deadlocks = len(deadlocks)
 
-            if did_fail:
-                attempt += 1
-
-                if n_retries < 0:
-                    # n_retries == -1 means we don't want to solve for deadlocks. Fail!
-                    raise TrajectoryError(
-                        "Failed generating a valid trajectory. "
-                        f"{n_deadlocks} deadlocks were found."
-                    )
+            if not did_fail:
+                if attempt > 0:
+                    self.log("All deadlocks have been fixed.")
+                break
 
-                if attempt > n_retries:
-                    msg = (
-                        f"Attempt {attempt}: {n_deadlocks} deadlocks remain but "
-                        "the number of retries has been exhausted."
-                    )
+            attempt += 1
 
-                    if force is False:
-                        raise TrajectoryError(msg)
+            if n_retries < 0:
+                # n_retries == -1 means we don't want to solve for deadlocks. Fail!
+                raise TrajectoryError(
+                    "Failed generating a valid trajectory. "
+                    f"{n_deadlocks} deadlocks were found."
+                )
 
-                    else:
-                        self.log(msg, level=logging.WARNING, to_command=False)
+            if attempt > n_retries:
+                msg = (
+                    f"Attempt {attempt}: {n_deadlocks} deadlocks remain but "
+                    "the number of retries has been exhausted."
+                )
 
-                # Replace one of the deadlocked robots with a random new position.
-                # TODO: maybe not call setXYUniform and do a small offset.
+                if force is False:
+                    raise TrajectoryError(msg)
 
-                if attempt == 1:
-                    self.log("Deadlocks found. Attempting resolution.")
+                self.log(msg, level=logging.WARNING, to_command=False)
+                break
 
-                self.log(f"Attempt {attempt}: {n_deadlocks} deadlocks found.")
+            if attempt == 1:
+                self.log("Deadlocks found. Attempting resolution.")
 
-                to_move = numpy.random.choice(deadlocks)
-                self.log(f"Trying to unlock positioner {to_move}.", level=logging.DEBUG)
+            self.log(
+                f"Attempt {attempt}: {n_deadlocks} deadlocks found. "
+                f"Evaluating {n_candidates} candidate solutions.",
+            )
 
-                # Restore robot grid (it has been mangled by calling get_path_pair).
-                self.robot_grid = load_robot_grid(grid_data)
+            # Replace one of the deadlocked robots with a random new position.
+            # TODO: maybe not call setXYUniform and do a small offset.
+
+            candidates = []
+            for first in range(0, n_candidates, wave_size):
+                wave = range(first, min(first + wave_size, n_candidates))
+                results = await asyncio.gather(
+                    *[
+                        run_in_executor(
+                            unlock_deadlock,
+                            grid_state,
+                            deadlocks,
+                            get_deadlock_seed(seed, attempt, candidate),
+                            path_generation_mode=path_generation_mode,
+                            executor="process",
+                        )
+                        for candidate in wave
+                    ],
+                    return_exceptions=True,
+                )
 
-                # Assign new position to the random deadlocked robot.
-                self.robot_grid.robotDict[to_move].setXYUniform()
+                for candidate, candidate_data in zip(wave, results):
+                    if isinstance(candidate_data, TrajectoryError):
+                        msg = f"Candidate {candidate}: {candidate_data}"
+                        self.log(msg, level=logging.DEBUG)
+                        continue
+                    elif isinstance(candidate_data, BaseException):
+                        raise candidate_data
 
-                # Now check if it's collided and decollide it.
-                if self.robot_grid.isCollided(to_move):
-                    if self.robot_grid.robotDict[to_move].isOffline is False:
-                        self.robot_grid.decollideRobot(to_move)
-                        if self.robot_grid.isCollided(to_move):
-                            raise TrajectoryError("Cannot decollide deadlocked robot.")
+                    candidates.append(candidate_data)
 
-                if to_move not in decollided:
-                    decollided.append(to_move)
+                if any(not data[2][2] for data in candidates):
+                    break
 
-                grid_data = dump_robot_grid(self.robot_grid)
+            if len(candidates) == 0:
+                raise TrajectoryError("Cannot decollide deadlocked robot.")
 
+            # Select the first deadlock-free candidate or, if all are deadlocked,
+            # the candidate with the fewest deadlocks.
+            unlocked = [data for data in candidates if not data[2][2]]
+            if len(unlocked) > 0:
+                grid_state, to_move, result = unlocked[0]
             else:
-                if attempt > 1:
-                    self.log("All deadlocks have been fixed.")
-                break
+                grid_state, to_move, result = min(
+                    candidates,
+                    key=lambda candidate_data: len(candidate_data[2][3]),
+                )
+
+            self.log(f"Moved positioner {to_move}.", level=logging.DEBUG)
+
+            self.robot_grid = load_robot_grid(grid_state)
+
+            if to_move not in decollided:
+                decollided.append(to_move)
 
         return decollided
 
@@ -622,7 +683,7 @@ class BaseConfiguration(Generic[AssignmentType]):
 
         path = os.path.join(dirpath, f"configuration_snapshot_{mjd}_{cid}.pdf")
 
-        data = dump_robot_grid(self.robot_grid)
+        data = get_robot_grid_state(self.robot_grid)
 
         title = None
         if self.configuration_id:
@@ -1108,6 +1169,7 @@ class DitheredConfiguration(BaseConfiguration[Assignment]):
             ignore_did_fail=True,
             stop_if_deadlock=True,
             ignore_initial_collisions=True,
+            direct_max_angle=config["kaiju"].get("direct_path_max_angle"),
         )
 
         if self.to_destination is None or self.from_destination is None:
@@ -28,7 +28,7 @@ from coordio.conv import (
 )
 from coordio.defaults import INST_TO_WAVE, POSITIONER_HEIGHT, getHoleOrient
 
-from jaeger.target.tools import get_wok_data
+from jaeger.target.tools import WokGeometry, get_wok_geometry
 
 
 if TYPE_CHECKING:
@@ -183,52 +183,28 @@ def positioner_from_icrs_dataframe(
         zwok=polars.Series(wok[:, 2]),
     ).sort("positioner_id")
 
-    # Get the wok data and cast the positionerID to int32.
-    wok_data = get_wok_data(site.name)
-    wok_data = wok_data.with_columns(polars.col.positionerID.cast(polars.Int32))
-
-    # Left join with the input data so that we have one wok data entry per fibre.
-    data_to_wok = data.join(
-        wok_data,
-        how="left",
-        left_on="positioner_id",
-        right_on="positionerID",
-    )
-
-    # Create columns for the beta coordinates depending on the fibre type.
-    data_to_wok = data_to_wok.with_columns(
-        xBeta=polars.when(polars.col.fibre_type == "APOGEE")
-        .then(polars.col.apX)
-        .when(polars.col.fibre_type == "BOSS")
-        .then(polars.col.bossX)
-        .when(polars.col.fibre_type == "Metrology")
-        .then(polars.col.metX)
-        .otherwise(None),
-        yBeta=polars.when(polars.col.fibre_type == "APOGEE")
-        .then(polars.col.apY)
-        .when(polars.col.fibre_type == "BOSS")
-        .then(polars.col.bossY)
-        .when(polars.col.fibre_type == "Metrology")
-        .then(polars.col.metY)
-        .otherwise(None),
-    )
+    # Get the calibration arrays for each fibre. Positioners not in the wok data
+    # and unknown fibre types get NaN values.
+    wok_geometry = get_wok_geometry(site.name)
+    rows = wok_geometry.get_positioner_rows(data["positioner_id"].to_numpy())
+    wok_cal = wok_geometry.get_positioner_arrays(rows, data["fibre_type"].to_numpy())
 
     # Calculate alpha and beta coordinates.
     alphas, betas = wokToPositioner(
-        data_to_wok["xwok"].to_numpy(),
-        data_to_wok["ywok"].to_numpy(),
-        data_to_wok["zwok"].to_numpy(),
-        data_to_wok["xBeta"].to_numpy(),
-        data_to_wok["yBeta"].to_numpy(),
-        data_to_wok["alphaArmLen"].to_numpy(),
-        data_to_wok["alphaOffset"].to_numpy(),
-        data_to_wok["betaOffset"].to_numpy(),
-        data_to_wok[["xWok", "yWok", "zWok"]].to_numpy(),
-        data_to_wok[["ix", "iy", "iz"]].to_numpy(),
-        data_to_wok[["jx", "jy", "jz"]].to_numpy(),
-        data_to_wok[["kx", "ky", "kz"]].to_numpy(),
-        data_to_wok["dx"].to_numpy(),
-        data_to_wok["dy"].to_numpy(),
+        data["xwok"].to_numpy(),
+        data["ywok"].to_numpy(),
+        data["zwok"].to_numpy(),
+        wok_cal["xBeta"],
+        wok_cal["yBeta"],
+        wok_cal["alphaArmLen"],
+        wok_cal["alphaOffset"],
+        wok_cal["betaOffset"],
+        wok_cal["b"],
+        wok_cal["iHat"],
+        wok_cal["jHat"],
+        wok_cal["kHat"],
+        wok_cal["dx"],
+        wok_cal["dy"],
     )
 
     data = data.with_columns(
@@ -320,51 +296,27 @@ def icrs_from_positioner_dataframe(
 
     wavelength = data["wavelength"].to_numpy()
 
-    # Get the wok data and cast the positionerID to int32.
-    wok_data = get_wok_data(site.name)
-    wok_data = wok_data.with_columns(polars.col.positionerID.cast(polars.Int32))
-
-    # Left join with the input data so that we have one wok data entry per fibre.
-    data_to_wok = data.join(
-        wok_data,
-        how="left",
-        left_on="positioner_id",
-        right_on="positionerID",
-    )
-
-    # Create columns for the beta coordinates depending on the fibre type.
-    data_to_wok = data_to_wok.with_columns(
-        xBeta=polars.when(polars.col.fibre_type == "APOGEE")
-        .then(polars.col.apX)
-        .when(polars.col.fibre_type == "BOSS")
-        .then(polars.col.bossX)
-        .when(polars.col.fibre_type == "Metrology")
-        .then(polars.col.metX)
-        .otherwise(None),
-        yBeta=polars.when(polars.col.fibre_type == "APOGEE")
-        .then(polars.col.apY)
-        .when(polars.col.fibre_type == "BOSS")
-        .then(polars.col.bossY)
-        .when(polars.col.fibre_type == "Metrology")
-        .then(polars.col.metY)
-        .otherwise(None),
-    )
+    # Get the calibration arrays for each fibre. Positioners not in the wok data
+    # and unknown fibre types get NaN values.
+    wok_geometry = get_wok_geometry(site.name)
+    rows = wok_geometry.get_positioner_rows(data["positioner_id"].to_numpy())
+    wok_cal = wok_geometry.get_positioner_arrays(rows, data["fibre_type"].to_numpy())
 
     # Get the wok coordinates.
     xwok, ywok, zwok = positionerToWok(
-        data_to_wok["alpha"].to_numpy(),
-        data_to_wok["beta"].to_numpy(),
-        data_to_wok["xBeta"].to_numpy(),
-        data_to_wok["yBeta"].to_numpy(),
-        data_to_wok["alphaArmLen"].to_numpy(),
-        data_to_wok["alphaOffset"].to_numpy(),
-        data_to_wok["betaOffset"].to_numpy(),
-        data_to_wok[["xWok", "yWok", "zWok"]].to_numpy(),
-        data_to_wok[["ix", "iy", "iz"]].to_numpy(),
-        data_to_wok[["jx", "jy", "jz"]].to_numpy(),
-        data_to_wok[["kx", "ky", "kz"]].to_numpy(),
-        data_to_wok["dx"].to_numpy(),
-        data_to_wok["dy"].to_numpy(),
+        data["alpha"].to_numpy(),
+        data["beta"].to_numpy(),
+        wok_cal["xBeta"],
+        wok_cal["yBeta"],
+        wok_cal["alphaArmLen"],
+        wok_cal["alphaOffset"],
+        wok_cal["betaOffset"],
+        wok_cal["b"],
+        wok_cal["iHat"],
+        wok_cal["jHat"],
+        wok_cal["kHat"],
+        wok_cal["dx"],
+        wok_cal["dy"],
     )
 
     focal = FocalPlane(
@@ -422,7 +374,34 @@ def icrs_from_positioner_dataframe(
 def get_hole_orient(site: str, hole_id: str):
     """A cached version of ``coordio.defaults.getHoleOrient``."""
 
-    return get_hole_orient(site, hole_id)
+    return getHoleOrient(site, hole_id)
+
+
+def _get_point_calibration(
+    hole_id: str,
+    site: str,
+    fibre_type: str,
+    wok_data: polars.DataFrame | WokGeometry | None = None,
+):
+    """Returns the calibration values for a single hole and fibre type."""
+
+    if fibre_type not in WokGeometry.FIBRE_BETA_COLUMNS:
+        raise ValueError(f"Invalid fibre type {fibre_type}.")
+
+    if wok_data is None:
+        wok_geometry = get_wok_geometry(site)
+    elif isinstance(wok_data, polars.DataFrame):
+        wok_geometry = WokGeometry.from_dataframe(
+            wok_data.filter(polars.col("site") == site),
+            site,
+        )
+    else:
+        wok_geometry = wok_data
+
+    row = wok_geometry.get_hole_row(hole_id)
+    wok_cal = wok_geometry.get_positioner_arrays(numpy.array([row]), [fibre_type])
+
+    return {key: value[0] for key, value in wok_cal.items()}
 
 
 def wok_to_positioner(
@@ -432,53 +411,37 @@ def wok_to_positioner(
     xwok: float,
     ywok: float,
     zwok: float = POSITIONER_HEIGHT,
-    wok_data: polars.DataFrame | None = None,
+    wok_data: polars.DataFrame | WokGeometry | None = None,
 ) -> tuple[numpy.ndarray, numpy.ndarray]:
     """Converts from wok to positioner coordinates.
 
-    Returns arrays with the positioner and tangent coordinates.
+    Returns arrays with the positioner and tangent coordinates. ``wok_data``
+    defaults to the cached `.WokGeometry` for the site.
 
     """
 
-    if wok_data is None:
-        wok_data = get_wok_data(site)
-
-    positioner_data = wok_data.filter(
-        polars.col("holeID") == hole_id,
-        polars.col("site") == site,
-    )
-
-    hole_orient = getHoleOrient(site, hole_id)
-
-    if fibre_type == "APOGEE":
-        xBeta = positioner_data[0, "apX"]
-        yBeta = positioner_data[0, "apY"]
-    elif fibre_type == "BOSS":
-        xBeta = positioner_data[0, "bossX"]
-        yBeta = positioner_data[0, "bossY"]
-    elif fibre_type == "Metrology":
-        xBeta = positioner_data[0, "metX"]
-        yBeta = positioner_data[0, "metY"]
-    else:
-        raise ValueError(f"Invalid fibre type {fibre_type}.")
+    wok_cal = _get_point_calibration(hole_id, site, fibre_type, wok_data=wok_data)
 
     tangent = wokToTangent(
         xwok,
         ywok,
         zwok,
-        *hole_orient,
-        dx=positioner_data[0, "dx"],
-        dy=positioner_data[0, "dy"],
+        wok_cal["b"],
+        wok_cal["iHat"],
+        wok_cal["jHat"],
+        wok_cal["kHat"],
+        dx=wok_cal["dx"],
+        dy=wok_cal["dy"],
     )
 
     alpha, beta, _ = tangentToPositioner(
         tangent[0][0],
         tangent[1][0],
-        xBeta,
-        yBeta,
-        la=positioner_data[0, "alphaArmLen"],
-        alphaOffDeg=positioner_data[0, "alphaOffset"],
-        betaOffDeg=positioner_data[0, "betaOffset"],
+        wok_cal["xBeta"],
+        wok_cal["yBeta"],
+        la=wok_cal["alphaArmLen"],
+        alphaOffDeg=wok_cal["alphaOffset"],
+        betaOffDeg=wok_cal["betaOffset"],
     )
 
     return (
@@ -493,59 +456,37 @@ def positioner_to_wok(
     fibre_type: str,
     alpha: float,
     beta: float,
-    wok_data: polars.DataFrame | None = None,
+    wok_data: polars.DataFrame | WokGeometry | None = None,
 ):
     """Convert from positioner to wok coordinates.
 
-    Returns xyz wok and tangent coordinates as a tuple of arrays.
+    Returns xyz wok and tangent coordinates as a tuple of arrays. ``wok_data``
+    defaults to the cached `.WokGeometry` for the site.
 
     """
 
-    if wok_data is None:
-        wok_data = get_wok_data(site)
-
-    positioner_data = wok_data.filter(
-        polars.col("holeID") == hole_id,
-        polars.col("site") == site,
-    )
-
-    b = positioner_data[0, ["xWok", "yWok", "zWok"]]
-    iHat = positioner_data[0, ["ix", "iy", "iz"]]
-    jHat = positioner_data[0, ["jx", "jy", "jz"]]
-    kHat = positioner_data[0, ["kx", "ky", "kz"]]
-
-    if fibre_type == "APOGEE":
-        xBeta = positioner_data[0, "apX"]
-        yBeta = positioner_data[0, "apY"]
-    elif fibre_type == "BOSS":
-        xBeta = positioner_data[0, "bossX"]
-        yBeta = positioner_data[0, "bossY"]
-    elif fibre_type == "Metrology":
-        xBeta = positioner_data[0, "metX"]
-        yBeta = positioner_data[0, "metY"]
-    else:
-        raise ValueError(f"Invlid fibre type {fibre_type}.")
+    wok_cal = _get_point_calibration(hole_id, site, fibre_type, wok_data=wok_data)
 
     tangent = positionerToTangent(
         alpha,
         beta,
-        xBeta,
-        yBeta,
-        la=positioner_data[0, "alphaArmLen"],
-        alphaOffDeg=positioner_data[0, "alphaOffset"],
-        betaOffDeg=positioner_data[0, "betaOffset"],
+        wok_cal["xBeta"],
+        wok_cal["yBeta"],
+        la=wok_cal["alphaArmLen"],
+        alphaOffDeg=wok_cal["alphaOffset"],
+        betaOffDeg=wok_cal["betaOffset"],
     )
 
     wok = tangentToWok(
         tangent[0],
         tangent[1],
         0,
-        b,
-        iHat,
-        jHat,
-        kHat,
-        dx=positioner_data[0, "dx"],
-        dy=positioner_data[0, "dy"],
+        wok_cal["b"],
+        wok_cal["iHat"],
+        wok_cal["jHat"],
+        wok_cal["kHat"],
+        dx=wok_cal["dx"],
+        dy=wok_cal["dy"],
     )
 
     wok_coords = numpy.array(wok)
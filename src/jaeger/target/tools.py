@@ -34,8 +34,10 @@ from jaeger.kaiju import (
     decollide_in_executor,
     get_path_pair_in_executor,
     get_robot_grid,
+    get_robot_grid_template,
 )
 from jaeger.target.schemas import CONFIGURATION_SCHEMA, CONFSUMMARY_FIBER_MAP_SCHEMA
+from jaeger.utils import shutdown_executors
 
 
 if TYPE_CHECKING:
@@ -45,6 +47,10 @@ if TYPE_CHECKING:
 
 __all__ = [
     "get_wok_data",
+    "WokGeometry",
+    "get_wok_geometry",
+    "preload_wok_geometry",
+    "set_positioner_table",
     "copy_summary_file",
     "read_confSummary",
     "get_fibermap_table",
@@ -93,6 +99,193 @@ def get_wok_data(observatory: str):
     return wok_data.filter(polars.col("site") == observatory).sort("holeID")
 
 
+class WokGeometry:
+    """Array-backed wok calibration data with indexed lookups.
+
+    Each column of the wok data is stored as a numpy array and rows can be
+    retrieved by positioner or hole ID in constant time. Instances only contain
+    numpy arrays and dictionaries so they are cheap to pickle and send to worker
+    processes.
+
+    Parameters
+    ----------
+    observatory
+        The observatory to which the wok data corresponds.
+    columns
+        A mapping of column name to array. All the arrays must have the same length
+        and include at least the ``positionerID`` and ``holeID`` columns.
+
+    """
+
+    #: Columns with the beta arm coordinates of each fibre type.
+    FIBRE_BETA_COLUMNS = {
+        "APOGEE": ("apX", "apY"),
+        "BOSS": ("bossX", "bossY"),
+        "Metrology": ("metX", "metY"),
+    }
+
+    def __init__(self, observatory: str, columns: Mapping[str, numpy.ndarray]):
+        self.observatory = observatory
+        self.columns = {name: numpy.asarray(values) for name, values in columns.items()}
+
+        if len(set(len(values) for values in self.columns.values())) > 1:
+            raise ValueError("All columns must have the same length.")
+
+        self.positioner_index = {
+            int(pid): row for row, pid in enumerate(self.columns["positionerID"])
+        }
+        self.hole_index = {
+            str(hole_id): row for row, hole_id in enumerate(self.columns["holeID"])
+        }
+
+    @classmethod
+    def from_dataframe(cls, data: polars.DataFrame, observatory: str | None = None):
+        """Creates an instance from a wok data frame (see `.get_wok_data`)."""
+
+        if observatory is None:
+            observatory = data["site"][0]
+
+        columns = {name: data[name].to_numpy() for name in data.columns}
+
+        return cls(str(observatory), columns)
+
+    def __len__(self):
+        return len(self.columns["holeID"])
+
+    def __getitem__(self, column: str) -> numpy.ndarray:
+        return self.columns[column]
+
+    def get_hole_row(self, hole_id: str) -> int:
+        """Returns the row index for a hole ID."""
+
+        if hole_id not in self.hole_index:
+            raise ValueError(f"Hole {hole_id} not in the {self.observatory} wok data.")
+
+        return self.hole_index[hole_id]
+
+    def get_hole_rows(self, hole_ids) -> numpy.ndarray:
+        """Returns the row indices for a list of hole IDs.
+
+        Holes that are not in the wok data get a row index of -1.
+
+        """
+
+        return numpy.array(
+            [self.hole_index.get(str(hole_id), -1) for hole_id in hole_ids],
+            dtype=numpy.int64,
+        )
+
+    def get_positioner_rows(self, positioner_ids) -> numpy.ndarray:
+        """Returns the row indices for a list of positioner IDs.
+
+        Positioners that are not in the wok data get a row index of -1.
+
+        """
+
+        return numpy.array(
+            [self.positioner_index.get(int(pid), -1) for pid in positioner_ids],
+            dtype=numpy.int64,
+        )
+
+    def get_positioner_arrays(
+        self,
+        rows: numpy.ndarray,
+        fibre_types,
+    ) -> dict[str, numpy.ndarray]:
+        """Returns the calibration arrays for converting to/from positioner coordinates.
+
+        Parameters
+        ----------
+        rows
+            The row indices, for example from `.get_positioner_rows` or
+            `.get_hole_rows`. Rows with index -1 are filled with NaN values.
+        fibre_types
+            The fibre type for each row. Used to select the beta arm coordinates.
+            Unknown fibre types are filled with NaN values.
+
+        Returns
+        -------
+        arrays
+            A dictionary with the ``xBeta``, ``yBeta``, ``alphaArmLen``,
+            ``alphaOffset``, ``betaOffset``, ``dx``, and ``dy`` arrays, and the
+            ``b``, ``iHat``, ``jHat``, and ``kHat`` arrays with shape ``(N, 3)``.
+
+        """
+
+        rows = numpy.asarray(rows, dtype=numpy.int64)
+        fibre_types = numpy.asarray(fibre_types)
+        valid = rows >= 0
+
+        def take(*names: str):
+            values = numpy.column_stack([self.columns[name][rows] for name in names])
+            values = values.astype(numpy.float64)
+            values[~valid] = numpy.nan
+            return values if len(names) > 1 else values[:, 0]
+
+        x_beta = numpy.full(len(rows), numpy.nan)
+        y_beta = numpy.full(len(rows), numpy.nan)
+        for fibre_type, (x_col, y_col) in self.FIBRE_BETA_COLUMNS.items():
+            mask = valid & (fibre_types == fibre_type)
+            x_beta[mask] = self.columns[x_col][rows[mask]]
+            y_beta[mask] = self.columns[y_col][rows[mask]]
+
+        return {
+            "xBeta": x_beta,
+            "yBeta": y_beta,
+            "alphaArmLen": take("alphaArmLen"),
+            "alphaOffset": take("alphaOffset"),
+            "betaOffset": take("betaOffset"),
+            "b": take("xWok", "yWok", "zWok"),
+            "iHat": take("ix", "iy", "iz"),
+            "jHat": take("jx", "jy", "jz"),
+            "kHat": take("kx", "ky", "kz"),
+            "dx": take("dx"),
+            "dy": take("dy"),
+        }
+
+
+@cache
+def get_wok_geometry(observatory: str) -> WokGeometry:
+    """Returns a cached `.WokGeometry` instance for an observatory.
+
+    The cache must be cleared along with that of `.get_wok_data` if the
+    calibration tables change.
+
+    """
+
+    return WokGeometry.from_dataframe(get_wok_data(observatory), observatory)
+
+
+def preload_wok_geometry(observatory: str | None = None):
+    """Loads the wok geometry into the cache.
+
+    Used to warm up the worker processes of the process pool executor.
+
+    """
+
+    observatory = observatory or config["observatory"]
+    if observatory in ["APO", "LCO"]:
+        get_wok_geometry(observatory)
+
+
+def set_positioner_table(positioner_table):
+    """Replaces the ``coordio`` positioner table and clears the dependent caches.
+
+    The process pool workers keep the calibration tables and the caches they
+    loaded on start, so the executors are shut down and new workers are started
+    with the new table the next time they are used.
+
+    """
+
+    calibration.positionerTable = positioner_table
+
+    get_wok_data.cache_clear()
+    get_wok_geometry.cache_clear()
+    get_robot_grid_template.cache_clear()
+
+    shutdown_executors()
+
+
 async def create_random_configuration(
     fps: FPS,
     seed: int | None = None,
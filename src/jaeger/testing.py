@@ -149,6 +149,10 @@ class VirtualPositioner(StatusMixIn):
 
         self.number_trajectories = 1
 
+        # The trajectory being received, as lists of (angle, time) in steps.
+        self.trajectory: dict[str, list[tuple[int, int]]] | None = None
+        self._trajectory_n_points = (0, 0)
+
         self.bus = bus
 
         StatusMixIn.__init__(
@@ -232,11 +236,69 @@ class VirtualPositioner(StatusMixIn):
         elif command_id == CommandID.SEND_FIRMWARE_DATA:
             asyncio.create_task(self.process_firmware_data(uid, msg.data))
 
+        elif command_id == CommandID.SEND_NEW_TRAJECTORY:
+            n_alpha = utils.bytes_to_int(msg.data[0:4])
+            n_beta = utils.bytes_to_int(msg.data[4:8])
+
+            self.trajectory = {"alpha": [], "beta": []}
+            self._trajectory_n_points = (n_alpha, n_beta)
+
+            self.reply(command_id, uid)
+
+        elif command_id == CommandID.SEND_TRAJECTORY_DATA:
+            self.process_trajectory_data(uid, msg.data)
+
+        elif command_id == CommandID.TRAJECTORY_DATA_END:
+            n_received = (
+                (len(self.trajectory["alpha"]), len(self.trajectory["beta"]))
+                if self.trajectory is not None
+                else None
+            )
+
+            if n_received != self._trajectory_n_points:
+                self.reply(
+                    command_id,
+                    uid,
+                    response_code=ResponseCode.INVALID_TRAJECTORY,
+                )
+                return
+
+            self.reply(command_id, uid)
+
+        elif command_id == CommandID.SEND_TRAJECTORY_ABORT:
+            self.trajectory = None
+            self.reply(command_id, uid)
+
         else:
             # Should be a valid command or CommandID(command_id) would
             # have failed. Just return OK.
             self.reply(command_id, uid)
 
+    def process_trajectory_data(self, uid, data):
+        """Stores a trajectory point. Alpha points are received before beta."""
+
+        command_id = CommandID.SEND_TRAJECTORY_DATA
+
+        if self.trajectory is None:
+            self.reply(command_id, uid, response_code=ResponseCode.INVALID_TRAJECTORY)
+            return
+
+        n_alpha, n_beta = self._trajectory_n_points
+
+        if len(self.trajectory["alpha"]) < n_alpha:
+            arm = "alpha"
+        elif len(self.trajectory["beta"]) < n_beta:
+            arm = "beta"
+        else:
+            self.reply(command_id, uid, response_code=ResponseCode.INVALID_TRAJECTORY)
+            return
+
+        angle = utils.bytes_to_int(data[0:4], dtype="i4")
+        time_steps = utils.bytes_to_int(data[4:8], dtype="i4")
+        self.trajectory[arm].append((angle, time_steps))
+
+        self.reply(command_id, uid)
+
     def reply(self, command_id, uid, response_code=None, data=None):
         response_code = response_code or ResponseCode.COMMAND_ACCEPTED
 
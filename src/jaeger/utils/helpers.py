@@ -11,16 +11,18 @@ from __future__ import annotations
 import asyncio
 import concurrent.futures
 import enum
+import importlib
 import logging
 import warnings
 from concurrent.futures import Executor
+from concurrent.futures.process import BrokenProcessPool
 from contextlib import suppress
 from functools import partial
-from threading import Thread
+from threading import Lock, Thread
 
 from typing import TYPE_CHECKING, Callable, Generic, Optional, Type, TypeVar
 
-from jaeger import log
+from jaeger import config, log
 
 
 if TYPE_CHECKING:
@@ -34,6 +36,8 @@ __all__ = [
     "PollerList",
     "Poller",
     "AsyncioExecutor",
+    "get_executor",
+    "shutdown_executors",
     "run_in_executor",
     "BaseBot",
 ]
@@ -276,6 +280,12 @@ class PollerList(list):
 class Poller(object):
     """A task that runs a callback periodically.
 
+    The callback is scheduled on absolute deadlines so that the period does not
+    drift by the time the callback takes to run. If the callback takes longer
+    than the delay, the missed ticks are skipped and the overrun is logged. A
+    warning is issued at most once every ``overrun_warning_interval`` seconds;
+    other overruns are logged at debug level.
+
     Parameters
     ----------
     name : str
@@ -284,16 +294,37 @@ class Poller(object):
         A function or coroutine to call periodically.
     delay : float
         Initial delay between calls to the callback.
+    clock : function
+        A function that returns the current time in seconds. Defaults to the
+        event loop clock.
+    sleep : coroutine
+        A coroutine used to wait a number of seconds. Defaults to `asyncio.sleep`.
+        Mostly useful, with ``clock``, to test the poller with a controlled clock.
 
     """
 
-    def __init__(self, name, callback, delay=1.0):
+    #: Minimum time, in seconds, between two overrun warnings.
+    overrun_warning_interval: float = 60.0
+
+    def __init__(self, name, callback, delay=1.0, clock=None, sleep=None):
         self.name = name
         self.callback = callback
 
         self._orig_delay = delay
         self.delay = delay
 
+        self.clock: Callable[[], float] | None = clock
+        self.sleep = sleep or asyncio.sleep
+
+        #: Number of times the callback took longer than the delay.
+        self.overruns = 0
+
+        #: Number of ticks skipped because of overruns.
+        self.missed_ticks = 0
+
+        self._last_overrun_warning: float | None = None
+        self._overruns_at_last_warning = 0
+
         # Create two tasks, one for the sleep timer and another for the poller
         # itself. We do this because we want to be able to cancell the sleep
         # coroutine if we are going to change the delay.
@@ -306,6 +337,10 @@ class Poller(object):
         if self._task is None:
             raise RuntimeError("Task is not running.")
 
+        clock = self.clock or asyncio.get_running_loop().time
+
+        next_tick = clock()
+
         while True:
             try:
                 if asyncio.iscoroutinefunction(self.callback):
@@ -320,7 +355,38 @@ class Poller(object):
                         {"message": "failed running callback", "exception": ee}
                     )
 
-            self._sleep_task = asyncio.create_task(asyncio.sleep(self.delay))
+            now = clock()
+            next_tick += self.delay
+
+            if now > next_tick:
+                missed = int((now - next_tick) // self.delay) + 1
+                next_tick += missed * self.delay
+
+                self.overruns += 1
+                self.missed_ticks += missed
+
+                message = (
+                    f"Poller {self.name}: callback overran the delay of "
+                    f"{self.delay} s. Skipping {missed} tick(s)."
+                )
+
+                last_warning = self._last_overrun_warning
+                if (
+                    last_warning is None
+                    or now - last_warning >= self.overrun_warning_interval
+                ):
+                    n_since = self.overruns - self._overruns_at_last_warning - 1
+                    if last_warning is not None and n_since > 0:
+                        message += f" {n_since} overrun(s) since the last warning."
+
+                    log.warning(message)
+
+                    self._last_overrun_warning = now
+                    self._overruns_at_last_warning = self.overruns
+                else:
+                    log.debug(message)
+
+            self._sleep_task = asyncio.create_task(self.sleep(next_tick - now))
 
             await self._sleep_task
 
@@ -443,9 +509,106 @@ class AsyncioExecutor(Executor):
             self._thread.join()
 
 
+# Long-lived executors used by run_in_executor, created lazily by get_executor.
+_EXECUTORS: dict[str, Executor] = {}
+_EXECUTORS_LOCK = Lock()
+
+
+def _preload_modules(modules: list[str]):
+    """Imports modules in a worker process so that they are ready for the tasks.
+
+    Entries in the form ``module:function`` import the module and then call the
+    function without arguments, which can be used to warm up caches.
+
+    """
+
+    for entry in modules:
+        module, _, function = entry.partition(":")
+        try:
+            imported = importlib.import_module(module)
+        except ImportError:
+            continue
+
+        if function:
+            # An exception in the initializer would break the pool, so a failed
+            # warm up is ignored and the cache is filled by the first task instead.
+            with suppress(Exception):
+                getattr(imported, function)()
+
+
+def get_executor(executor: str = "thread") -> Executor:
+    """Returns a long-lived executor, creating it if needed.
+
+    The number of workers and the modules that process workers import on start
+    are defined in the ``executors`` section of the configuration. If
+    ``thread_workers`` is `None` the thread pool uses the `~concurrent.futures`
+    default, ``min(32, os.cpu_count() + 4)``; all the `.run_in_executor` calls
+    share that pool and queue once all the workers are busy.
+
+    Process workers are reused between calls and keep any process-global state,
+    including the modules and caches loaded by ``preload_modules`` and the
+    ``coordio`` calibration tables. Any code that changes that state in the
+    parent process (for example replacing a calibration table) must call
+    `.shutdown_executors` so that new workers are started with the new state.
+
+    Parameters
+    ----------
+    executor
+        Either ``'thread'`` or ``'process'``.
+
+    """
+
+    if executor not in ["thread", "process"]:
+        raise ValueError("Invalid executor name.")
+
+    with _EXECUTORS_LOCK:
+        if executor in _EXECUTORS:
+            return _EXECUTORS[executor]
+
+        executors_config = config.get("executors", {})
+
+        if executor == "thread":
+            pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=executors_config.get("thread_workers", None),
+                thread_name_prefix="jaeger",
+            )
+        else:
+            pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=executors_config.get("process_workers", None),
+                initializer=_preload_modules,
+                initargs=(executors_config.get("preload_modules", []),),
+            )
+
+        _EXECUTORS[executor] = pool
+
+        return pool
+
+
+def shutdown_executors(wait: bool = False):
+    """Shuts down the executors created by `.get_executor`.
+
+    Pending tasks that have not started are cancelled. New executors will be
+    created if `.run_in_executor` is called again. This must be called after
+    changing process-global state that the process workers depend on, such as
+    the calibration tables.
+
+    """
+
+    with _EXECUTORS_LOCK:
+        executors = list(_EXECUTORS.values())
+        _EXECUTORS.clear()
+
+    for pool in executors:
+        pool.shutdown(wait=wait, cancel_futures=True)
+
+
 async def run_in_executor(fn, *args, catch_warnings=False, executor="thread", **kwargs):
     """Runs a function in an executor.
 
+    The function runs in a long-lived thread or process pool (see
+    `.get_executor`) so that the cost of starting the workers and importing
+    modules is only paid once.
+
     In addition to streamlining the use of the executor, this function
     catches any warning issued during the execution and reissues them
     after the executor is done. This is important when using the
@@ -459,24 +622,27 @@ async def run_in_executor(fn, *args, catch_warnings=False, executor="thread", **
 
     fn = partial(fn, *args, **kwargs)
 
-    if executor == "thread":
-        executor = concurrent.futures.ThreadPoolExecutor
-    elif executor == "process":
-        executor = concurrent.futures.ProcessPoolExecutor
-    else:
-        raise ValueError("Invalid executor name.")
+    pool = get_executor(executor)
+    loop = asyncio.get_running_loop()
 
-    if catch_warnings:
-        with warnings.catch_warnings(record=True) as records:
-            with executor() as pool:
-                result = await asyncio.get_event_loop().run_in_executor(pool, fn)
+    try:
+        if catch_warnings:
+            with warnings.catch_warnings(record=True) as records:
+                result = await loop.run_in_executor(pool, fn)
 
-        for ww in records:
-            warnings.warn(ww.message, ww.category)
+            for ww in records:
+                warnings.warn(ww.message, ww.category)
 
-    else:
-        with executor() as pool:
-            result = await asyncio.get_running_loop().run_in_executor(pool, fn)
+        else:
+            result = await loop.run_in_executor(pool, fn)
+
+    except BrokenProcessPool:
+        # A worker died. Discard the pool so that a new one is created next time.
+        with _EXECUTORS_LOCK:
+            if _EXECUTORS.get(executor) is pool:
+                del _EXECUTORS[executor]
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
 
     return result
 
@@ -32,6 +32,20 @@ __all__ = [
 
 MOTOR_STEPS = config["positioner"]["motor_steps"]
 
+# Layout of the 29-bit extended identifier, from the lowest bits: response
+# code (4 bits), UID (6 bits), command ID (8 bits), and positioner ID (11 bits).
+_UID_SHIFT = 4
+_COMMAND_ID_SHIFT = 10
+_POSITIONER_ID_SHIFT = 18
+
+_RESPONSE_CODE_MASK = (1 << 4) - 1
+_UID_MASK = (1 << 6) - 1
+_COMMAND_ID_MASK = (1 << 8) - 1
+_POSITIONER_ID_MASK = (1 << 11) - 1
+
+# Precomputed response code flags, indexed by value.
+_RESPONSE_CODES = tuple(ResponseCode(value) for value in range(16))
+
 
 def get_dtype_str(dtype, byteorder="little"):
     """Parses dtype and byte order to return a type string code.
@@ -189,22 +203,27 @@ def get_identifier(positioner_id, command_id, uid=0, response_code=0):
     ::
 
         >>> get_identifier(5, 17, uid=5)
-        1328128
-        >>> bin(1328128)
-        '0b101000100010000000000'
+        1328208
+        >>> bin(1328208)
+        '0b101000100010001010000'
 
     """
 
-    posid_bin = format(positioner_id, "011b")
-    cid_bin = format(command_id, "08b")
-    cuid_bin = format(uid, "06b")
-    response_bin = format(int(response_code), "04b")
-
-    identifier = posid_bin + cid_bin + cuid_bin + response_bin
+    response_code = int(response_code)
 
-    assert len(identifier) == 29
+    assert (
+        0 <= positioner_id <= _POSITIONER_ID_MASK
+        and 0 <= command_id <= _COMMAND_ID_MASK
+        and 0 <= uid <= _UID_MASK
+        and 0 <= response_code <= _RESPONSE_CODE_MASK
+    ), "identifier components out of range."
 
-    return int(identifier, 2)
+    return (
+        (positioner_id << _POSITIONER_ID_SHIFT)
+        | (command_id << _COMMAND_ID_SHIFT)
+        | (uid << _UID_SHIFT)
+        | response_code
+    )
 
 
 def parse_identifier(identifier: int) -> Tuple[int, int, int, ResponseCode]:
@@ -231,27 +250,19 @@ def parse_identifier(identifier: int) -> Tuple[int, int, int, ResponseCode]:
     --------
     ::
 
-        >>> parse_identifier(1315072)
-        (5, 17, <ResponseCode.COMMAND_ACCEPTED: 0>)
-        >>> parse_identifier(1315074)
-        (5, 17, <ResponseCode.INVALID_TRAJECTORY: 2>)
+        >>> parse_identifier(1328208)
+        (5, 17, 5, <ResponseCode.COMMAND_ACCEPTED: 0>)
+        >>> parse_identifier(1328210)
+        (5, 17, 5, <ResponseCode.INVALID_TRAJECTORY: 2>)
 
     """
 
-    def last(k, n):
-        return (k) & ((1 << (n)) - 1)
-
-    def mid(k, m, n):
-        return last((k) >> (m), ((n) - (m)))
-
-    positioner_id = mid(identifier, 18, 29)
-    command_id = mid(identifier, 10, 18)
-    command_uid = mid(identifier, 4, 10)
-    response_code = mid(identifier, 0, 4)
-
-    response_flag = ResponseCode(response_code)
-
-    return positioner_id, command_id, command_uid, response_flag
+    return (
+        (identifier >> _POSITIONER_ID_SHIFT) & _POSITIONER_ID_MASK,
+        (identifier >> _COMMAND_ID_SHIFT) & _COMMAND_ID_MASK,
+        (identifier >> _UID_SHIFT) & _UID_MASK,
+        _RESPONSE_CODES[identifier & _RESPONSE_CODE_MASK],
+    )
 
 
 def motor_steps_to_angle(alpha, beta, motor_steps=None, inverse=False):
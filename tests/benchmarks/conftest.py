@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-16
+# @Filename: conftest.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import json
+import os
+import pathlib
+import platform
+import time
+
+import pytest
+
+import jaeger
+
+
+N_POSITIONERS = 500
+
+
+@pytest.fixture(scope="session")
+def benchmark_results():
+    """Collects the benchmark results for the session.
+
+    If ``JAEGER_BENCHMARKS_OUTPUT`` is set, the results are written to that path
+    as JSON at the end of the session. The file can then be passed as
+    ``JAEGER_BENCHMARKS_BASELINE`` in a later run to catch regressions.
+
+    """
+
+    results: dict[str, dict] = {}
+
+    yield results
+
+    output = os.environ.get("JAEGER_BENCHMARKS_OUTPUT", None)
+    if output and len(results) > 0:
+        data = {
+            "jaeger_version": jaeger.__version__,
+            "python_version": platform.python_version(),
+            "platform": platform.platform(),
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "results": results,
+        }
+
+        path = pathlib.Path(output)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data, indent=2))
+
+
+@pytest.fixture(scope="session")
+def benchmark_baseline() -> dict[str, dict]:
+    """Loads the baseline results from ``JAEGER_BENCHMARKS_BASELINE``."""
+
+    baseline = os.environ.get("JAEGER_BENCHMARKS_BASELINE", None)
+    if not baseline:
+        return {}
+
+    return json.loads(pathlib.Path(baseline).read_text())["results"]
+
+
+@pytest.fixture
+def record_benchmark(benchmark_results, benchmark_baseline):
+    """Records a benchmark value and compares it with the baseline.
+
+    All the values are timings or per-item costs so lower is better. The test
+    fails if the value is larger than the baseline value times
+    ``JAEGER_BENCHMARKS_TOLERANCE`` (defaults to 1.5).
+
+    """
+
+    tolerance = float(os.environ.get("JAEGER_BENCHMARKS_TOLERANCE", 1.5))
+
+    def _record(name: str, value: float, unit: str = "s"):
+        benchmark_results[name] = {"value": value, "unit": unit}
+        print(f"{name}: {value:.6g} {unit}")
+
+        if name in benchmark_baseline:
+            reference = benchmark_baseline[name]["value"]
+            if value > reference * tolerance:
+                pytest.fail(
+                    f"Benchmark {name!r} regressed: {value:.6g} {unit} "
+                    f"(baseline {reference:.6g} {unit})."
+                )
+
+    return _record
+
+
+@pytest.fixture
+async def vfps_full(vfps, monkeypatch: pytest.MonkeyPatch):
+    """A virtual FPS with a full focal plane of initialised positioners."""
+
+    # Give the virtual positioners time to reply to the broadcasts.
+    monkeypatch.setitem(jaeger.config["fps"], "initialise_timeouts", 1.0)
+
+    for pid in range(1, N_POSITIONERS + 1):
+        vfps.add_virtual_positioner(pid)
+
+    await vfps.initialise()
+    assert len(vfps) == N_POSITIONERS
+
+    yield vfps
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-16
+# @Filename: test_can_benchmarks.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+import asyncio
+import time
+
+import numpy
+import pytest
+
+from .conftest import N_POSITIONERS
+
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.asyncio]
+
+
+def add_positioners(vfps, n_positioners: int):
+    """Adds virtual positioners to the FPS without a full initialisation."""
+
+    for pid in range(1, n_positioners + 1):
+        vfps.add_virtual_positioner(pid)
+        if pid not in vfps:
+            vfps.add_positioner(pid)
+
+    return list(range(1, n_positioners + 1))
+
+
+async def test_reply_routing_cost(vfps, record_benchmark):
+    """Checks that the per-reply cost does not grow with the number of positioners.
+
+    The command is sent point-to-point to each positioner so that there are as many
+    entries in the running commands table as positioners.
+
+    """
+
+    per_reply = {}
+
+    for n_positioners in [50, 100, 250, 500]:
+        pids = add_positioners(vfps, n_positioners)
+
+        # Warm up the UID pools and the command classes.
+        await vfps.send_command("GET_STATUS", positioner_ids=pids)
+
+        t0 = time.perf_counter()
+        for _ in range(5):
+            command = await vfps.send_command("GET_STATUS", positioner_ids=pids)
+            assert len(command.replies) == n_positioners
+        elapsed = time.perf_counter() - t0
+
+        per_reply[n_positioners] = elapsed / (5 * n_positioners)
+
+        # The table must be empty once all the commands are done. The entries are
+        # removed in a done callback so we need to give the loop a chance to run.
+        await asyncio.sleep(0)
+        assert len(vfps.can.running_commands) == 0
+
+    for n_positioners, value in per_reply.items():
+        record_benchmark(f"can.reply_routing.{n_positioners}", value, "s/reply")
+
+    assert per_reply[500] < 3 * per_reply[50]
+
+
+async def test_command_latency(vfps_full, record_benchmark):
+    """Measures the round-trip time of point-to-point commands sent one at a time."""
+
+    latencies = []
+    for ii in range(200):
+        pid = ii % N_POSITIONERS + 1
+
+        t0 = time.perf_counter()
+        command = await vfps_full.send_command("GET_STATUS", positioner_ids=pid)
+        latencies.append(time.perf_counter() - t0)
+
+        assert command.status.is_done and not command.status.failed
+
+    record_benchmark("can.command_latency.median", float(numpy.median(latencies)))
+    record_benchmark("can.command_latency.p95", float(numpy.percentile(latencies, 95)))
+
+
+async def test_command_throughput(vfps_full, record_benchmark):
+    """Measures the throughput of concurrent point-to-point commands."""
+
+    pids = list(vfps_full.positioners)
+
+    t0 = time.perf_counter()
+    commands = await asyncio.gather(
+        *[vfps_full.send_command("GET_STATUS", positioner_ids=pid) for pid in pids]
+    )
+    elapsed = time.perf_counter() - t0
+
+    assert not any(command.status.failed for command in commands)
+
+    record_benchmark("can.command_throughput", elapsed / len(pids), "s/command")
+
+
+async def test_broadcast_completion(vfps_full, record_benchmark):
+    """Measures the time until a broadcast has received all the replies."""
+
+    elapsed = []
+    for _ in range(10):
+        t0 = time.perf_counter()
+        command = await vfps_full.send_command(
+            "GET_STATUS",
+            positioner_ids=0,
+            n_positioners=N_POSITIONERS,
+            timeout=5,
+        )
+        elapsed.append(time.perf_counter() - t0)
+
+        assert len(command.replies) == N_POSITIONERS
+
+    record_benchmark("can.broadcast_completion.median", float(numpy.median(elapsed)))
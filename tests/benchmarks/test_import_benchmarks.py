@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-16
+# @Filename: test_import_benchmarks.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+
+pytestmark = [pytest.mark.benchmark]
+
+
+# Maximum cumulative time, in seconds, that "import jaeger" may take.
+IMPORT_TIME_BUDGET = 1.5
+
+
+def get_import_time(module: str) -> float:
+    """Returns the cumulative import time of ``module``, as reported by Python.
+
+    The module is imported in a new interpreter with ``-X importtime``, which
+    measures the time spent importing the module and its dependencies, excluding
+    the interpreter startup. The best of three runs is returned to reduce the
+    noise from the file system cache.
+
+    """
+
+    times: list[float] = []
+
+    for _ in range(3):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        # Each line is "import time: <self> | <cumulative> | <module>", in us.
+        for line in process.stderr.splitlines():
+            fields = line.removeprefix("import time:").split("|")
+            if len(fields) == 3 and fields[2].strip() == module:
+                times.append(int(fields[1]) / 1e6)
+                break
+        else:
+            raise RuntimeError(f"Cannot find the import time of {module}.")
+
+    return min(times)
+
+
+def test_benchmark_import_time(record_benchmark):
+    import_time = get_import_time("jaeger")
+    fps_import_time = get_import_time("jaeger.fps")
+
+    record_benchmark("import_jaeger", import_time)
+
+    assert import_time < IMPORT_TIME_BUDGET, (
+        f"'import jaeger' took {import_time:.2f} s (budget {IMPORT_TIME_BUDGET} s)."
+    )
+
+    # Independently of the machine, importing the package must be much cheaper
+    # than importing the FPS and the CAN stack.
+    assert import_time < 0.5 * fps_import_time
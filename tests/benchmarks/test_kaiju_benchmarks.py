@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-16
+# @Filename: test_kaiju_benchmarks.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+import pickle
+import timeit
+
+import pytest
+
+from jaeger.kaiju import dump_robot_grid, get_robot_grid, get_robot_grid_state
+
+
+pytestmark = [pytest.mark.benchmark]
+
+
+N_CALLS = 200
+
+
+def test_benchmark_robot_grid_serialisation(record_benchmark):
+    """Compares the cost of sending a robot grid to a worker.
+
+    The grid is sent as a pickled dictionary or as a pickled state array.
+
+    Only the serialisation is measured. Creating the grid in the worker has the
+    same cost in all cases.
+
+    """
+
+    robot_grid = get_robot_grid(None, seed=42)
+    for robot in robot_grid.robotDict.values():
+        robot.setXYUniform()
+
+    n_robots = len(robot_grid.robotDict)
+    assert n_robots >= 500
+
+    def send_dict():
+        return pickle.loads(pickle.dumps(dump_robot_grid(robot_grid)))
+
+    def send_state():
+        return pickle.loads(pickle.dumps(get_robot_grid_state(robot_grid)))
+
+    dict_time = timeit.timeit(send_dict, number=N_CALLS) / N_CALLS
+    state_time = timeit.timeit(send_state, number=N_CALLS) / N_CALLS
+
+    dict_size = len(pickle.dumps(dump_robot_grid(robot_grid)))
+    state_size = get_robot_grid_state(robot_grid).nbytes
+
+    print(f"Robot grid with {n_robots} robots.")
+    print(f"dict: {dict_size} bytes, state array: {state_size} bytes.")
+
+    record_benchmark("robot_grid_dict_serialisation", dict_time)
+    record_benchmark("robot_grid_state_serialisation", state_time)
+
+    assert state_size < dict_size
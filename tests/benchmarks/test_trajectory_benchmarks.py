@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-16
+# @Filename: test_trajectory_benchmarks.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+import time
+
+import numpy
+import pytest
+
+from jaeger.commands.trajectory import Trajectory
+
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.asyncio]
+
+
+def make_trajectories(positioner_ids, n_points: int = 30):
+    """Returns a simple trajectory with ``n_points`` per arm for each positioner."""
+
+    times = numpy.linspace(0.5, 15.0, n_points)
+
+    return {
+        pid: {
+            "alpha": [(10.0 + tt, tt) for tt in times],
+            "beta": [(170.0 - tt, tt) for tt in times],
+        }
+        for pid in positioner_ids
+    }
+
+
+async def test_trajectory_upload(vfps_full, record_benchmark):
+    """Measures the time to upload a trajectory to a full focal plane."""
+
+    trajectory = Trajectory(vfps_full, make_trajectories(vfps_full.positioners))
+
+    t0 = time.perf_counter()
+    await trajectory.send()
+    elapsed = time.perf_counter() - t0
+
+    assert trajectory.failed is False
+    assert trajectory.data_send_time is not None
+
+    record_benchmark("trajectory.upload.total", elapsed)
+    record_benchmark("trajectory.upload.data", trajectory.data_send_time)
+
+
+async def test_trajectory_upload_kaiju_path(vfps_full, record_benchmark):
+    """Measures the upload time for a path with uneven lengths, as kaiju produces.
+
+    Most robots only need a few points while some need many more, so the upload
+    time should be dominated by the longest path and not by the number of robots.
+
+    """
+
+    rng = numpy.random.default_rng(42)
+
+    trajectories = {}
+    for pid in vfps_full.positioners:
+        n_alpha, n_beta = rng.integers(2, 80, size=2)
+        trajectories[pid] = {
+            "alpha": [(10.0 + tt, tt) for tt in numpy.linspace(0.5, 20, n_alpha)],
+            "beta": [(170.0 - tt, tt) for tt in numpy.linspace(0.5, 20, n_beta)],
+        }
+
+    trajectory = Trajectory(vfps_full, trajectories)
+
+    t0 = time.perf_counter()
+    await trajectory.send()
+    elapsed = time.perf_counter() - t0
+
+    assert trajectory.failed is False
+    assert trajectory.data_send_time is not None
+
+    record_benchmark("trajectory.upload_kaiju.total", elapsed)
+    record_benchmark("trajectory.upload_kaiju.data", trajectory.data_send_time)
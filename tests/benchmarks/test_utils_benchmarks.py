@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-16
+# @Filename: test_utils_benchmarks.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+import timeit
+
+import pytest
+
+from jaeger.utils import get_identifier, parse_identifier
+
+from ..test_utils import legacy_get_identifier, legacy_parse_identifier
+
+
+pytestmark = [pytest.mark.benchmark]
+
+
+N_CALLS = 100000
+
+
+def test_benchmark_get_identifier():
+    new = timeit.timeit(lambda: get_identifier(450, 11, uid=63), number=N_CALLS)
+    legacy = timeit.timeit(
+        lambda: legacy_get_identifier(450, 11, uid=63),
+        number=N_CALLS,
+    )
+
+    print(f"get_identifier: {new / N_CALLS * 1e9:.0f} ns/call")
+    print(f"legacy get_identifier: {legacy / N_CALLS * 1e9:.0f} ns/call")
+
+    assert new < legacy
+
+
+def test_benchmark_parse_identifier():
+    identifier = get_identifier(450, 11, uid=63, response_code=2)
+
+    new = timeit.timeit(lambda: parse_identifier(identifier), number=N_CALLS)
+    legacy = timeit.timeit(
+        lambda: legacy_parse_identifier(identifier),
+        number=N_CALLS,
+    )
+
+    print(f"parse_identifier: {new / N_CALLS * 1e9:.0f} ns/call")
+    print(f"legacy parse_identifier: {legacy / N_CALLS * 1e9:.0f} ns/call")
+
+    assert new < legacy
@@ -36,6 +36,18 @@ if TYPE_CHECKING:
     from sdssdb.connection import PeeweeDatabaseConnection
 
 
+def pytest_collection_modifyitems(config, items):
+    """Skips the benchmarks unless ``JAEGER_BENCHMARKS`` is set."""
+
+    if os.environ.get("JAEGER_BENCHMARKS", False):
+        return
+
+    skip_benchmark = pytest.mark.skip(reason="Set JAEGER_BENCHMARKS to run.")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
 @pytest.fixture(autouse=True)
 def setup_config():
     import jaeger
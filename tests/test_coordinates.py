@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-16
+# @Filename: test_coordinates.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import pickle
+
+import numpy
+import polars
+import pytest
+
+from coordio.defaults import calibration
+
+from jaeger.target.coordinates import positioner_to_wok, wok_to_positioner
+from jaeger.target.tools import (
+    WokGeometry,
+    get_wok_data,
+    get_wok_geometry,
+    set_positioner_table,
+)
+from jaeger.utils import run_in_executor
+
+
+def test_wok_geometry_matches_wok_data():
+    wok_data = get_wok_data("APO")
+    wok_geometry = get_wok_geometry("APO")
+
+    assert len(wok_geometry) == wok_data.height
+    assert get_wok_geometry("APO") is wok_geometry
+
+    for row in wok_data.sample(20, seed=42).iter_rows(named=True):
+        hole_row = wok_geometry.get_hole_row(row["holeID"])
+        assert wok_geometry["holeID"][hole_row] == row["holeID"]
+        assert wok_geometry["alphaArmLen"][hole_row] == row["alphaArmLen"]
+
+        if row["positionerID"] is not None:
+            pid_rows = wok_geometry.get_positioner_rows([row["positionerID"]])
+            assert pid_rows[0] == hole_row
+
+
+def test_wok_geometry_positioner_arrays():
+    wok_geometry = get_wok_geometry("APO")
+
+    pid = int(wok_geometry["positionerID"][10])
+    rows = wok_geometry.get_positioner_rows([pid, pid, -999])
+    assert rows[2] == -1
+
+    arrays = wok_geometry.get_positioner_arrays(rows, ["APOGEE", "BOSS", "BOSS"])
+
+    assert arrays["xBeta"][0] == wok_geometry["apX"][10]
+    assert arrays["xBeta"][1] == wok_geometry["bossX"][10]
+    assert arrays["b"].shape == (3, 3)
+    assert numpy.isnan(arrays["xBeta"][2])
+    assert numpy.isnan(arrays["b"][2]).all()
+
+
+def test_wok_geometry_pickle():
+    wok_geometry = get_wok_geometry("APO")
+
+    unpickled = pickle.loads(pickle.dumps(wok_geometry))
+
+    assert unpickled.observatory == "APO"
+    assert unpickled.hole_index == wok_geometry.hole_index
+    numpy.testing.assert_array_equal(unpickled["xWok"], wok_geometry["xWok"])
+
+
+def test_wok_geometry_hole_not_found():
+    with pytest.raises(ValueError):
+        get_wok_geometry("APO").get_hole_row("BAD")
+
+
+@pytest.mark.parametrize("fibre_type", ["APOGEE", "BOSS", "Metrology"])
+def test_wok_positioner_round_trip(fibre_type: str):
+    hole_id = get_wok_data("APO")[0, "holeID"]
+    wok_data = get_wok_data("APO").filter(polars.col.holeID == hole_id)
+
+    wok, _ = positioner_to_wok(hole_id, "APO", fibre_type, 30.0, 170.0)
+    (alpha, beta), _ = wok_to_positioner(hole_id, "APO", fibre_type, *wok)
+
+    numpy.testing.assert_allclose([alpha, beta], [30.0, 170.0], atol=1e-6)
+
+    # Passing the data frame returns the same values as the cached geometry.
+    wok_df, _ = positioner_to_wok(
+        hole_id,
+        "APO",
+        fibre_type,
+        30.0,
+        170.0,
+        wok_data=wok_data,
+    )
+    numpy.testing.assert_allclose(wok_df, wok)
+
+
+def test_wok_to_positioner_bad_fibre_type():
+    with pytest.raises(ValueError):
+        wok_to_positioner("R0C1", "APO", "BAD", 0.0, 0.0)
+
+
+def test_wok_geometry_columns_length():
+    with pytest.raises(ValueError):
+        WokGeometry(
+            "APO",
+            {"positionerID": numpy.array([1, 2]), "holeID": numpy.array(["R0C1"])},
+        )
+
+
+def get_positioner_table_length():
+    """Returns the length of the positioner table in the current process."""
+
+    return len(calibration.positionerTable)
+
+
+async def test_set_positioner_table_restarts_workers():
+    original = calibration.positionerTable
+
+    n_rows = await run_in_executor(get_positioner_table_length, executor="process")
+    assert n_rows == len(original)
+
+    try:
+        # The running worker must not keep using the old table.
+        set_positioner_table(original.iloc[:10])
+        n_rows = await run_in_executor(get_positioner_table_length, executor="process")
+        assert n_rows == 10
+    finally:
+        set_positioner_table(original)
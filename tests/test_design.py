@@ -20,6 +20,9 @@ from sdssdb.peewee.sdss5db import opsdb
 from sdsstools import yanny
 
 import jaeger
+from jaeger.exceptions import TrajectoryError
+from jaeger.kaiju import get_deadlock_seed
+from jaeger.target.configuration import BaseConfiguration
 from jaeger.target.design import Design
 from jaeger.target.tools import configuration_to_dataframe
 from jaeger.testing import MockFPS
@@ -195,3 +198,114 @@ async def test_configuration_get_paths(mock_fps: MockFPS):
 
     reassigned = design.configuration.fibre_data.filter(polars.col.reassigned)
     assert reassigned.height > 0
+
+
+async def resolve_deadlocks(
+    monkeypatch: pytest.MonkeyPatch, candidates: dict, **kwargs
+):
+    """Runs ``_resolve_deadlocks`` with stubbed path generation.
+
+    ``candidates`` maps each candidate index in the first attempt to the value
+    returned by ``unlock_deadlock``, or to the exception it raises. Returns the
+    configuration, the decollided robots, and the candidates that were evaluated.
+
+    """
+
+    configuration = object.__new__(BaseConfiguration)
+    configuration.command = None
+    configuration.robot_grid = None
+
+    seeds = {get_deadlock_seed(0, 1, candidate): candidate for candidate in candidates}
+    evaluated: list[int] = []
+
+    async def get_path_pair_in_executor(*args, **kwargs):
+        return ("to", "from", True, [1, 2, 3, 4])
+
+    async def run_in_executor(func, data, deadlocks, seed, **kwargs):
+        candidate = seeds[seed]
+        evaluated.append(candidate)
+
+        if isinstance(candidates[candidate], Exception):
+            raise candidates[candidate]
+
+        return candidates[candidate]
+
+    module = "jaeger.target.configuration"
+    monkeypatch.setattr(
+        f"{module}.get_path_pair_in_executor", get_path_pair_in_executor
+    )
+    monkeypatch.setattr(f"{module}.run_in_executor", run_in_executor)
+    monkeypatch.setattr(f"{module}.get_robot_grid_state", lambda grid: "state")
+    monkeypatch.setattr(f"{module}.load_robot_grid", lambda data: data)
+    monkeypatch.setitem(jaeger.config, "executors", {"process_workers": 2})
+
+    decollided = await configuration._resolve_deadlocks(
+        n_candidates=len(candidates),
+        seed=0,
+        **kwargs,
+    )
+
+    return configuration, decollided, evaluated
+
+
+def deadlock_candidate(candidate: int, deadlocks: list[int]):
+    """Returns the output of ``unlock_deadlock`` for a stubbed candidate."""
+
+    result = (f"to{candidate}", f"from{candidate}", len(deadlocks) > 0, deadlocks)
+
+    return (f"state{candidate}", 10 + candidate, result)
+
+
+async def test_resolve_deadlocks_first_unlocked(monkeypatch: pytest.MonkeyPatch):
+    candidates = {
+        0: TrajectoryError("Cannot decollide deadlocked robot 10."),
+        1: deadlock_candidate(1, [1]),
+        2: deadlock_candidate(2, []),
+        3: deadlock_candidate(3, []),
+        4: deadlock_candidate(4, []),
+    }
+
+    configuration, decollided, evaluated = await resolve_deadlocks(
+        monkeypatch,
+        candidates,
+    )
+
+    # The first wave has no unlocked candidates. The second wave has two and the
+    # first one is kept. The third wave is never submitted.
+    assert evaluated == [0, 1, 2, 3]
+    assert decollided == [12]
+    assert configuration.robot_grid == "state2"
+    assert configuration.to_destination == "to2"
+    assert configuration.from_destination == "from2"
+
+
+@pytest.mark.parametrize("force", [True, False])
+async def test_resolve_deadlocks_retries_exhausted(
+    monkeypatch: pytest.MonkeyPatch,
+    force: bool,
+):
+    candidates = {
+        0: deadlock_candidate(0, [1, 2, 3]),
+        1: deadlock_candidate(1, [1]),
+        2: deadlock_candidate(2, [1, 2]),
+        3: TrajectoryError("Cannot decollide deadlocked robot 13."),
+    }
+
+    if force is False:
+        with pytest.raises(TrajectoryError, match="retries has been exhausted"):
+            await resolve_deadlocks(monkeypatch, candidates, n_retries=1)
+        return
+
+    configuration, decollided, evaluated = await resolve_deadlocks(
+        monkeypatch,
+        candidates,
+        n_retries=1,
+        force=True,
+    )
+
+    # All the candidates are deadlocked, so the one with the fewest deadlocks is
+    # kept and, with force, the last result is used once the retries are exhausted.
+    assert evaluated == [0, 1, 2, 3]
+    assert decollided == [11]
+    assert configuration.robot_grid == "state1"
+    assert configuration.to_destination == "to1"
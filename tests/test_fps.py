@@ -8,17 +8,21 @@
 
 import asyncio
 import pathlib
+import time
 
 import pytest
 
 from drift import Relay
 
 import jaeger
+from jaeger.alerts import AlertsBot
 from jaeger.can import JaegerCAN
+from jaeger.commands import CommandID
 from jaeger.exceptions import JaegerError, JaegerUserWarning
 from jaeger.fps import FPS
-from jaeger.maskbits import PositionerStatus
+from jaeger.maskbits import CommandStatus, PositionerStatus
 from jaeger.testing import VirtualFPS
+from jaeger.utils import parse_identifier
 
 
 # Need to mark all tests with positioners to make sure they are created,
@@ -54,6 +58,45 @@ async def test_initialise(vfps, vpositioners):
     assert positioner1.firmware == "10.11.12"
 
 
+async def test_initialise_grouped_commands(vfps, vpositioners, mocker):
+    send_command = mocker.spy(vfps, "send_command")
+
+    await vfps.initialise()
+
+    # All the commands are broadcasts or are sent to all the positioners at once.
+    for call in send_command.call_args_list:
+        positioner_ids = call.kwargs.get("positioner_ids", None)
+        if isinstance(positioner_ids, int):
+            assert positioner_ids == 0
+        elif isinstance(positioner_ids, list) and positioner_ids != [0]:
+            assert len(positioner_ids) == len(vpositioners)
+
+    assert all(vfps[pid].initialised for pid in vpositioners)
+
+
+async def test_initialise_resets_positioners(vfps, vpositioners):
+    await vfps.initialise(start_pollers=False)
+
+    vfps[1].alpha = 123.0
+    vfps[1].beta = 45.0
+
+    # Positioner 1 does not reply to GET_ACTUAL_POSITION.
+    process_message = vpositioners[1].process_message
+
+    async def no_position_reply(msg, positioner_id, command_id, uid):
+        if command_id == CommandID.GET_ACTUAL_POSITION:
+            return
+        return await process_message(msg, positioner_id, command_id, uid)
+
+    vpositioners[1].process_message = no_position_reply
+
+    with pytest.raises(JaegerError):
+        await vfps.initialise(start_pollers=False)
+
+    assert vfps[1].alpha is None
+    assert vfps[1].beta is None
+
+
 async def test_pollers(vfps):
     await vfps.initialise()
 
@@ -97,6 +140,198 @@ async def test_ieb(vfps):
     assert (await sync.read())[0] == "open"
 
 
+async def test_ieb_read_many(vfps, mocker):
+    ieb = vfps.ieb
+    await ieb.get_device("GFA2").close()
+
+    names = [f"{mod}.{dev}" for mod in ieb.modules for dev in ieb[mod].devices]
+    sequential = [await ieb.read_device(name) for name in names]
+
+    connect = mocker.spy(ieb.client, "connect")
+
+    assert await ieb.read_many(names) == sequential
+
+    # All the devices are read with a single connection.
+    assert connect.call_count == 1
+
+    assert await ieb.read_many(names, adapt=False) == [
+        await ieb.read_device(name, adapt=False) for name in names
+    ]
+
+
+async def test_ieb_get_status(vfps):
+    ieb = vfps.ieb
+
+    status = await ieb.get_status()
+
+    for category in ieb.get_categories():
+        for device, (value, _) in (await ieb.read_category(category)).items():
+            if ieb.get_device(device).__type__ == "relay":
+                value = value != "open"
+            assert status[device] == value
+
+
+async def test_alerts_read_values(vfps, mocker, monkeypatch):
+    enabled = ["ieb", "robot", "flow", "temperature"]
+    monkeypatch.setitem(jaeger.config["alerts"], "enabled", enabled)
+
+    alerts = AlertsBot(vfps)
+    await alerts.read_values()
+
+    assert len(alerts._ieb_values) == len(alerts._get_ieb_devices())
+
+    # The checks use the values already read and do not query the IEB again.
+    read_device = mocker.spy(vfps.ieb, "read_device")
+
+    await alerts._check_robots()
+    await alerts._check_ieb()
+    await alerts._check_flow()
+    await alerts._check_outside_temperature()
+
+    assert read_device.call_count == 0
+
+
+async def test_update_status_caches_firmware(vfps, vpositioners, mocker):
+    await vfps.initialise(start_pollers=False)
+
+    send = mocker.spy(vfps.can.interfaces[0], "send")
+
+    def sent_commands():
+        ids = [call.args[0].arbitration_id for call in send.call_args_list]
+        send.reset_mock()
+        return [parse_identifier(id_)[1] for id_ in ids]
+
+    # A single GET_STATUS broadcast frame and no firmware requests.
+    await vfps.update_status()
+    assert sent_commands() == [CommandID.GET_STATUS]
+
+    await vfps.update_status(refresh_firmware=True)
+    assert sent_commands() == [CommandID.GET_FIRMWARE_VERSION, CommandID.GET_STATUS]
+
+    vfps.invalidate_firmware()
+    await vfps.update_status()
+    assert sent_commands() == [CommandID.GET_FIRMWARE_VERSION, CommandID.GET_STATUS]
+
+    # Firmware is refreshed when a positioner changes to bootloader mode.
+    vpositioners[1].set_bootloader()
+    await vfps.update_status()
+    assert CommandID.GET_FIRMWARE_VERSION in sent_commands()
+    assert vfps[1].is_bootloader()
+
+    await vfps.update_status()
+    assert sent_commands() == [CommandID.GET_STATUS]
+
+
+async def test_update_status_firmware_not_requeried(vfps, vpositioners, mocker):
+    await vfps.initialise(start_pollers=False)
+
+    # Positioner 3 does not reply to GET_FIRMWARE_VERSION.
+    process_message = vpositioners[3].process_message
+
+    async def no_firmware_reply(msg, positioner_id, command_id, uid):
+        if command_id == CommandID.GET_FIRMWARE_VERSION:
+            return
+        return await process_message(msg, positioner_id, command_id, uid)
+
+    vpositioners[3].process_message = no_firmware_reply
+
+    vfps[3].firmware = None
+    vfps.invalidate_firmware()
+    await vfps.update_status(timeout=0.1)
+    assert vfps[3].firmware is None
+
+    send = mocker.spy(vfps.can.interfaces[0], "send")
+
+    # Neither the missing firmware nor losing the datum bits (as happens during
+    # a datum calibration) trigger a new firmware request.
+    vpositioners[2].status &= ~PositionerStatus.DATUM_ALPHA_INITIALIZED
+    await vfps.update_status(timeout=0.1)
+    await vfps.update_status(timeout=0.1)
+
+    ids = [call.args[0].arbitration_id for call in send.call_args_list]
+    assert [parse_identifier(id_)[1] for id_ in ids] == [CommandID.GET_STATUS] * 2
+
+
+async def test_uid_pool_waiters(vfps):
+    await vfps.initialise()
+
+    # More commands than UIDs for GET_STATUS and positioner 1. The commands that do
+    # not get a UID wait until one is returned and are sent in order.
+    commands = [vfps.send_command("GET_STATUS", positioner_ids=1) for _ in range(150)]
+    await asyncio.wait_for(asyncio.gather(*commands), 1)
+
+    assert all(cmd.status.is_done and not cmd.status.failed for cmd in commands)
+
+    start_times = [cmd.start_time for cmd in commands]
+    assert start_times == sorted(start_times)
+
+    assert vfps.can._uid_waiters == {}
+
+
+async def test_stop_trajectory_not_moving(vfps, mocker):
+    await vfps.initialise()
+
+    send_command = mocker.spy(vfps, "send_command")
+    update_status = mocker.spy(vfps, "update_status")
+
+    for clear_flags in [False, True]:
+        await vfps.stop_trajectory(clear_flags=clear_flags)
+
+        # The command was acknowledged by all the positioners before returning.
+        stop_command = send_command.spy_return
+        assert stop_command.status == CommandStatus.DONE
+
+    # The positioners are not moving so we do not wait for them to stop.
+    update_status.assert_not_called()
+
+
+async def stop_trajectory_while_moving(vfps, monkeypatch, n_moving_polls):
+    """Stops the trajectory with the FPS moving for a number of status polls.
+
+    Returns the elapsed time and the timeouts passed to each status poll.
+
+    """
+
+    await vfps.initialise()
+
+    timeouts: list[float] = []
+
+    async def update_status(timeout: float = 2, **kwargs):
+        timeouts.append(timeout)
+        await asyncio.sleep(0.02)
+        return True
+
+    monkeypatch.setattr(vfps, "update_status", update_status)
+    monkeypatch.setattr(
+        type(vfps),
+        "moving",
+        property(lambda self: n_moving_polls is None or len(timeouts) < n_moving_polls),
+    )
+
+    start_time = time.time()
+    await vfps.stop_trajectory()
+
+    return time.time() - start_time, timeouts
+
+
+async def test_stop_trajectory_moving(vfps, monkeypatch):
+    elapsed, timeouts = await stop_trajectory_while_moving(vfps, monkeypatch, 3)
+
+    # Returns as soon as the status reports the positioners have stopped.
+    assert len(timeouts) == 3
+    assert elapsed < 0.5
+
+
+async def test_stop_trajectory_moving_timeout(vfps, monkeypatch):
+    elapsed, timeouts = await stop_trajectory_while_moving(vfps, monkeypatch, None)
+
+    # Gives up at the timeout and each poll only gets the remaining time.
+    assert len(timeouts) > 1
+    assert timeouts == sorted(timeouts, reverse=True)
+    assert all(0 < timeout <= 0.5 for timeout in timeouts)
+    assert elapsed == pytest.approx(0.5, abs=0.1)
+
+
 @pytest.mark.xfail()
 async def test_positioner_disabled_send_command_fails_broadcast(vfps):
     await vfps.initialise()
@@ -20,7 +20,9 @@ from astropy.io import fits
 import jaeger
 from jaeger.fvc import FVC
 from jaeger.target import Design
+from jaeger.target.coordinates import positioner_to_wok, wok_to_positioner
 from jaeger.target.schemas import FIBRE_DATA_SCHEMA
+from jaeger.target.tools import get_wok_data
 from jaeger.testing import MockFPS
 
 from . import check_database, check_fps_calibrations_version
@@ -75,6 +77,113 @@ async def test_get_fibre_data_fcam(get_fimg_paths: Sequence[pathlib.Path]):
     assert fibre_data["assigned"].dtype == polars.Boolean
 
 
+def get_metrology_data(
+    expected: list[tuple[float, float]],
+    measured: list[tuple[float, float]],
+):
+    """Returns metrology fibre data for robots measured at known positions."""
+
+    wok_data = get_wok_data("APO").filter(polars.col.positionerID.is_not_null())
+
+    rows = []
+    for row, (alpha, beta), (alpha_meas, beta_meas) in zip(
+        wok_data.head(len(expected)).iter_rows(named=True),
+        expected,
+        measured,
+    ):
+        hole_id = row["holeID"]
+        wok, _ = positioner_to_wok(hole_id, "APO", "Metrology", alpha, beta)
+        wok_meas, _ = positioner_to_wok(
+            hole_id,
+            "APO",
+            "Metrology",
+            alpha_meas,
+            beta_meas,
+        )
+
+        rows.append(
+            {
+                "positioner_id": row["positionerID"],
+                "hole_id": hole_id,
+                "fibre_type": "Metrology",
+                "alpha": alpha,
+                "beta": beta,
+                "xwok": wok[0],
+                "ywok": wok[1],
+                "xwok_measured": wok_meas[0],
+                "ywok_measured": wok_meas[1],
+            }
+        )
+
+    return polars.DataFrame(rows)
+
+
+async def test_calculate_offsets():
+    # The third robot needs a clipped alpha correction and the fourth a clipped
+    # beta correction. The last one would need a left-handed configuration.
+    expected = [(30, 160), (40, 150), (50, 140), (60, 130), (70, 180)]
+    measured = [(30, 160), (40.2, 149.9), (55, 140), (60, 126), (70, 170)]
+
+    met = get_metrology_data(expected, measured)
+    pids = met["positioner_id"].to_list()
+
+    reported = numpy.array(
+        [(pid, alpha, beta) for pid, (alpha, beta) in zip(pids, expected)],
+        dtype=numpy.float64,
+    )
+
+    fvc = FVC("APO")
+    offsets = fvc.calculate_offsets(reported, fibre_data=met, k=0.5, max_correction=1)
+    assert sorted(offsets["positioner_id"].to_list()) == sorted(pids)
+
+    def get_offset(pid: int):
+        return offsets.filter(polars.col.positioner_id == pid).row(0, named=True)
+
+    # Compare with the per-fibre conversion.
+    for row in met.iter_rows(named=True):
+        offset = get_offset(row["positioner_id"])
+
+        if row["beta"] >= 180:
+            assert offset["transformation_valid"] is False
+            assert numpy.isnan(offset["alpha_measured"])
+            assert offset["alpha_new"] == row["alpha"]
+            assert offset["beta_new"] == row["beta"]
+            continue
+
+        (alpha_meas, beta_meas), _ = wok_to_positioner(
+            row["hole_id"],
+            "APO",
+            "Metrology",
+            row["xwok_measured"],
+            row["ywok_measured"],
+        )
+
+        assert offset["transformation_valid"] is True
+        assert offset["alpha_measured"] == pytest.approx(alpha_meas, abs=1e-6)
+        assert offset["beta_measured"] == pytest.approx(beta_meas, abs=1e-6)
+
+        alpha_corr = numpy.clip(0.5 * (row["alpha"] - alpha_meas), -1, 1)
+        beta_corr = numpy.clip(0.5 * (row["beta"] - beta_meas), -1, 1)
+
+        assert offset["alpha_offset_corrected"] == pytest.approx(alpha_corr, abs=1e-6)
+        assert offset["beta_offset_corrected"] == pytest.approx(beta_corr, abs=1e-6)
+        assert offset["alpha_new"] == pytest.approx(row["alpha"] + alpha_corr)
+        assert offset["beta_new"] == pytest.approx(row["beta"] + beta_corr)
+
+    assert get_offset(pids[2])["alpha_offset_corrected"] == pytest.approx(-1)
+    assert get_offset(pids[3])["beta_offset_corrected"] == pytest.approx(1)
+
+
+async def test_calculate_offsets_unknown_hole():
+    met = get_metrology_data([(30, 160)], [(30, 160)])
+    met = met.with_columns(hole_id=polars.lit("BAD"))
+
+    reported = numpy.array([(met[0, "positioner_id"], 30, 160)], dtype=numpy.float64)
+
+    with pytest.raises(ValueError):
+        FVC("APO").calculate_offsets(reported, fibre_data=met)
+
+
 @pytest.mark.xfail(reason="coordio transforms have changed.")
 async def test_fvc_processing(
     get_fimg_paths: Sequence[pathlib.Path],
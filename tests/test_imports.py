@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-16
+# @Filename: test_imports.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+
+# Modules that must not be imported by "import jaeger".
+HEAVY_MODULES = [
+    "jaeger.can",
+    "jaeger.fps",
+    "jaeger.fvc",
+    "jaeger.ieb",
+    "jaeger.actor",
+    "jaeger.positioner",
+    "jaeger.commands",
+    "astropy",
+    "coordio",
+    "kaiju",
+    "polars",
+    "clu",
+    "drift",
+]
+
+
+def _get_imported_modules(code: str = "import jaeger") -> list[str]:
+    """Runs ``code`` in a new interpreter and returns the loaded modules."""
+
+    code += "; import json, sys; print(json.dumps(list(sys.modules)))"
+
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+
+    return json.loads(output.splitlines()[-1])
+
+
+def test_import_does_not_load_submodules():
+    modules = _get_imported_modules()
+
+    for module in HEAVY_MODULES:
+        assert module not in modules, f"{module} was imported by 'import jaeger'."
+
+
+def test_lazy_object_loads_only_its_module():
+    modules = _get_imported_modules("from jaeger import Positioner")
+
+    assert "jaeger.positioner" in modules
+    assert "jaeger.actor" not in modules
+    assert "jaeger.fvc" not in modules
+
+
+def test_lazy_objects():
+    import jaeger
+    import jaeger.fps
+    import jaeger.positioner
+
+    assert jaeger.FPS is jaeger.fps.FPS
+    assert jaeger.Positioner is jaeger.positioner.Positioner
+
+    from jaeger import FPS
+
+    assert FPS is jaeger.fps.FPS
+
+    assert "FPS" in dir(jaeger)
+
+    import jaeger.actor
+
+    assert jaeger.jaeger_parser is jaeger.actor.jaeger_parser
+    assert jaeger.JaegerCommandType is jaeger.actor.JaegerCommandType
+
+    # The actor commands are exported, but submodules take precedence.
+    assert jaeger.goto is jaeger.actor.goto
+    assert jaeger.unwind_command is jaeger.actor.unwind_command
+    assert "goto" in dir(jaeger)
+
+    import jaeger.can
+
+    assert jaeger.can.__name__ == "jaeger.can"
+
+
+def test_lazy_object_not_found():
+    import jaeger
+
+    with pytest.raises(AttributeError):
+        jaeger.NotAnObject
+
+    with pytest.raises(ImportError):
+        from jaeger import NotAnObject  # noqa: F401
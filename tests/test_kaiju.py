@@ -0,0 +1,256 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# @Author: José Sánchez-Gallego (gallegoj@uw.edu)
+# @Date: 2026-10-16
+# @Filename: test_kaiju.py
+# @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
+
+import pickle
+
+import numpy
+import pytest
+
+from kaiju.robotGrid import RobotGridCalib
+
+from jaeger.exceptions import JaegerError, JaegerUserWarning
+from jaeger.kaiju import (
+    GRID_STATE_DTYPE,
+    decollide,
+    dump_robot_grid,
+    get_collided_robots,
+    get_collision_components,
+    get_deadlock_seed,
+    get_direct_path_pair,
+    get_path_pair,
+    get_robot_grid,
+    get_robot_grid_state,
+    get_robot_grid_template,
+    load_robot_grid,
+    unlock_deadlock,
+)
+
+
+@pytest.fixture()
+def robot_grid():
+    robot_grid = get_robot_grid(None, seed=42)
+
+    # Move the robots to random positions and make one of them offline.
+    for robot in robot_grid.robotDict.values():
+        robot.setXYUniform()
+    list(robot_grid.robotDict.values())[0].isOffline = True
+
+    yield robot_grid
+
+
+def test_robot_grid_state_round_trip(robot_grid):
+    state = get_robot_grid_state(robot_grid)
+
+    assert state.dtype == GRID_STATE_DTYPE
+    assert len(state) == len(robot_grid.robotDict)
+
+    assert get_robot_grid_state(load_robot_grid(state)).tobytes() == state.tobytes()
+    assert dump_robot_grid(load_robot_grid(state)) == dump_robot_grid(robot_grid)
+
+    # Pickling the state does not change it.
+    assert pickle.loads(pickle.dumps(state)).tobytes() == state.tobytes()
+
+
+def test_robot_grid_template():
+    template = get_robot_grid_template("APO")
+    assert get_robot_grid_template("APO") is template
+
+    robot_grid = template.create(0.1, 0.2, 42)
+    reference = RobotGridCalib(stepSize=0.1, epsilon=0.2, seed=42)
+
+    assert isinstance(robot_grid, RobotGridCalib)
+    assert list(robot_grid.robotDict) == list(reference.robotDict)
+
+    for robot_id, robot in robot_grid.robotDict.items():
+        reference_robot = reference.robotDict[robot_id]
+        assert robot.holeID == reference_robot.holeID
+        assert robot.basePos == reference_robot.basePos
+        assert robot.fiducialWatch == reference_robot.fiducialWatch
+        assert robot.robotNeighbors == reference_robot.robotNeighbors
+        assert robot.fiducialNeighbors == reference_robot.fiducialNeighbors
+
+    # Grids created from the template are independent.
+    robot = robot_grid.robotDict[list(robot_grid.robotDict)[0]]
+    robot.setAlphaBeta(30.0, 150.0)
+    assert template.create(0.1, 0.2, 42).robotDict[robot.id].alpha != 30.0
+
+
+def collide_robot(robot_grid, robot_id):
+    """Moves a robot to random positions until it collides with another robot."""
+
+    robot = robot_grid.robotDict[robot_id]
+    while len(robot_grid.robotColliders(robot_id)) == 0:
+        robot.setXYUniform()
+
+
+def test_decollide_components():
+    robot_grid = get_robot_grid(None, seed=42)
+    assert len(robot_grid.getCollidedRobotList()) == 0
+
+    def x_wok(robot_id):
+        return robot_grid.robotDict[robot_id].basePos[0]
+
+    robot1 = min(robot_grid.robotDict, key=x_wok)
+    robot2 = max(robot_grid.robotDict, key=x_wok)
+
+    collide_robot(robot_grid, robot1)
+    collide_robot(robot_grid, robot2)
+
+    collided = get_collided_robots(robot_grid, robot_ids=[robot1, robot2])
+    assert set(collided) == set(robot_grid.getCollidedRobotList())
+
+    # The robots are on opposite sides of the wok so they are in different groups.
+    components = get_collision_components(robot_grid, collided)
+    assert len(components) == 2
+    assert components[0][0] == robot1 and components[1][0] == robot2
+
+    _, decollided = decollide(robot_grid, robot_ids=[robot1, robot2])
+
+    assert len(decollided) > 0
+    assert set(decollided) <= set(collided)
+    assert len(robot_grid.getCollidedRobotList()) == 0
+
+
+def test_decollide_grid_fallback(mocker):
+    robot_grid = get_robot_grid(None, seed=42)
+    collide_robot(robot_grid, list(robot_grid.robotDict)[0])
+
+    # Make the robot-by-robot decollision fail.
+    mocker.patch.object(robot_grid, "decollideRobot")
+
+    with pytest.raises(JaegerError):
+        decollide(robot_grid)
+
+    with pytest.warns(JaegerUserWarning):
+        decollide(robot_grid, decollide_grid_fallback=True)
+
+    assert len(robot_grid.getCollidedRobotList()) == 0
+
+
+def test_direct_path_pair():
+    robot_grid = get_robot_grid(None, seed=42)
+
+    for robot in robot_grid.robotDict.values():
+        robot.setDestinationAlphaBeta(robot.alpha + 0.5, robot.beta - 0.3)
+
+    paths = get_direct_path_pair(robot_grid, 2)
+    assert paths is not None
+
+    to_destination, from_destination = paths
+    assert len(to_destination) == len(robot_grid.robotDict)
+
+    for robot_id, robot in robot_grid.robotDict.items():
+        alpha_path = to_destination[robot_id]["alpha"]
+        assert len(alpha_path) == 2
+        assert alpha_path[-1][0] == pytest.approx(robot.destinationAlpha)
+        assert from_destination[robot_id]["beta"][0][0] == robot.destinationBeta
+
+        # The grid is left at the initial positions.
+        assert robot.alpha == pytest.approx(robot.destinationAlpha - 0.5)
+
+    # get_path_pair uses the direct paths.
+    result = get_path_pair(robot_grid, path_generation_mode="mdp", direct_max_angle=2)
+    assert result == (to_destination, from_destination, False, [])
+
+    # Large moves are not calculated.
+    assert get_direct_path_pair(robot_grid, 0.1) is None
+
+
+def test_direct_path_pair_collision():
+    robot_grid = get_robot_grid(None, seed=42)
+
+    robot_id = list(robot_grid.robotDict)[0]
+    robot = robot_grid.robotDict[robot_id]
+    alpha, beta = robot.alpha, robot.beta
+
+    collide_robot(robot_grid, robot_id)
+    robot.setDestinationAlphaBeta(robot.alpha, robot.beta)
+    robot.setAlphaBeta(alpha, beta)
+
+    assert get_direct_path_pair(robot_grid, 360) is None
+
+
+def find_swept_collision(robot_grid):
+    """Finds a move of one robot that only collides at intermediate positions."""
+
+    alphas = numpy.arange(0, 360, 1.0)
+
+    for robot in robot_grid.robotDict.values():
+        alpha0, beta0 = robot.alpha, robot.beta
+
+        for beta in [0.0, 30.0, 60.0, 90.0]:
+            collided = []
+            for alpha in alphas:
+                robot.setAlphaBeta(alpha, beta)
+                collided.append(robot_grid.isCollided(robot.id))
+
+            for ii in range(len(alphas) - 2):
+                if collided[ii] or not collided[ii + 1]:
+                    continue
+                for jj in range(ii + 2, len(alphas)):
+                    if not collided[jj]:
+                        robot.setAlphaBeta(alpha0, beta0)
+                        return robot, (alphas[ii], beta), (alphas[jj], beta)
+
+        robot.setAlphaBeta(alpha0, beta0)
+
+    raise RuntimeError("Cannot find a move with a swept volume collision.")
+
+
+def test_direct_path_pair_swept_collision():
+    robot_grid = get_robot_grid(None, seed=42)
+
+    robot, start, end = find_swept_collision(robot_grid)
+
+    # Neither the start nor the end positions are collided.
+    robot.setAlphaBeta(*end)
+    assert not robot_grid.isCollided(robot.id)
+    robot.setDestinationAlphaBeta(*end)
+
+    robot.setAlphaBeta(*start)
+    assert not robot_grid.isCollided(robot.id)
+
+    assert get_direct_path_pair(robot_grid, 360) is None
+    assert (robot.alpha, robot.beta) == pytest.approx(start)
+
+
+def test_deadlock_seed():
+    seeds = [get_deadlock_seed(0, 1, candidate) for candidate in range(4)]
+
+    assert seeds == [get_deadlock_seed(0, 1, candidate) for candidate in range(4)]
+    assert len(set(seeds)) == 4
+    assert get_deadlock_seed(0, 2, 0) not in seeds
+    assert get_deadlock_seed(1, 1, 0) not in seeds
+
+
+def test_unlock_deadlock_reproducible():
+    robot_grid = get_robot_grid(None, seed=42)
+
+    state = get_robot_grid_state(robot_grid)
+    deadlocks = list(robot_grid.robotDict)[:10]
+    seed = get_deadlock_seed(0, 1, 0)
+
+    results = [
+        unlock_deadlock(state, deadlocks, seed, path_generation_mode="greedy")
+        for _ in range(2)
+    ]
+
+    (new_state, to_move, paths), (new_state2, to_move2, paths2) = results
+
+    assert to_move in deadlocks
+    assert to_move2 == to_move
+    assert new_state2.tobytes() == new_state.tobytes()
+    assert paths2 == paths
+
+    # The input state is not modified and only the selected robot is moved.
+    assert state.tobytes() == get_robot_grid_state(robot_grid).tobytes()
+    moved = load_robot_grid(new_state).robotDict
+    for robot_id, robot in robot_grid.robotDict.items():
+        if robot_id != to_move:
+            assert moved[robot_id].alpha == robot.alpha
+            assert moved[robot_id].beta == robot.beta
@@ -76,6 +76,32 @@ async def test_home_no_fps(vfps):
         await pos.home()
 
 
+async def test_wait_for_status_shared_poll(vfps, vpositioners, mocker):
+    update_status = mocker.spy(vfps, "update_status")
+
+    results = await asyncio.gather(
+        *[
+            vfps[pid].wait_for_status(PositionerStatus.DISPLACEMENT_COMPLETED)
+            for pid in vpositioners
+        ]
+    )
+
+    assert all(results)
+    assert update_status.call_count == 1
+
+
+async def test_wait_for_status_timeout(vfps):
+    result = await vfps.wait_for_status(
+        [1, 2],
+        PositionerStatus.COLLISION_ALPHA,
+        delay=0.05,
+        timeout=0.2,
+    )
+
+    assert result is False
+    assert vfps._status_waiters == []
+
+
 @pytest.mark.parametrize("motor", ["alpha", "beta", "both"])
 @pytest.mark.parametrize("loop", ["open", "closed"])
 @pytest.mark.parametrize("collisions", [True, False])
@@ -6,11 +6,16 @@
 # @Filename: test_trajectory.py
 # @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
 
+
+import numpy
 import pytest
 
 from jaeger import config
-from jaeger.commands.trajectory import Trajectory, send_trajectory
-from jaeger.exceptions import JaegerError, TrajectoryError
+from jaeger.commands import CommandID
+from jaeger.commands.trajectory import SendTrajectoryData, Trajectory, send_trajectory
+from jaeger.exceptions import JaegerError, JaegerUserWarning, TrajectoryError
+from jaeger.maskbits import ResponseCode
+from jaeger.utils import int_to_bytes
 
 
 # Need to mark all tests with positioners to make sure they are created,
@@ -58,6 +63,131 @@ async def test_disabled_positioner_fails(vfps):
     assert "positioner_id=1 is disabled" in str(err)
 
 
+async def test_start_trajectory_waits_move_time(vfps, mocker):
+    await vfps.initialise()
+
+    # The virtual positioners do not move, so the trajectory ends where they are.
+    trajectory = Trajectory(
+        vfps,
+        {1: {"alpha": [(0, 0.1), (0, 0.5)], "beta": [(0, 0.1), (0, 0.5)]}},
+    )
+    await trajectory.send()
+
+    # A clock that only advances when the trajectory sleeps.
+    now = 0.0
+
+    async def sleep(delay):
+        nonlocal now
+        now += delay
+
+    trajectory._clock = lambda: now
+    trajectory._sleep = sleep
+
+    poll_times = []
+    update_status = vfps.update_status
+
+    async def timed_update_status(*args, **kwargs):
+        poll_times.append(now)
+        return await update_status(*args, **kwargs)
+
+    mocker.patch.object(vfps, "update_status", side_effect=timed_update_status)
+
+    await trajectory.start(use_sync_line=False)
+
+    # A single poll, when the move is expected to have finished.
+    assert poll_times == [pytest.approx(0.5)]
+
+
+@pytest.mark.parametrize(
+    "rejected_command",
+    [CommandID.SEND_NEW_TRAJECTORY, CommandID.SEND_TRAJECTORY_DATA],
+)
+async def test_send_trajectory_retries_failed_positioners(
+    vfps,
+    vpositioners,
+    mocker,
+    rejected_command,
+):
+    await vfps.initialise()
+
+    # Positioner 2 rejects the first command of this type it receives.
+    vpositioner = vpositioners[2]
+    process_message = vpositioner.process_message
+    n_rejected = 0
+
+    async def reject_once(msg, positioner_id, command_id, uid):
+        nonlocal n_rejected
+        if command_id == rejected_command and n_rejected == 0:
+            n_rejected += 1
+            code = ResponseCode.VALUE_OUT_OF_RANGE
+            vpositioner.reply(command_id, uid, response_code=code)
+            return
+        await process_message(msg, positioner_id, command_id, uid)
+
+    mocker.patch.object(vpositioner, "process_message", side_effect=reject_once)
+
+    send_command = mocker.spy(vfps, "send_command")
+
+    points = {"alpha": [(0, 0.1), (0, 0.5)], "beta": [(0, 0.1), (0, 0.5)]}
+    trajectory = Trajectory(vfps, {1: points, 2: points, 3: points})
+
+    with pytest.warns(JaegerUserWarning):
+        assert await trajectory.send()
+
+    new_trajectory_pids = [
+        call.kwargs["positioner_ids"]
+        for call in send_command.call_args_list
+        if call.args[0] == "SEND_NEW_TRAJECTORY"
+    ]
+
+    # Only the failed positioner gets the trajectory a second time.
+    assert new_trajectory_pids == [[1, 2, 3], [2]]
+    assert trajectory.failed_positioners == {}
+
+    # The retry is recorded but the trajectory did not fail.
+    assert list(trajectory.retried_positioners) == [2]
+    assert trajectory.send_new_trajectory_failed is False
+
+
+@pytest.mark.parametrize("n_points,n_commands", [(3, 68), (None, 4)])
+async def test_send_trajectory_packing(
+    vfps,
+    vpositioners,
+    mocker,
+    monkeypatch,
+    n_points,
+    n_commands,
+):
+    monkeypatch.setitem(config["positioner"], "trajectory_data_n_points", n_points)
+
+    await vfps.initialise()
+
+    times = numpy.linspace(0.1, 10, 100)
+    points = {"alpha": [(tt, tt) for tt in times], "beta": [(-tt, tt) for tt in times]}
+
+    send_command = mocker.spy(vfps, "send_command")
+
+    trajectory = Trajectory(vfps, {1: points})
+    assert await trajectory.send()
+
+    data_commands = [
+        call
+        for call in send_command.call_args_list
+        if call.args[0] == "SEND_TRAJECTORY_DATA"
+    ]
+    assert len(data_commands) == n_commands
+
+    # The virtual positioner received all the points in order.
+    received = vpositioners[1].trajectory
+    assert received is not None
+
+    for arm in ["alpha", "beta"]:
+        expected = SendTrajectoryData.calculate_positions(points[arm])
+        assert len(received[arm]) == len(expected)
+        for (angle, time_steps), payload in zip(received[arm], expected):
+            assert payload == int_to_bytes(angle, "i4") + int_to_bytes(time_steps, "i4")
+
+
 @pytest.mark.xfail
 async def test_validate_out_of_limits(vfps):
     await vfps.initialise()
@@ -94,3 +224,24 @@ async def test_validate_safe_mode(vfps, monkeypatch, beta, safe_mode):
         )
 
     assert "safe mode is on" in str(err)
+
+
+def test_calculate_positions():
+    motor_steps = config["positioner"]["motor_steps"]
+    time_step = config["positioner"]["time_step"]
+
+    rng = numpy.random.default_rng(42)
+    points = numpy.column_stack([rng.uniform(-5, 365, 500), rng.uniform(0, 60, 500)])
+
+    data = SendTrajectoryData.calculate_positions(points)
+
+    assert len(data) == len(points)
+
+    # Compare with the per-point encoding.
+    for (angle, tt), payload in zip(points, data):
+        angle_steps = numpy.int32(angle / 360.0 * motor_steps)
+        time_steps = numpy.int32(tt / time_step)
+        expected = int_to_bytes(angle_steps, dtype="i4") + int_to_bytes(
+            time_steps, dtype="i4"
+        )
+        assert payload == expected
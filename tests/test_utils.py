@@ -6,10 +6,13 @@
 # @Filename: test_utils.py
 # @License: BSD 3-clause (http://www.opensource.org/licenses/BSD-3-Clause)
 
+import asyncio
+
 import numpy
 import pytest
 
 import jaeger.utils
+from jaeger.maskbits import ResponseCode
 
 
 @pytest.mark.parametrize(
@@ -74,3 +77,165 @@ def test_parse_identifier(identifier, result):
     assert positioner_id == result[0]
     assert command_id == result[1]
     assert response_flag.value == result[2]
+
+
+def legacy_get_identifier(positioner_id, command_id, uid=0, response_code=0):
+    """String-based implementation of `.get_identifier`, used as reference."""
+
+    identifier = (
+        format(positioner_id, "011b")
+        + format(command_id, "08b")
+        + format(uid, "06b")
+        + format(int(response_code), "04b")
+    )
+
+    assert len(identifier) == 29
+
+    return int(identifier, 2)
+
+
+def legacy_parse_identifier(identifier):
+    """Reference implementation of `.parse_identifier`."""
+
+    def mid(k, m, n):
+        return (k >> m) & ((1 << (n - m)) - 1)
+
+    return (
+        mid(identifier, 18, 29),
+        mid(identifier, 10, 18),
+        mid(identifier, 4, 10),
+        ResponseCode(mid(identifier, 0, 4)),
+    )
+
+
+def test_identifier_codec_equivalence():
+    rng = numpy.random.default_rng(42)
+
+    # Random components plus the edges of each field.
+    components = numpy.column_stack(
+        [
+            rng.integers(0, 2**11, 5000),
+            rng.integers(0, 2**8, 5000),
+            rng.integers(0, 2**6, 5000),
+            rng.integers(0, 2**4, 5000),
+        ]
+    ).tolist()
+    components += [[0, 0, 0, 0], [2**11 - 1, 2**8 - 1, 2**6 - 1, 2**4 - 1]]
+
+    for positioner_id, command_id, uid, response_code in components:
+        identifier = jaeger.utils.get_identifier(
+            positioner_id,
+            command_id,
+            uid=uid,
+            response_code=ResponseCode(response_code),
+        )
+
+        assert identifier == legacy_get_identifier(
+            positioner_id,
+            command_id,
+            uid=uid,
+            response_code=response_code,
+        )
+
+        parsed = jaeger.utils.parse_identifier(identifier)
+        assert parsed == legacy_parse_identifier(identifier)
+        assert parsed == (positioner_id, command_id, uid, response_code)
+        assert isinstance(parsed[3], ResponseCode)
+
+
+@pytest.mark.parametrize("positioner_id, command_id", [(2**11, 1), (1, 2**8)])
+def test_get_identifier_out_of_range(positioner_id, command_id):
+    with pytest.raises(AssertionError):
+        jaeger.utils.get_identifier(positioner_id, command_id)
+
+
+async def test_run_in_executor_reuses_pool():
+    pool = jaeger.utils.get_executor("thread")
+
+    assert await jaeger.utils.run_in_executor(sum, [1, 2, 3]) == 6
+    assert jaeger.utils.get_executor("thread") is pool
+
+    jaeger.utils.shutdown_executors()
+
+    assert jaeger.utils.get_executor("thread") is not pool
+    assert await jaeger.utils.run_in_executor(sum, [1, 2, 3]) == 6
+
+
+def test_get_executor_invalid():
+    with pytest.raises(ValueError):
+        jaeger.utils.get_executor("fibre")
+
+
+class FakeClock:
+    """A clock that only advances when the poller sleeps or a callback runs."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def time(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.now += delay
+        await asyncio.sleep(0)
+
+
+async def run_poller(durations: list[float], delay: float = 1.0):
+    """Runs a poller whose callback takes ``durations`` and returns the call times."""
+
+    clock = FakeClock()
+    call_times = []
+    done = asyncio.Event()
+
+    def callback():
+        if done.is_set():
+            return
+
+        call_times.append(clock.now)
+        clock.now += durations[len(call_times) - 1]
+        if len(call_times) == len(durations):
+            done.set()
+
+    poller = jaeger.utils.Poller(
+        "test",
+        callback,
+        delay=delay,
+        clock=clock.time,
+        sleep=clock.sleep,
+    )
+
+    poller.start()
+    await done.wait()
+    await poller.stop()
+
+    return poller, call_times
+
+
+async def test_poller_no_drift():
+    poller, call_times = await run_poller([0.3] * 5)
+
+    assert call_times == pytest.approx([0.0, 1.0, 2.0, 3.0, 4.0])
+    assert poller.overruns == 0
+
+
+async def test_poller_overrun():
+    poller, call_times = await run_poller([0.1, 2.5, 0.1, 0.1])
+
+    # The second call ends at 3.5 so the ticks at 2 and 3 are skipped.
+    assert call_times == pytest.approx([0.0, 1.0, 4.0, 5.0])
+    assert poller.overruns == 1
+    assert poller.missed_ticks == 2
+
+
+async def test_poller_overrun_warning_rate_limited(mocker):
+    warning = mocker.spy(jaeger.utils.helpers.log, "warning")
+
+    # Each call overruns by one tick and ends three seconds after it started.
+    poller, call_times = await run_poller([2.5] * 30)
+
+    assert poller.overruns == 30
+    assert call_times[-1] == pytest.approx(87.0)
+
+    # The first overrun and the one 60 seconds later are warned.
+    assert warning.call_count == 2
+    assert "19 overrun(s) since the last warning" in warning.call_args.args[0]